@@ -3,869 +3,1296 @@
 Refinement cycle: fixes Unicode rendering, improves layout, adds page numbers,
 proper figure numbering, and better typography.
 """
+import functools
+import hashlib
+import io
+import math
 import os
 import re
+import shutil
+from decimal import Decimal, ROUND_HALF_UP
+from itertools import chain
+import numpy as np
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm, cm
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.colors import HexColor
+from reportlab.lib.colors import Color
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle,
-    PageBreak, KeepTogether, HRFlowable, Frame, PageTemplate
+    CondPageBreak, KeepTogether, HRFlowable, Frame, PageTemplate, Flowable
 )
+from reportlab.platypus.paraparser import ParaParser
+from PIL import Image as PILImage
 from reportlab.lib import colors
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
 BASE = os.path.dirname(__file__)
 FIG_DIR = os.path.join(BASE, 'figures')
 OUT_PDF = os.path.join(BASE, 'xrt_emission_experiment.pdf')
+CACHE_DIR = os.path.join(BASE, '.cache')
 
 W, H = A4  # 595.27, 841.89 pts
+# Section breaks only start a new page when less than this is left in the
+# frame (~717 pt tall), so a section already at the top of a page is not re-flowed
+_NEW_PAGE = 700
+
+# Only the standard Type 1 faces are used; they are never embedded, so
+# there is no TTF to register or subset. Their AFM width tables are loaded
+# once here instead of lazily during the first layout pass
+_FONTS = tuple(map(pdfmetrics.getFont, (
+    'Helvetica', 'Helvetica-Bold', 'Helvetica-Oblique', 'Helvetica-BoldOblique',
+    'Courier',
+)))
+
+# Colour constants, built once and shared by styles, tables and the header
+C_TITLE = Color(*(0x1a / 255,) * 3)  # #1a1a1a
+C_AUTHORS = Color(*(0x44 / 255,) * 3)  # #444444
+C_DATE = Color(*(0x66 / 255,) * 3)  # #666666
+C_CAPTION = Color(*(0x55 / 255,) * 3)  # #555555
+C_H1 = Color(0x1a / 255, 0x36 / 255, 0x5d / 255)  # #1a365d
+C_H2 = Color(0x2a / 255, 0x4a / 255, 0x7f / 255)  # #2a4a7f
+C_H3 = Color(0x3a / 255, 0x5a / 255, 0x8f / 255)  # #3a5a8f
+C_PAGE_NUM = Color(*(0x88 / 255,) * 3)  # #888888
+C_HDR_TEXT = Color(*(0xaa / 255,) * 3)  # #aaaaaa
+C_GRID = Color(*(0xcc / 255,) * 3)  # #cccccc
+C_HDR_RULE = Color(*(0xe0 / 255,) * 3)  # #e0e0e0
+C_TABLE_HDR_BG = Color(0xe8 / 255, 0xed / 255, 0xf3 / 255)  # #e8edf3
+C_CODE_BG = Color(*(0xf5 / 255,) * 3)  # #f5f5f5
+C_ROW_ALT = Color(0xf8 / 255, 0xf9 / 255, 0xfb / 255)  # #f8f9fb
+
+# Prepared figures keyed by (real path, display width): (prepared path, height/width aspect)
+_IMG_CACHE: dict[tuple[str, float], tuple[str, float]] = {}
+_FIG_DPI = 150  # embed resolution for figures at their display width
+_FIG_COLORS = 64  # palette size for embedded figures
+_PNG_CACHE = {}  # real path -> decoded source PIL image
+
+# One directory read instead of a stat() per figure
+try:
+    _FIG_SET = {e.name for e in os.scandir(FIG_DIR) if e.is_file()}
+except FileNotFoundError:
+    _FIG_SET = set()
 
 # ── Styles ──────────────────────────────────────────────────────
 styles = getSampleStyleSheet()
 
-styles.add(ParagraphStyle(
-    'PaperTitle', parent=styles['Title'],
-    fontSize=16, leading=20, alignment=TA_CENTER, spaceAfter=6,
-    textColor=HexColor('#1a1a1a'),
-))
-styles.add(ParagraphStyle(
-    'Authors', parent=styles['Normal'],
-    fontSize=11, alignment=TA_CENTER, spaceAfter=4, textColor=HexColor('#444444'),
-))
-styles.add(ParagraphStyle(
-    'DateLine', parent=styles['Normal'],
-    fontSize=10, alignment=TA_CENTER, spaceAfter=12, textColor=HexColor('#666666'),
-    fontName='Helvetica-Oblique',
-))
-styles.add(ParagraphStyle(
-    'AbstractTitle', parent=styles['Heading2'],
-    fontSize=12, alignment=TA_CENTER, spaceAfter=4,
-))
-styles.add(ParagraphStyle(
-    'AbstractBody', parent=styles['Normal'],
-    fontSize=9.5, leading=13, alignment=TA_JUSTIFY,
-    leftIndent=20, rightIndent=20, spaceAfter=8,
-    fontName='Helvetica-Oblique',
-))
-styles.add(ParagraphStyle(
-    'SectionH1', parent=styles['Heading1'],
-    fontSize=14, leading=18, spaceBefore=16, spaceAfter=6,
-    textColor=HexColor('#1a365d'),
-))
-styles.add(ParagraphStyle(
-    'SectionH2', parent=styles['Heading2'],
-    fontSize=12, leading=15, spaceBefore=12, spaceAfter=4,
-    textColor=HexColor('#2a4a7f'),
-))
-styles.add(ParagraphStyle(
-    'SectionH3', parent=styles['Heading3'],
-    fontSize=10.5, leading=13, spaceBefore=8, spaceAfter=3,
-    textColor=HexColor('#3a5a8f'),
-))
-styles.add(ParagraphStyle(
-    'BodyText2', parent=styles['Normal'],
-    fontSize=10, leading=13.5, alignment=TA_JUSTIFY,
-    spaceAfter=6,
-))
-styles.add(ParagraphStyle(
-    'CodeBlock', parent=styles['Code'],
-    fontSize=8, leading=10, leftIndent=15, spaceAfter=6, spaceBefore=4,
-    backColor=HexColor('#f5f5f5'),
-    borderColor=HexColor('#cccccc'), borderWidth=0.5, borderPadding=4,
-))
-styles.add(ParagraphStyle(
-    'FigCaption', parent=styles['Normal'],
-    fontSize=9, leading=12, alignment=TA_CENTER, spaceAfter=10,
-    textColor=HexColor('#555555'), fontName='Helvetica-Oblique',
-))
-styles.add(ParagraphStyle(
-    'RefStyle', parent=styles['Normal'],
-    fontSize=9, leading=12, spaceAfter=3, leftIndent=20, firstLineIndent=-20,
-))
-styles.add(ParagraphStyle(
-    'Formula', parent=styles['Normal'],
-    fontSize=10, leading=14, alignment=TA_CENTER, spaceAfter=8, spaceBefore=4,
-    fontName='Courier',
-))
-styles.add(ParagraphStyle(
-    'PageNum', parent=styles['Normal'],
-    fontSize=9, alignment=TA_CENTER, textColor=HexColor('#888888'),
-))
-styles.add(ParagraphStyle(
-    'BulletItem', parent=styles['Normal'],
-    fontSize=10, leading=13.5, alignment=TA_JUSTIFY,
-    spaceAfter=3, leftIndent=20, bulletIndent=10,
-))
+
+def _register_styles():
+    """Add the paper's paragraph styles; a no-op if they are already registered."""
+    if 'PaperTitle' in styles.byName:
+        return
+    styles.add(ParagraphStyle(
+        'PaperTitle', parent=styles['Title'],
+        fontSize=16, leading=20, alignment=TA_CENTER, spaceAfter=6,
+        textColor=C_TITLE,
+    ))
+    styles.add(ParagraphStyle(
+        'Authors', parent=styles['Normal'],
+        fontSize=11, alignment=TA_CENTER, spaceAfter=4, textColor=C_AUTHORS,
+    ))
+    styles.add(ParagraphStyle(
+        'DateLine', parent=styles['Normal'],
+        fontSize=10, alignment=TA_CENTER, spaceAfter=12, textColor=C_DATE,
+        fontName='Helvetica-Oblique',
+    ))
+    styles.add(ParagraphStyle(
+        'AbstractTitle', parent=styles['Heading2'],
+        fontSize=12, alignment=TA_CENTER, spaceAfter=4,
+    ))
+    styles.add(ParagraphStyle(
+        'AbstractBody', parent=styles['Normal'],
+        fontSize=9.5, leading=13, alignment=TA_JUSTIFY,
+        leftIndent=20, rightIndent=20, spaceAfter=8,
+        fontName='Helvetica-Oblique',
+    ))
+    styles.add(ParagraphStyle(
+        'SectionH1', parent=styles['Heading1'],
+        fontSize=14, leading=18, spaceBefore=16, spaceAfter=6,
+        textColor=C_H1,
+    ))
+    styles.add(ParagraphStyle(
+        'SectionH2', parent=styles['Heading2'],
+        fontSize=12, leading=15, spaceBefore=12, spaceAfter=4,
+        textColor=C_H2,
+    ))
+    styles.add(ParagraphStyle(
+        'SectionH3', parent=styles['Heading3'],
+        fontSize=10.5, leading=13, spaceBefore=8, spaceAfter=3,
+        textColor=C_H3,
+    ))
+    styles.add(ParagraphStyle(
+        'BodyText2', parent=styles['Normal'],
+        fontSize=10, leading=13.5, alignment=TA_JUSTIFY,
+        spaceAfter=6,
+    ))
+    styles.add(ParagraphStyle(
+        'CodeBlock', parent=styles['Code'],
+        fontSize=8, leading=10, leftIndent=15, spaceAfter=6, spaceBefore=4,
+        backColor=C_CODE_BG,
+        borderColor=C_GRID, borderWidth=0.5, borderPadding=4,
+    ))
+    styles.add(ParagraphStyle(
+        'CodeInline', parent=styles['BodyText2'], fontName='Courier',
+    ))
+    styles.add(ParagraphStyle(
+        'FigCaption', parent=styles['Normal'],
+        fontSize=9, leading=12, alignment=TA_CENTER, spaceAfter=10,
+        textColor=C_CAPTION, fontName='Helvetica-Oblique',
+    ))
+    styles.add(ParagraphStyle(
+        'RefStyle', parent=styles['Normal'],
+        fontSize=9, leading=12, spaceAfter=3, leftIndent=20, firstLineIndent=-20,
+    ))
+    styles.add(ParagraphStyle(
+        'Formula', parent=styles['Normal'],
+        fontSize=10, leading=14, alignment=TA_CENTER, spaceAfter=8, spaceBefore=4,
+        fontName='Courier',
+    ))
+    styles.add(ParagraphStyle(
+        'PageNum', parent=styles['Normal'],
+        fontSize=9, alignment=TA_CENTER, textColor=C_PAGE_NUM,
+    ))
+    styles.add(ParagraphStyle(
+        'BulletItem', parent=styles['Normal'],
+        fontSize=10, leading=13.5, alignment=TA_JUSTIFY,
+        spaceAfter=3, leftIndent=20, bulletIndent=10,
+    ))
+
+
+_register_styles()
 
 
 # ── Helpers ──────────────────────────────────────────────────────
 
-def sup(text):
-    """Wrap text in superscript tags."""
+def code(text):
+    """Wrap text in the inline monospace font tag."""
+    return f'<font face="Courier">{text}</font>'
+
+
+# Inline code spans that recur in the body text, built once at import
+TX_GASPRICE = code('tx.gasprice')
+OP_GASPRICE = code('GASPRICE')
+GAS_PRICE = code('gasPrice')
+CREATE_LIABILITY = code('createLiability')
+XRT_MINER = code('xrt-classic-miner')
+
+# Superscript markup for every exponent/label used in the paper
+SUP = {k: f'<super>{k}</super>'
+       for k in (*'0123456789', '12', '20', '-9', 'xrt', 'eff')}
+
+
+def sup(text, _S=SUP):
+    """Wrap text in superscript tags (fallback for values not in SUP)."""
+    cached = _S.get(text)
+    if cached is not None:
+        return cached
     return f'<super>{text}</super>'
 
 
-def _cell(text, bold=False):
-    """Wrap cell text in a Paragraph so HTML tags like <super> render properly."""
-    style = ParagraphStyle('_cell', parent=styles['Normal'],
-                           fontSize=8.5, leading=11, alignment=TA_CENTER)
-    if bold:
-        text = f'<b>{text}</b>'
-    return Paragraph(text, style)
+@functools.lru_cache
+def smma_fragment(period=1000, calls=20):
+    """Preformatted SMMA figures for a smoothing period and calls per round."""
+    keep = (1 - 1 / period) ** calls
+    half_life = math.log(2) * period / calls
+    return dict(
+        period=period,
+        calls=calls,
+        keep=f'({period - 1}/{period}){sup(str(calls))}',
+        decay_per_round=f'{(1 - keep) * 100:.0f}%',
+        obs_half_life=f'{math.log(2) * period:.0f}',
+        half_life=f'{half_life:.1f}',
+        half_life_rounds=f'{half_life:.0f}',
+    )
+
+
+_CELL_STYLE = ParagraphStyle('_cell', parent=styles['Normal'],
+                             fontSize=8.5, leading=11, alignment=TA_CENTER)
+
+# One style for every table, whatever its shape: built once at import and
+# shared by all make_table calls
+_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), C_TABLE_HDR_BG),
+    ('TEXTCOLOR', (0, 0), (-1, 0), C_H1),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 0.5, C_GRID),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, C_ROW_ALT]),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    # Plain-string body cells: match what _CELL_STYLE gives Paragraph cells
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 8.5),
+    ('LEADING', (0, 1), (-1, -1), 11),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+])
+_CELL_PAD = 12  # LEFTPADDING + RIGHTPADDING
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _strip_tags(text):
+    """Drop inline markup so len() approximates the rendered length."""
+    return _TAG_RE.sub('', text)
+
+
+def _estimate_col_widths(headers, rows):
+    """Deterministic column widths from character counts (avoids Table auto-sizing)."""
+    maxlen = [max(len(_strip_tags(r[i])) for r in (headers, *rows))
+              for i in range(len(headers))]
+    return [min(max(40, n * 5.5), 220) for n in maxlen]
+
+
+@functools.lru_cache(maxsize=None)
+def _cell_text_width(text):
+    """Rendered width of a plain body cell; make_table asks for each cell twice."""
+    return stringWidth(text, 'Helvetica', 8.5)
+
+
+def _is_plain(text, width=None):
+    """True if text has no markup and fits on one line of a width-pt column."""
+    if '<' in text or '&' in text:
+        return False
+    return width is None or _cell_text_width(text) <= width - _CELL_PAD
+
+
+def _cell(text, bold=False, width=None):
+    """Wrap cell text in a Paragraph so HTML tags like <super> render properly.
+
+    Markup-free body cells that fit their column are returned as plain strings,
+    which Table draws directly without running the paragraph parser.
+    """
+    if not bold and _is_plain(text, width):
+        return text
+    return Paragraph(f'<b>{text}</b>' if bold else text, _CELL_STYLE)
+
+
+class _CenteredLine(Flowable):
+    """Single centred line of plain text, drawn without the paragraph engine.
+
+    Spacing matches the 'Formula' paragraph style.
+    """
+
+    def __init__(self, text, font='Courier', size=10, leading=14):
+        super().__init__()
+        self.text, self.font, self.size, self.leading = text, font, size, leading
+        self.spaceBefore, self.spaceAfter = 4, 8
+
+    def wrap(self, aW, aH):
+        self.width, self.height = aW, self.leading
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.setFont(self.font, self.size)
+        self.canv.drawCentredString(self.width / 2, (self.leading - self.size) / 2 + 1, self.text)
 
 
 def make_table(headers, rows, col_widths=None):
-    """Create a styled table. All cells are wrapped in Paragraphs for HTML rendering."""
-    hdr_row = [_cell(h, bold=True) for h in headers]
-    body_rows = [[_cell(c) for c in row] for row in rows]
-    data = [hdr_row] + body_rows
+    """Create a styled table. Cells with markup are wrapped in Paragraphs for HTML rendering.
+
+    headers, rows and col_widths may be tuples; markup-free rows are passed to
+    Table as-is without copying.
+    """
     if col_widths is None:
-        col_widths = [None] * len(headers)
-    t = Table(data, colWidths=col_widths, repeatRows=1)
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), HexColor('#e8edf3')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), HexColor('#1a365d')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('GRID', (0, 0), (-1, -1), 0.5, HexColor('#cccccc')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, HexColor('#f8f9fb')]),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-    ]))
+        col_widths = _estimate_col_widths(headers, rows)
+    hdr_row = [_cell(h, bold=True) for h in headers]
+    if all(_is_plain(c, w) for row in rows for c, w in zip(row, col_widths)):
+        data = [hdr_row, *rows]
+    else:
+        data = [hdr_row, *([_cell(c, width=w) for c, w in zip(row, col_widths)] for row in rows)]
+    t = Table(data, colWidths=list(col_widths), repeatRows=1)
+    t.setStyle(_TABLE_STYLE)
     return t
 
 
-def add_figure(story, filename, caption, width=450):
-    """Add a figure with caption."""
+def _decoded(path):
+    """Decode a source PNG once; the pixel buffer is shared by every display width."""
+    key = os.path.realpath(path)
+    im = _PNG_CACHE.get(key)
+    if im is None:
+        im = _PNG_CACHE[key] = PILImage.open(path)
+        im.load()
+    return im
+
+
+def _prepared_image(path, width_pts, dpi=_FIG_DPI):
+    """Downscale a PNG to its display resolution and quantize it to an 8-bit palette.
+
+    The result is cached in CACHE_DIR under a name keyed by width, dpi and
+    palette size, and regenerated only when the source is newer. The figures
+    are flat-colour charts, so 64 colours are enough.
+    Returns (prepared_png_path, original_width, original_height).
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    out = os.path.join(CACHE_DIR, f'{name}-{int(width_pts)}w-{dpi}dpi-{_FIG_COLORS}c.png')
+    if os.path.exists(out) and os.path.getmtime(out) >= os.path.getmtime(path):
+        with PILImage.open(path) as src:  # header only, for the aspect ratio
+            return out, *src.size
+    im = _decoded(path)
+    iw, ih = im.size
+    target_px = int(width_pts * dpi / 72)
+    if iw > target_px:
+        im = im.resize((target_px, max(1, round(ih * target_px / iw))), PILImage.LANCZOS)
+    im = im.convert('RGB').convert('P', palette=PILImage.ADAPTIVE, colors=_FIG_COLORS)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    im.save(out, 'PNG', optimize=True)
+    return out, iw, ih
+
+
+def _figure_image(path, width):
+    """Return a cached (prepared_path, aspect) pair so each PNG is decoded and resized once."""
+    key = (os.path.realpath(path), width)
+    cached = _IMG_CACHE.get(key)
+    if cached is None:
+        prepared, iw, ih = _prepared_image(path, width)
+        cached = _IMG_CACHE[key] = (prepared, ih / iw)
+    return cached
+
+
+def figure(filename, caption, width=450):
+    """Figure with caption as a single flowable."""
     path = os.path.join(FIG_DIR, filename)
-    if os.path.exists(path):
-        # Calculate proportional height from image dimensions
-        from reportlab.lib.utils import ImageReader
-        img_reader = ImageReader(path)
-        iw, ih = img_reader.getSize()
-        aspect = ih / iw
-        img = Image(path, width=width, height=width * aspect)
-        story.append(KeepTogether([img, Paragraph(caption, styles['FigCaption'])]))
-    else:
-        story.append(Paragraph(f'[Missing figure: {filename}]', styles['FigCaption']))
+    if filename in _FIG_SET:
+        # Proportional height from the source image; Image embeds the small
+        # pre-sized copy rather than the full-resolution original
+        prepared, aspect = _figure_image(path, width)
+        img = Image(prepared, width=width, height=width * aspect)
+        return KeepTogether([img, Paragraph(caption, styles['FigCaption'])])
+    return Paragraph(f'[Missing figure: {filename}]', styles['FigCaption'])
 
 
-def page_footer(canvas, doc):
-    """Add page number footer."""
+_HEADER_FORM = 'xrtHdr'
+
+
+def _define_header_form(canvas):
+    """Record the static running header once as a PDF form XObject."""
+    canvas.beginForm(_HEADER_FORM)
+    canvas.setStrokeColor(C_HDR_RULE)
+    canvas.setLineWidth(0.5)
+    canvas.line(22 * mm, H - 18 * mm, W - 22 * mm, H - 18 * mm)
+    canvas.setFont('Helvetica-Oblique', 8)
+    canvas.setFillColor(C_HDR_TEXT)
+    canvas.drawString(22 * mm, H - 16 * mm,
+                      'Lonshakov, Krupenkin, Claude — Empirical Study of Gas-Proportional Token Emission (2026)')
+    canvas.endForm()
+
+
+# Helvetica 9pt digit advances, so page numbers are centred without a
+# stringWidth lookup per page
+_DIGIT_W = [stringWidth(d, 'Helvetica', 9) for d in '0123456789']
+
+
+def _page_x(n):
+    """Left x of page number n centred on the page."""
+    return W / 2 - sum(_DIGIT_W[int(c)] for c in str(n)) / 2
+
+
+def _draw_page_number(canvas, page):
     canvas.saveState()
     canvas.setFont('Helvetica', 9)
-    canvas.setFillColor(HexColor('#888888'))
-    canvas.drawCentredString(W / 2, 15 * mm, f'{doc.page}')
-    # Header line
-    if doc.page > 1:
-        canvas.setStrokeColor(HexColor('#e0e0e0'))
-        canvas.setLineWidth(0.5)
-        canvas.line(22 * mm, H - 18 * mm, W - 22 * mm, H - 18 * mm)
-        canvas.setFont('Helvetica-Oblique', 8)
-        canvas.setFillColor(HexColor('#aaaaaa'))
-        canvas.drawString(22 * mm, H - 16 * mm,
-                          'Lonshakov, Krupenkin, Claude — Empirical Study of Gas-Proportional Token Emission (2026)')
+    canvas.setFillColor(C_PAGE_NUM)
+    canvas.drawString(_page_x(page), 15 * mm, str(page))
     canvas.restoreState()
 
 
-def build():
-    doc = SimpleDocTemplate(
-        OUT_PDF, pagesize=A4,
-        leftMargin=22 * mm, rightMargin=22 * mm,
-        topMargin=22 * mm, bottomMargin=22 * mm,
+def first_page(canvas, doc):
+    """Title page: define the header form for later pages, draw the page number."""
+    _define_header_form(canvas)
+    _draw_page_number(canvas, doc.page)
+
+
+def page_footer(canvas, doc):
+    """Later pages: stamp the prerecorded header form and draw the page number."""
+    canvas.doForm(_HEADER_FORM)
+    _draw_page_number(canvas, doc.page)
+
+
+# ── Static tables ────────────────────────────────────────────────
+
+_EPOCH_HDR = ('Epoch', 'Target gas', 'Multiplier', 'Emission rate')
+_EPOCH_ROWS = (
+    ('0', f'3.47 x 10{SUP["12"]}', f'(2/3){SUP["0"]} = 1.000', 'Full rate'),
+    ('1', f'3.47 x 10{SUP["12"]}', f'(2/3){SUP["1"]} = 0.667', '66.7%'),
+    ('2', f'3.47 x 10{SUP["12"]}', f'(2/3){SUP["2"]} = 0.444', '44.4%'),
+    ('3', f'3.47 x 10{SUP["12"]}', f'(2/3){SUP["3"]} = 0.296', '29.6%'),
+    ('4', f'3.47 x 10{SUP["12"]}', f'(2/3){SUP["4"]} = 0.198', '19.8%'),
+)
+_EPOCH_COLW = (40, 95, 120, 80)
+
+_SETUP_HDR = ('Parameter', 'Value')
+_SETUP_ROWS = (
+    ('Network', 'Ethereum Mainnet'),
+    ('Account', '0x6EFBA8...C3Ad'),
+    ('Lighthouse', '0x04C672...bbeE (custom, timeout=1 block)'),
+    ('RPC Provider', 'DRPC (free tier)'),
+    ('Starting ETH', '3.544'),
+    ('XRT Staked', '112 wn'),
+    ('Ethereum base fee', '0.19 - 0.29 gwei'),
+    ('ETH/USD (Chainlink)', '~$1,944'),
+)
+_SETUP_COLW = (140, 260)
+
+_PUMP_HDR = ('Metric', 'Value')
+_PUMP_ROWS = (
+    ('SMMA before', '1.03 gwei'),
+    ('SMMA after', '~4.0 gwei'),
+    ('SMMA amplification', 'x3.88'),
+    ('Rounds completed', '4'),
+    ('Contract calls', '448'),
+    ('Gas consumed', '~2.27 ETH'),
+    ('XRT minted (pump)', '~15,519 XRT'),
+    ('XRT sold post-pump', '~16,899 XRT -> 0.763 ETH'),
+)
+_PUMP_COLW = (170, 200)
+
+_MINE_HDR = ('Metric', 'Value')
+_MINE_ROWS = (
+    ('Rounds completed', '69'),
+    ('Liabilities created', '~1,360'),
+    ('Total XRT minted', '24,190 XRT'),
+    ('Average XRT per round', '355.73'),
+    ('XRT in first round', '443.66'),
+    ('XRT in last round', '257.13'),
+    ('Emission decline', '-42.0%'),
+    ('Total gas consumed', '~729 M gas'),
+    ('Errors', '0'),
+)
+_MINE_COLW = (170, 200)
+
+_SELLS_HDR = ('Sell #', 'XRT Sold', 'ETH Received', 'Price (uETH/XRT)', 'Delta')
+# Raw sell-event figures; string cells and totals are derived from these
+_SELLS_XRT = np.array([4801, 2094, 2019, 2331, 2248, 2177, 2116, 2064, 2256, 2146, 2044])
+# ETH as received (6 dp, as generate_figures.SELLS); rounded only in the cells
+_SELLS_ETH = (
+    '0.161558', '0.069128', '0.065870', '0.075817', '0.072325', '0.069183',
+    '0.066450', '0.064211', '0.069402', '0.065208', '0.061474',
+)
+_SELLS_PRICE = np.array([33.65, 33.01, 32.63, 32.52, 32.18, 31.78, 31.40, 31.11, 30.76, 30.39, 30.07])
+
+
+def _eth_cell(eth) -> str:
+    """4-dp ETH cell, rounding half up like the report tables (0.066450 -> 0.0665)."""
+    return str(Decimal(eth).quantize(Decimal('0.0001'), ROUND_HALF_UP))
+
+
+def _sells_rows():
+    n = len(_SELLS_XRT)
+    delta = np.diff(_SELLS_PRICE) / _SELLS_PRICE[:-1] * 100
+    rows = zip(
+        np.char.mod('%d', np.arange(1, n + 1)),
+        (f'{x:,}' for x in _SELLS_XRT.tolist()),
+        map(_eth_cell, _SELLS_ETH),
+        np.char.mod('%.2f', _SELLS_PRICE),
+        ('---', *np.char.mod('%+.1f%%', delta)),
+    )
+    xrt, eth = int(_SELLS_XRT.sum()), sum(map(Decimal, _SELLS_ETH))
+    total = (
+        'Total', f'{xrt:,}', _eth_cell(eth), f'{float(eth) / xrt * 1e6:.2f} (avg)',
+        f'{(_SELLS_PRICE[-1] / _SELLS_PRICE[0] - 1) * 100:+.1f}%',
     )
+    return (*(tuple(map(str, r)) for r in rows), total)
+
+
+_SELLS_ROWS = _sells_rows()
+_SELLS_COLW = (45, 65, 85, 100, 55)
 
+_FINANCE_HDR = ('Item', 'ETH', 'USD')
+_FINANCE_ROWS = (
+    ('Starting balance', '3.544', '$6,892'),
+    ('Gas spent (pump)', '-2.270', '-$4,413'),
+    ('Gas spent (mine)', '-0.840', '-$1,634'),
+    ('XRT sold (total)', '+1.604', '+$3,118'),
+    ('Remaining XRT (675 XRT)', '+0.020', '+$39'),
+    ('Final balance', '3.182', '$6,186'),
+    ('Net result', '-0.342', '-$665'),
+)
+_FINANCE_COLW = (180, 80, 80)
+
+_APPX_A_HDR = ('Operation', 'Gas (observed)', 'Std. dev.')
+_APPX_A_ROWS = (
+    ('createLiability', '789,000', '+/- 5,000'),
+    ('finalizeLiability', '267,000', '+/- 1,000'),
+    ('swapExactTokensForETH', '112,000', '+/- 3,000'),
+    ('Per liability (create + finalize)', '1,058,000', '---'),
+    ('Per round (10 create + 10 finalize)', '10,564,000', '---'),
+)
+_APPX_A_COLW = (200, 100, 80)
+
+_APPX_B_HDR = ('Contract', 'Address')
+_APPX_B_ROWS = (
+    ('Factory', '0x7e384AD1FE06747594a6102EE5b377b273DC1225'),
+    ('XRT (ERC-20)', '0x7dE91B204C1C737bcEe6F000AAA6569Cf7061cb7'),
+    ('Lighthouse (exp.)', '0x04C672af1e54d6C9Bd3f153d590f5681d8EcbbeE'),
+    ('Auction', '0x86da63b3341924c88baa5adbb2b8f930cc02e586'),
+    ('Uniswap V2 Router', '0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D'),
+    ('Chainlink ETH/USD', '0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419'),
+)
+_APPX_B_COLW = (130, 310)
+
+_APPX_C_HDR = ('Time', 'Event', 'Key metric')
+_APPX_C_ROWS = (
+    ('T+0 min', 'Pump launched (batch=56, prio=10 gwei)', 'SMMA = 1.03 gwei'),
+    ('T+15 min', 'Pump complete (4 rounds, budget exhausted)', 'SMMA ~ 4.0 gwei'),
+    ('T+20 min', 'Cleanup: finalize remaining, sell 16,899 XRT', '0.763 ETH received'),
+    ('T+25 min', 'Mine attempt #1 (batch=56, prio=1 gwei)', 'TX timeouts at round 13'),
+    ('T+45 min', 'Mine attempt #2 (batch=56, prio=2 gwei)', 'TX timeout at round 1'),
+    ('T+55 min', 'Mine attempt #3 (batch=20, prio=2 gwei)', 'TX timeout at round 1'),
+    ('T+60 min', 'Mine attempt #4 (batch=10, prio=1 gwei)', 'Stable (0 errors)'),
+    ('T+135 min', '69 rounds complete, mining unprofitable', 'SMMA = 1.41 gwei'),
+    ('T+140 min', 'Experiment terminated', 'Net: -0.342 ETH'),
+)
+_APPX_C_COLW = (65, 215, 130)
+
+_APPX_D_HDR = ('Module', 'Description', 'Lines')
+_APPX_D_ROWS = (
+    ('xrt_miner/miner.py', 'Core mining logic (XRTMiner class)', '~620'),
+    ('xrt_miner/signer.py', 'Demand/offer/result encoding', '~183'),
+    ('xrt_miner/abi.py', 'Contract interfaces and addresses', '~150'),
+    ('xrt_miner/__main__.py', 'CLI entry point (Click)', '~400'),
+)
+_APPX_D_COLW = (130, 200, 50)
+
+
+def _build_key():
+    """Content hash of this script and every figure it can embed."""
+    h = hashlib.blake2b()
+    with open(__file__, 'rb') as f:
+        h.update(f.read())
+    for name in sorted(_FIG_SET):
+        h.update(name.encode())
+        with open(os.path.join(FIG_DIR, name), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+# ── Document sections ───────────────────────────────────────────
+
+H1, H2, H3, BODY, FORMULA, REF = (styles[n] for n in (
+    'SectionH1', 'SectionH2', 'SectionH3', 'BodyText2', 'Formula', 'RefStyle',
+))
+BULLET = styles['BulletItem']
+
+
+@functools.lru_cache
+def _plain_frag(style):
+    """Parser fragment for unmarked text in style, built once per style."""
+    return ParaParser().parse('x', style)[1][0]
+
+
+def S(text, style=BODY, _P=Paragraph):
+    if '<' in text or '&' in text:
+        return _P(text, style)
+    # No markup or entities: hand Paragraph its fragment directly so the
+    # XML parser is skipped; wrapping and justification are unchanged
+    frag = _plain_frag(style).clone(text=text, link=[], us_lines=[])
+    return _P(text, style, frags=[frag])
+
+
+def B(text, _P=Paragraph, _st=BULLET):
+    return _P(text, _st)
+
+
+def _section_title():
+    """Title block: title, authors, date."""
     story = []
-    S = lambda text, style='BodyText2': Paragraph(text, styles[style])
-    sp = lambda h=6: Spacer(1, h)
-    B = lambda text: Paragraph(text, styles['BulletItem'])
-
-    # ── Title page ───────────────────────────────────
-    story.append(sp(30))
-    story.append(S(
-        'Empirical Study of Gas-Proportional Token Emission:<br/>'
-        'Revisiting the Robonomics XRT Mechanism<br/>Eight Years After Deployment',
-        'PaperTitle'
-    ))
-    story.append(sp(8))
-    story.append(S(
-        '<b>Sergey Lonshakov</b>' + sup('1') + ', '
-        '<b>Alexander Krupenkin</b>' + sup('1') + ', '
-        '<b>Claude</b>' + sup('2'),
-        'Authors'
-    ))
-    story.append(S(
-        sup('1') + ' Robonomics Network &mdash; architects &nbsp;&nbsp;|&nbsp;&nbsp; '
-        + sup('2') + ' Anthropic &mdash; AI research assistant',
-        'Authors'
-    ))
-    story.append(S('February 2026', 'DateLine'))
-    story.append(sp(8))
-    story.append(HRFlowable(width='60%', color=HexColor('#cccccc')))
-    story.append(sp(8))
-
-    # ── Abstract ─────────────────────────────────────
-    story.append(S('Abstract', 'AbstractTitle'))
-    story.append(S(
-        'We present an empirical study of the XRT token emission mechanism deployed as part of '
-        'Robonomics Network v5 on Ethereum mainnet. Originally designed in 2018 when Ethereum gas '
-        'prices ranged from 20 to 200 gwei, the mechanism ties token emission to a Smoothed Moving '
-        'Average (SMMA) of observed transaction gas prices &mdash; an innovative approach that creates a '
-        'self-regulating economic feedback loop between network utilization cost and token supply. '
-        'With Ethereum gas prices having decreased by two orders of magnitude to ~0.25 gwei by 2026, '
-        'we conducted a controlled experiment: mining 24,190 XRT tokens through 1,360 liability '
-        'contracts, including a two-phase &ldquo;Pump &amp; Mine&rdquo; strategy to study the SMMA\'s reflexive '
-        'dynamics. Our findings illuminate the elegant design principles behind gas-proportional '
-        'emission, demonstrate the SMMA\'s properties as an endogenous price oracle, and provide '
-        'empirical data on the reflexive dynamics between emission rate, token supply, and market '
-        'microstructure on Uniswap V2. This work contributes to the broader understanding of mechanism '
-        'design in early Ethereum-era smart contract systems and the long-term behavior of on-chain '
-        'economic primitives.',
-        'AbstractBody'
-    ))
-    story.append(sp(4))
-    story.append(S(
-        '<b>Keywords:</b> token emission, mechanism design, Robonomics, XRT, SMMA, '
-        'smart contracts, Ethereum, cyber-physical systems, DeFi',
-        'AbstractBody'
-    ))
-    story.append(HRFlowable(width='60%', color=HexColor('#cccccc')))
-    story.append(sp(12))
-
-    # ── Section 1: Introduction ──────────────────────
-    story.append(S('1. Introduction', 'SectionH1'))
-    story.append(S(
-        'Ethereum, since its conception by Buterin in 2013, has been described as a &ldquo;world '
-        'computer&rdquo; &mdash; a Turing-complete, decentralized execution environment where smart contracts '
-        'serve as programs running on shared global infrastructure. Unlike traditional computing platforms '
-        'where applications can purchase dedicated resources (servers, bandwidth, CPU time), all programs '
-        'on the Ethereum Virtual Machine (EVM) compete for the same finite resource: block gas. This raises '
-        'a fundamental and surprisingly underexplored question: <b>how can a specific program &mdash; a group '
-        'of interrelated smart contracts &mdash; ensure competitive advantage in the shared throughput of '
-        'the network?</b>'
-    ))
-    story.append(S(
-        'In traditional computing, the answer is straightforward: applications acquire dedicated capacity. '
-        'On a shared blockchain, no such option exists natively. Every program pays the same market gas '
-        'price, and no contract system can guarantee priority access to block space. The Robonomics Network, '
-        'conceived by Lonshakov, Krupenkin et al. [1], proposed what may be the only systematic attempt to '
-        'answer this question on Ethereum L1: <b>a native token (XRT) whose emission is directly '
-        'proportional to the gas consumed by the protocol\'s smart contracts</b>. This creates an economic '
-        'feedback loop where the cost of operating the Robonomics program on the world computer is '
-        'internalized into the token supply itself &mdash; providers who spend gas to run the protocol receive '
-        'newly minted XRT in proportion to their contribution. The emission formula embodies the whitepaper\'s '
-        'principle: <i>&ldquo;Emission of 1 Wn = 1 gas utilized by Robonomics&rdquo;</i> [1].'
-    ))
-    story.append(S(
-        'Drawing on Wiener\'s cybernetics [2], Coase\'s theory of the firm [3], and the Robot Operating '
-        'System (ROS) [4], Robonomics proposed a decentralized marketplace where autonomous robots and '
-        'sensors participate in economic transactions through smart contract liabilities. The emission '
-        'mechanism &mdash; an SMMA (Smoothed Moving Average) of observed gas prices modulating token issuance '
-        '&mdash; represents a pioneering attempt at on-chain incentive alignment between protocol usage and '
-        'token supply.'
-    ))
-    story.append(S(
-        'In this paper, we revisit this mechanism eight years after deployment, under conditions '
-        'radically different from those assumed at design time. We approach this study not as a '
-        'critique but as an empirical investigation of a pioneering mechanism design, seeking to '
-        'understand how carefully constructed economic invariants behave when a key environmental '
-        'parameter &mdash; the price of gas on Ethereum &mdash; has changed by approximately 100x.'
-    ))
+    story += [
+        Spacer(1, 30),
+        S(
+            'Empirical Study of Gas-Proportional Token Emission:<br/>'
+            'Revisiting the Robonomics XRT Mechanism<br/>Eight Years After Deployment',
+            styles['PaperTitle']
+        ),
+        Spacer(1, 8),
+        S(
+            f'<b>Sergey Lonshakov</b>{SUP["1"]}, '
+            f'<b>Alexander Krupenkin</b>{SUP["1"]}, '
+            f'<b>Claude</b>{SUP["2"]}',
+            styles['Authors']
+        ),
+        S(
+            f'{SUP["1"]} Robonomics Network &mdash; architects &nbsp;&nbsp;|&nbsp;&nbsp; '
+            f'{SUP["2"]} Anthropic &mdash; AI research assistant',
+            styles['Authors']
+        ),
+        S('February 2026', styles['DateLine']),
+        Spacer(1, 8),
+        HRFlowable(width='60%', color=C_GRID),
+        Spacer(1, 8),
+    ]
+    return story
 
-    story.append(S('1.1. Contributions', 'SectionH2'))
-    for item in [
-        '<b>1.</b> Empirical characterization of the SMMA-based emission mechanism under ultra-low gas conditions (0.2&ndash;10 gwei), with data from 1,360 on-chain liability contracts;',
-        '<b>2.</b> Experimental validation of a two-phase SMMA manipulation strategy (&ldquo;Pump &amp; Mine&rdquo;), demonstrating the reflexive properties of the endogenous gas price oracle;',
-        '<b>3.</b> Quantitative analysis of market microstructure effects when mining-derived tokens are sold on thin Uniswap V2 liquidity;',
-        '<b>4.</b> Open-source tooling for automated Robonomics liability lifecycle management (xrt-classic-miner);',
-        '<b>5.</b> Design analysis of early Ethereum-era mechanism engineering, contributing to the historical record of smart contract architecture.',
-    ]:
-        story.append(B(item))
-
-    story.append(S('1.2. Related Work', 'SectionH2'))
-    story.append(S(
-        'Token emission mechanisms span a wide design space. Bitcoin uses a deterministic halving '
-        'schedule [9]; Ethereum PoS ties issuance to staking participation [7]; Filecoin uses baseline '
-        'minting proportional to storage growth [10]. The Robonomics approach is distinct: emission tied '
-        'to <b>the computational cost of protocol operations as measured by EVM gas</b> &mdash; creating a '
-        'direct feedback loop between emission and utilization that is unique in the literature.'
-    ))
-    story.append(S(
-        'The SMMA mechanism relates to on-chain price oracles. Uniswap V2\'s TWAP oracle [5] shares '
-        'the principle of smoothing over time to resist manipulation. The Robonomics SMMA predates '
-        'widespread TWAP adoption and represents an early example of endogenous oracle design.'
-    ))
 
-    # ── Section 2: Background ────────────────────────
-    story.append(S('2. Background: The Robonomics Economic Architecture', 'SectionH1'))
-
-    story.append(S('2.1. The Vision: An Economy of Machines', 'SectionH2'))
-    story.append(S(
-        'Robonomics proposes that autonomous cyber-physical systems can participate in economic '
-        'transactions as independent agents. In the whitepaper\'s formulation, a CPS is analogous to '
-        'a firm in Coasean economics &mdash; <i>&ldquo;a closely connected network of sensors and actuators '
-        'capable of organized collaboration&rdquo;</i> [1]. The platform distinguishes between '
-        '<b>promisees</b> (demand side), <b>promisors</b> (CPS agents offering services), and '
-        '<b>providers</b> (infrastructure operators relaying transactions). The liability contract &mdash; '
-        'a binding agreement encoded in a smart contract &mdash; serves as the primitive for '
-        'machine-to-machine economic interaction.'
-    ))
+def _section_abstract():
+    """Abstract and keywords."""
+    story = []
+    story += [
+        S('Abstract', styles['AbstractTitle']),
+        S(
+            'We present an empirical study of the XRT token emission mechanism deployed as part of '
+            'Robonomics Network v5 on Ethereum mainnet. Originally designed in 2018 when Ethereum gas '
+            'prices ranged from 20 to 200 gwei, the mechanism ties token emission to a Smoothed Moving '
+            'Average (SMMA) of observed transaction gas prices &mdash; an innovative approach that creates a '
+            'self-regulating economic feedback loop between network utilization cost and token supply. '
+            'With Ethereum gas prices having decreased by two orders of magnitude to ~0.25 gwei by 2026, '
+            'we conducted a controlled experiment: mining 24,190 XRT tokens through 1,360 liability '
+            'contracts, including a two-phase &ldquo;Pump &amp; Mine&rdquo; strategy to study the SMMA\'s reflexive '
+            'dynamics. Our findings illuminate the elegant design principles behind gas-proportional '
+            'emission, demonstrate the SMMA\'s properties as an endogenous price oracle, and provide '
+            'empirical data on the reflexive dynamics between emission rate, token supply, and market '
+            'microstructure on Uniswap V2. This work contributes to the broader understanding of mechanism '
+            'design in early Ethereum-era smart contract systems and the long-term behavior of on-chain '
+            'economic primitives.',
+            styles['AbstractBody']
+        ),
+        Spacer(1, 4),
+        S(
+            '<b>Keywords:</b> token emission, mechanism design, Robonomics, XRT, SMMA, '
+            'smart contracts, Ethereum, cyber-physical systems, DeFi',
+            styles['AbstractBody']
+        ),
+        HRFlowable(width='60%', color=C_GRID),
+        Spacer(1, 12),
+    ]
+    return story
 
-    story.append(S('2.2. The Contracts Factory', 'SectionH2'))
-    story.append(S(
-        'The Factory contract (0x7e384...1225) serves as the central registry, creating lightweight '
-        'liability contracts via DELEGATECALL &mdash; a design pattern that saved 30&ndash;40% gas compared '
-        'to full contract deployment [1]. The Factory verifies deferred signatures from both demand '
-        'and supply sides, deploys a new liability contract for each matched pair, tracks cumulative '
-        'gas consumption via <font face="Courier">totalGasConsumed</font>, and manages the emission '
-        'parameter <font face="Courier">gasPrice</font> (the SMMA).'
-    ))
 
-    story.append(S('2.3. The Emission Formula', 'SectionH2'))
-    story.append(S(
-        'The XRT emission mechanism, implemented in <font face="Courier">Factory.wnFromGas()</font>, '
-        'converts gas consumption into token issuance:',
-    ))
-    story.append(S(
-        '<font face="Courier">wn = gas x gasPrice_SMMA x 10' + sup('9') + ' / finalPrice_auction</font>',
-        'Formula'
-    ))
-    story.append(S(
-        'where <b>wn</b> is emission in Wiener units (1 XRT = 10' + sup('9') + ' wn), '
-        '<b>gas</b> is gas consumed by the transaction, '
-        '<b>gasPrice_SMMA</b> is the Smoothed Moving Average of observed gas prices, and '
-        '<b>finalPrice_auction</b> is the price from the Dutch auction at TGE.'
-    ))
-    story.append(S(
-        'The SMMA updates with each <font face="Courier">createLiability</font> and '
-        '<font face="Courier">finalizeLiability</font> call:',
-    ))
-    story.append(S(
-        '<font face="Courier">gasPrice[n+1] = (gasPrice[n] x 999 + tx.gasprice) / 1000</font>',
-        'Formula'
-    ))
-    story.append(S(
-        'This formula has a half-life of ~693 observations (ln(2) x 1000) and converges '
-        'exponentially toward the prevailing <font face="Courier">tx.gasprice</font>. '
-        'The denomination system &mdash; wiener (1), coase (10' + sup('3') + '), glushkov (10' + sup('6') + '), '
-        'robonomics token (10' + sup('9') + ') &mdash; '
-        'pays homage to Norbert Wiener (cybernetics), Ronald Coase (transaction cost economics), '
-        'and Viktor Glushkov (Soviet cybernetics pioneer).'
-    ))
+def _section_introduction():
+    """Section 1: Introduction."""
+    story = []
+    story += [
+        Paragraph('1. Introduction', H1),
+        S(
+            'Ethereum, since its conception by Buterin in 2013, has been described as a &ldquo;world '
+            'computer&rdquo; &mdash; a Turing-complete, decentralized execution environment where smart contracts '
+            'serve as programs running on shared global infrastructure. Unlike traditional computing platforms '
+            'where applications can purchase dedicated resources (servers, bandwidth, CPU time), all programs '
+            'on the Ethereum Virtual Machine (EVM) compete for the same finite resource: block gas. This raises '
+            'a fundamental and surprisingly underexplored question: <b>how can a specific program &mdash; a group '
+            'of interrelated smart contracts &mdash; ensure competitive advantage in the shared throughput of '
+            'the network?</b>'
+        ),
+        S(
+            'In traditional computing, the answer is straightforward: applications acquire dedicated capacity. '
+            'On a shared blockchain, no such option exists natively. Every program pays the same market gas '
+            'price, and no contract system can guarantee priority access to block space. The Robonomics Network, '
+            'conceived by Lonshakov, Krupenkin et al. [1], proposed what may be the only systematic attempt to '
+            'answer this question on Ethereum L1: <b>a native token (XRT) whose emission is directly '
+            'proportional to the gas consumed by the protocol\'s smart contracts</b>. This creates an economic '
+            'feedback loop where the cost of operating the Robonomics program on the world computer is '
+            'internalized into the token supply itself &mdash; providers who spend gas to run the protocol receive '
+            'newly minted XRT in proportion to their contribution. The emission formula embodies the whitepaper\'s '
+            'principle: <i>&ldquo;Emission of 1 Wn = 1 gas utilized by Robonomics&rdquo;</i> [1].'
+        ),
+        S(
+            'Drawing on Wiener\'s cybernetics [2], Coase\'s theory of the firm [3], and the Robot Operating '
+            'System (ROS) [4], Robonomics proposed a decentralized marketplace where autonomous robots and '
+            'sensors participate in economic transactions through smart contract liabilities. The emission '
+            'mechanism &mdash; an SMMA (Smoothed Moving Average) of observed gas prices modulating token issuance '
+            '&mdash; represents a pioneering attempt at on-chain incentive alignment between protocol usage and '
+            'token supply.'
+        ),
+        S(
+            'In this paper, we revisit this mechanism eight years after deployment, under conditions '
+            'radically different from those assumed at design time. We approach this study not as a '
+            'critique but as an empirical investigation of a pioneering mechanism design, seeking to '
+            'understand how carefully constructed economic invariants behave when a key environmental '
+            'parameter &mdash; the price of gas on Ethereum &mdash; has changed by approximately 100x.'
+        ),
+    ]
 
-    story.append(S('2.4. The Epoch System', 'SectionH2'))
-    story.append(S(
-        'The development period is divided into five epochs, each consuming a target of '
-        '3.47 x 10' + sup('12') + ' gas. The emission multiplier decreases geometrically:'
-    ))
-    story.append(make_table(
-        ['Epoch', 'Target gas', 'Multiplier', 'Emission rate'],
-        [
-            ['0', '3.47 x 10' + sup('12'), '(2/3)' + sup('0') + ' = 1.000', 'Full rate'],
-            ['1', '3.47 x 10' + sup('12'), '(2/3)' + sup('1') + ' = 0.667', '66.7%'],
-            ['2', '3.47 x 10' + sup('12'), '(2/3)' + sup('2') + ' = 0.444', '44.4%'],
-            ['3', '3.47 x 10' + sup('12'), '(2/3)' + sup('3') + ' = 0.296', '29.6%'],
-            ['4', '3.47 x 10' + sup('12'), '(2/3)' + sup('4') + ' = 0.198', '19.8%'],
-        ],
-        col_widths=[40, 95, 120, 80],
-    ))
-    story.append(sp(4))
-    story.append(S(
-        'At the time of our experiment, the system was at 0.17% of epoch 0, with approximately '
-        '163,800 mining rounds remaining before the first multiplier reduction.'
-    ))
+    story += [
+        Paragraph('1.1. Contributions', H2),
+        *(B(item) for item in (
+            '<b>1.</b> Empirical characterization of the SMMA-based emission mechanism under ultra-low gas conditions (0.2&ndash;10 gwei), with data from 1,360 on-chain liability contracts;',
+            '<b>2.</b> Experimental validation of a two-phase SMMA manipulation strategy (&ldquo;Pump &amp; Mine&rdquo;), demonstrating the reflexive properties of the endogenous gas price oracle;',
+            '<b>3.</b> Quantitative analysis of market microstructure effects when mining-derived tokens are sold on thin Uniswap V2 liquidity;',
+            '<b>4.</b> Open-source tooling for automated Robonomics liability lifecycle management (xrt-classic-miner);',
+            '<b>5.</b> Design analysis of early Ethereum-era mechanism engineering, contributing to the historical record of smart contract architecture.',
+        )),
+        Paragraph('1.2. Related Work', H2),
+        S(
+            'Token emission mechanisms span a wide design space. Bitcoin uses a deterministic halving '
+            'schedule [9]; Ethereum PoS ties issuance to staking participation [7]; Filecoin uses baseline '
+            'minting proportional to storage growth [10]. The Robonomics approach is distinct: emission tied '
+            'to <b>the computational cost of protocol operations as measured by EVM gas</b> &mdash; creating a '
+            'direct feedback loop between emission and utilization that is unique in the literature.'
+        ),
+        S(
+            'The SMMA mechanism relates to on-chain price oracles. Uniswap V2\'s TWAP oracle [5] shares '
+            'the principle of smoothing over time to resist manipulation. The Robonomics SMMA predates '
+            'widespread TWAP adoption and represents an early example of endogenous oracle design.'
+        ),
+    ]
+    return story
 
-    story.append(S('2.5. The Lighthouse System', 'SectionH2'))
-    story.append(S(
-        'Lighthouses are autonomous coordination contracts managing provider access through a '
-        'round-robin quota mechanism with XRT staking. Providers stake XRT to participate, take turns '
-        'submitting transactions, and if the active provider fails within the timeout window, the '
-        'next provider claims the marker. This pattern anticipated later proof-of-stake rotation '
-        'mechanisms and solves the decentralized coordination problem without a central scheduler.'
-    ))
-    story.append(S(
-        'The architecture bears a notable resemblance to the 0x Protocol [11], developed in the same '
-        'period (2017&ndash;2018). Both systems share a fundamentally similar pattern: off-chain message '
-        'matching with on-chain settlement. In 0x, makers and takers exchange signed ask/bid orders '
-        'off-chain, with final settlement executed on Ethereum by &ldquo;relayers.&rdquo; In Robonomics, '
-        'promisees and promisors exchange signed demand/offer messages off-chain, with providers '
-        '(lighthouse operators) submitting the matched pair to Ethereum for on-chain liability creation. '
-        'Both protocols recognized that Ethereum\'s limited throughput and high latency made it unsuitable '
-        'for real-time order matching, and both arrived at similar architectural solutions.'
-    ))
-    story.append(S(
-        'In this sense, the lighthouse system can be understood as one of the <b>earliest attempts to '
-        'build what would later be called a Layer 2 solution</b> &mdash; not in the rollup sense, but as a '
-        'complementary off-chain communication layer that extends Ethereum with capabilities the base chain '
-        'cannot efficiently provide (real-time demand/offer matching, provider coordination), while settling '
-        'only the economically meaningful outcomes (liability creation and finalization) on L1. This design '
-        'philosophy &mdash; off-chain where possible, on-chain where necessary &mdash; anticipated the broader '
-        'industry\'s evolution toward L2-centric architectures by several years.'
-    ))
 
-    story.append(S('2.6. Design Rationale', 'SectionH2'))
-    story.append(S(
-        'The whitepaper articulates the core principle: <i>&ldquo;The cost of 1 Wn must cover the '
-        'costs of the provider for the disposal of 1 unit of gas in Ethereum&rdquo;</i> [1]. '
-        'The gas-proportional emission creates a self-regulating system: when gas is expensive, '
-        'providers spend more ETH per liability and emission compensates proportionally; when gas is '
-        'cheap, emission decreases proportionally. The SMMA smooths short-term volatility, preventing '
-        'flash-manipulation. This was calibrated for 2018 conditions, where 2 gwei was identified as '
-        '&ldquo;the minimum competitive price in the Ethereum network&rdquo; [1].'
-    ))
+def _section_background():
+    """Section 2: Background."""
+    story = []
+    smma = smma_fragment()
+    story += [
+        Paragraph('2. Background: The Robonomics Economic Architecture', H1),
+        Paragraph('2.1. The Vision: An Economy of Machines', H2),
+        S(
+            'Robonomics proposes that autonomous cyber-physical systems can participate in economic '
+            'transactions as independent agents. In the whitepaper\'s formulation, a CPS is analogous to '
+            'a firm in Coasean economics &mdash; <i>&ldquo;a closely connected network of sensors and actuators '
+            'capable of organized collaboration&rdquo;</i> [1]. The platform distinguishes between '
+            '<b>promisees</b> (demand side), <b>promisors</b> (CPS agents offering services), and '
+            '<b>providers</b> (infrastructure operators relaying transactions). The liability contract &mdash; '
+            'a binding agreement encoded in a smart contract &mdash; serves as the primitive for '
+            'machine-to-machine economic interaction.'
+        ),
+    ]
+
+    story += [
+        Paragraph('2.2. The Contracts Factory', H2),
+        S(
+            'The Factory contract (0x7e384...1225) serves as the central registry, creating lightweight '
+            'liability contracts via DELEGATECALL &mdash; a design pattern that saved 30&ndash;40% gas compared '
+            'to full contract deployment [1]. The Factory verifies deferred signatures from both demand '
+            'and supply sides, deploys a new liability contract for each matched pair, tracks cumulative '
+            'gas consumption via <font face="Courier">totalGasConsumed</font>, and manages the emission '
+            f'parameter {GAS_PRICE} (the SMMA).'
+        ),
+    ]
+
+    story += [
+        Paragraph('2.3. The Emission Formula', H2),
+        S(
+            'The XRT emission mechanism, implemented in <font face="Courier">Factory.wnFromGas()</font>, '
+            'converts gas consumption into token issuance:',
+        ),
+        S(
+            f'wn = gas x gasPrice_SMMA x 10{SUP["9"]} / finalPrice_auction',
+            FORMULA
+        ),
+        S(
+            f'where <b>wn</b> is emission in Wiener units (1 XRT = 10{SUP["9"]} wn), '
+            '<b>gas</b> is gas consumed by the transaction, '
+            '<b>gasPrice_SMMA</b> is the Smoothed Moving Average of observed gas prices, and '
+            '<b>finalPrice_auction</b> is the price from the Dutch auction at TGE.'
+        ),
+        S(
+            f'The SMMA updates with each {CREATE_LIABILITY} and '
+            '<font face="Courier">finalizeLiability</font> call:',
+        ),
+        _CenteredLine(f'gasPrice[n+1] = (gasPrice[n] x {smma["period"] - 1} + tx.gasprice) / {smma["period"]}'),
+        S(
+            f'This formula has a half-life of ~{smma["obs_half_life"]} observations (ln(2) x {smma["period"]}) and converges '
+            f'exponentially toward the prevailing {TX_GASPRICE}. '
+            f'The denomination system &mdash; wiener (1), coase (10{SUP["3"]}), glushkov (10{SUP["6"]}), '
+            f'robonomics token (10{SUP["9"]}) &mdash; '
+            'pays homage to Norbert Wiener (cybernetics), Ronald Coase (transaction cost economics), '
+            'and Viktor Glushkov (Soviet cybernetics pioneer).'
+        ),
+    ]
+
+    story += [
+        Paragraph('2.4. The Epoch System', H2),
+        S(
+            'The development period is divided into five epochs, each consuming a target of '
+            f'3.47 x 10{SUP["12"]} gas. The emission multiplier decreases geometrically:'
+        ),
+        make_table(_EPOCH_HDR, _EPOCH_ROWS, col_widths=_EPOCH_COLW),
+        Spacer(1, 4),
+        S(
+            'At the time of our experiment, the system was at 0.17% of epoch 0, with approximately '
+            '163,800 mining rounds remaining before the first multiplier reduction.'
+        ),
+    ]
+
+    story += [
+        Paragraph('2.5. The Lighthouse System', H2),
+        S(
+            'Lighthouses are autonomous coordination contracts managing provider access through a '
+            'round-robin quota mechanism with XRT staking. Providers stake XRT to participate, take turns '
+            'submitting transactions, and if the active provider fails within the timeout window, the '
+            'next provider claims the marker. This pattern anticipated later proof-of-stake rotation '
+            'mechanisms and solves the decentralized coordination problem without a central scheduler.'
+        ),
+        S(
+            'The architecture bears a notable resemblance to the 0x Protocol [11], developed in the same '
+            'period (2017&ndash;2018). Both systems share a fundamentally similar pattern: off-chain message '
+            'matching with on-chain settlement. In 0x, makers and takers exchange signed ask/bid orders '
+            'off-chain, with final settlement executed on Ethereum by &ldquo;relayers.&rdquo; In Robonomics, '
+            'promisees and promisors exchange signed demand/offer messages off-chain, with providers '
+            '(lighthouse operators) submitting the matched pair to Ethereum for on-chain liability creation. '
+            'Both protocols recognized that Ethereum\'s limited throughput and high latency made it unsuitable '
+            'for real-time order matching, and both arrived at similar architectural solutions.'
+        ),
+        S(
+            'In this sense, the lighthouse system can be understood as one of the <b>earliest attempts to '
+            'build what would later be called a Layer 2 solution</b> &mdash; not in the rollup sense, but as a '
+            'complementary off-chain communication layer that extends Ethereum with capabilities the base chain '
+            'cannot efficiently provide (real-time demand/offer matching, provider coordination), while settling '
+            'only the economically meaningful outcomes (liability creation and finalization) on L1. This design '
+            'philosophy &mdash; off-chain where possible, on-chain where necessary &mdash; anticipated the broader '
+            'industry\'s evolution toward L2-centric architectures by several years.'
+        ),
+    ]
+
+    story += [
+        Paragraph('2.6. Design Rationale', H2),
+        S(
+            'The whitepaper articulates the core principle: <i>&ldquo;The cost of 1 Wn must cover the '
+            'costs of the provider for the disposal of 1 unit of gas in Ethereum&rdquo;</i> [1]. '
+            'The gas-proportional emission creates a self-regulating system: when gas is expensive, '
+            'providers spend more ETH per liability and emission compensates proportionally; when gas is '
+            'cheap, emission decreases proportionally. The SMMA smooths short-term volatility, preventing '
+            'flash-manipulation. This was calibrated for 2018 conditions, where 2 gwei was identified as '
+            '&ldquo;the minimum competitive price in the Ethereum network&rdquo; [1].'
+        ),
+    ]
+    return story
 
-    # ── Section 3: Methodology ───────────────────────
-    story.append(PageBreak())
-    story.append(S('3. Experimental Methodology', 'SectionH1'))
 
-    story.append(S('3.1. Tool Architecture', 'SectionH2'))
-    add_figure(story, 'fig5_architecture.png',
+def _section_methodology():
+    """Section 3: Experimental methodology."""
+    story = []
+    story += [
+        CondPageBreak(_NEW_PAGE),
+        Paragraph('3. Experimental Methodology', H1),
+        Paragraph('3.1. Tool Architecture', H2),
+        figure('fig5_architecture.png',
                '<b>Figure 1.</b> XRT emission pipeline architecture &mdash; from liability creation through '
-               'finalization and XRT minting to Uniswap V2 sell.', width=440)
-
-    story.append(S(
-        'We developed <font face="Courier">xrt-classic-miner</font>, a Python CLI tool implementing '
-        'the complete Robonomics liability lifecycle. The tool consists of four modules: '
-        '<font face="Courier">abi.py</font> (minimal contract ABIs and mainnet addresses), '
-        '<font face="Courier">signer.py</font> (EIP-191 demand/offer/result message construction), '
-        '<font face="Courier">miner.py</font> (XRTMiner class with lighthouse management and mining loops), '
-        'and <font face="Courier">__main__.py</font> (CLI interface via Click).'
-    ))
-    story.append(S(
-        '<b>Signature construction</b> follows the Robonomics v1.0 format. Demand and offer messages '
-        'are 268 bytes each, encoded with <font face="Courier">abi.encodePacked</font> and signed via '
-        'EIP-191. A critical implementation detail: demand messages place '
-        '<font face="Courier">lighthouse</font> before <font face="Courier">validator</font> in the '
-        'field order, while offer messages invert this &mdash; a deliberate asymmetry that prevents '
-        'cross-role replay attacks.'
-    ))
+               'finalization and XRT minting to Uniswap V2 sell.', width=440),
+        S(
+            f'We developed {XRT_MINER}, a Python CLI tool implementing '
+            'the complete Robonomics liability lifecycle. The tool consists of four modules: '
+            '<font face="Courier">abi.py</font> (minimal contract ABIs and mainnet addresses), '
+            '<font face="Courier">signer.py</font> (EIP-191 demand/offer/result message construction), '
+            '<font face="Courier">miner.py</font> (XRTMiner class with lighthouse management and mining loops), '
+            'and <font face="Courier">__main__.py</font> (CLI interface via Click).'
+        ),
+        S(
+            '<b>Signature construction</b> follows the Robonomics v1.0 format. Demand and offer messages '
+            'are 268 bytes each, encoded with <font face="Courier">abi.encodePacked</font> and signed via '
+            'EIP-191. A critical implementation detail: demand messages place '
+            '<font face="Courier">lighthouse</font> before <font face="Courier">validator</font> in the '
+            'field order, while offer messages invert this &mdash; a deliberate asymmetry that prevents '
+            'cross-role replay attacks.'
+        ),
+    ]
 
-    story.append(S('3.2. Pipeline Mining Mode', 'SectionH2'))
-    story.append(S(
-        '<b>Pipeline mode</b> achieves maximum throughput by overlapping finalization of round N with '
-        'creation of round N+1. This requires 2x quota on the lighthouse but doubles throughput '
-        'compared to sequential operation. The sequence is:',
-    ))
-    story.append(S(
-        '<font face="Courier" size="8">'
-        'Round 1: --- CREATE(batch) ----------&gt; &nbsp;[bootstrap]<br/>'
-        'Round 2: FINALIZE(batch) + CREATE(batch) &gt; [pipeline, 2N quota]<br/>'
-        'Round 3: FINALIZE(batch) + CREATE(batch) &gt; [pipeline]<br/>'
-        '...</font>',
-        'CodeBlock'
-    ))
-    story.append(S(
-        'Transactions are pre-signed with sequential nonces and broadcast rapidly, allowing '
-        'multiple operations in the same Ethereum block.'
-    ))
+    story += [
+        Paragraph('3.2. Pipeline Mining Mode', H2),
+        S(
+            '<b>Pipeline mode</b> achieves maximum throughput by overlapping finalization of round N with '
+            'creation of round N+1. This requires 2x quota on the lighthouse but doubles throughput '
+            'compared to sequential operation. The sequence is:',
+        ),
+        S(
+            'Round 1: --- CREATE(batch) ----------&gt; &nbsp;[bootstrap]<br/>'
+            'Round 2: FINALIZE(batch) + CREATE(batch) &gt; [pipeline, 2N quota]<br/>'
+            'Round 3: FINALIZE(batch) + CREATE(batch) &gt; [pipeline]<br/>'
+            '...',
+            styles['CodeBlock']
+        ),
+        S(
+            'Transactions are pre-signed with sequential nonces and broadcast rapidly, allowing '
+            'multiple operations in the same Ethereum block.'
+        ),
+    ]
 
-    story.append(S('3.3. Experimental Setup', 'SectionH2'))
-    story.append(make_table(
-        ['Parameter', 'Value'],
-        [
-            ['Network', 'Ethereum Mainnet'],
-            ['Account', '0x6EFBA8...C3Ad'],
-            ['Lighthouse', '0x04C672...bbeE (custom, timeout=1 block)'],
-            ['RPC Provider', 'DRPC (free tier)'],
-            ['Starting ETH', '3.544'],
-            ['XRT Staked', '112 wn'],
-            ['Ethereum base fee', '0.19 - 0.29 gwei'],
-            ['ETH/USD (Chainlink)', '~$1,944'],
-        ],
-        col_widths=[140, 260],
-    ))
+    story += [
+        Paragraph('3.3. Experimental Setup', H2),
+        make_table(_SETUP_HDR, _SETUP_ROWS, col_widths=_SETUP_COLW),
+    ]
 
-    story.append(S('3.4. EIP-1559 and tx.gasprice Semantics', 'SectionH2'))
-    story.append(S(
-        'A critical subtlety concerns the interaction between the post-EIP-1559 fee model and the '
-        'Robonomics SMMA, designed for the pre-EIP-1559 gas price model. After EIP-1559 [6], the fee '
-        'structure changed to baseFee + priorityFee, but the EVM opcode '
-        '<font face="Courier">GASPRICE</font> (Solidity\'s '
-        '<font face="Courier">tx.gasprice</font>) returns the <b>effective gas price</b> = '
-        'baseFee + priorityFee. Thus the SMMA continues to receive a meaningful signal, but the '
-        'semantics have shifted: the base fee is now set by network demand, not sender choice.'
-    ))
-    story.append(S(
-        'With 2026 base fees of 0.19&ndash;0.29 gwei, the priority fee dominates: during our pump phase '
-        '(10 gwei priority), it constituted 98% of the effective gas price. This means the miner has '
-        'almost <b>complete control</b> over the SMMA signal &mdash; a situation that differs fundamentally '
-        'from 2018, where <font face="Courier">tx.gasprice</font> needed to be competitive with other '
-        'users\' bids.'
-    ))
+    story += [
+        Paragraph('3.4. EIP-1559 and tx.gasprice Semantics', H2),
+        S(
+            'A critical subtlety concerns the interaction between the post-EIP-1559 fee model and the '
+            'Robonomics SMMA, designed for the pre-EIP-1559 gas price model. After EIP-1559 [6], the fee '
+            'structure changed to baseFee + priorityFee, but the EVM opcode '
+            f'{OP_GASPRICE} (Solidity\'s '
+            f'{TX_GASPRICE}) returns the <b>effective gas price</b> = '
+            'baseFee + priorityFee. Thus the SMMA continues to receive a meaningful signal, but the '
+            'semantics have shifted: the base fee is now set by network demand, not sender choice.'
+        ),
+        S(
+            'With 2026 base fees of 0.19&ndash;0.29 gwei, the priority fee dominates: during our pump phase '
+            '(10 gwei priority), it constituted 98% of the effective gas price. This means the miner has '
+            'almost <b>complete control</b> over the SMMA signal &mdash; a situation that differs fundamentally '
+            f'from 2018, where {TX_GASPRICE} needed to be competitive with other '
+            'users\' bids.'
+        ),
+    ]
 
-    story.append(S('3.5. Experimental Protocol', 'SectionH2'))
-    story.append(S(
-        '<b>Phase 1 &mdash; Pump (SMMA Inflation):</b> Priority fee 10 gwei (effective tx.gasprice '
-        '~10.2 gwei), batch size 56 liabilities per round, budget 2.0 ETH. Objective: rapidly '
-        'increase SMMA from ~1.03 gwei to maximum achievable level.'
-    ))
-    story.append(S(
-        '<b>Phase 2 &mdash; Mine (Elevated Emission Harvesting):</b> Priority fee 1 gwei (effective '
-        'tx.gasprice ~1.2 gwei), batch size 10 (reduced from 56 due to RPC reliability constraints), '
-        'budget 1.0 ETH, max cost $0.50 per liability, auto-sell every 2,000 XRT via Uniswap V2 '
-        '(5% slippage tolerance).'
-    ))
+    story += [
+        Paragraph('3.5. Experimental Protocol', H2),
+        S(
+            '<b>Phase 1 &mdash; Pump (SMMA Inflation):</b> Priority fee 10 gwei (effective tx.gasprice '
+            '~10.2 gwei), batch size 56 liabilities per round, budget 2.0 ETH. Objective: rapidly '
+            'increase SMMA from ~1.03 gwei to maximum achievable level.'
+        ),
+        S(
+            '<b>Phase 2 &mdash; Mine (Elevated Emission Harvesting):</b> Priority fee 1 gwei (effective '
+            'tx.gasprice ~1.2 gwei), batch size 10 (reduced from 56 due to RPC reliability constraints), '
+            'budget 1.0 ETH, max cost $0.50 per liability, auto-sell every 2,000 XRT via Uniswap V2 '
+            '(5% slippage tolerance).'
+        ),
+    ]
 
-    story.append(S('3.6. Parameter Tuning and Iteration', 'SectionH2'))
-    story.append(S(
-        'The final parameters emerged from iterative trial and adjustment, revealing practical '
-        'constraints that theoretical analysis alone would not predict.'
-    ))
-    story.append(S(
-        '<b>Batch size:</b> Initially batch=56 (maximum for lighthouse quota). Worked for pump phase, '
-        'but at lower priority fees caused cascading RPC timeouts &mdash; the free-tier DRPC provider '
-        'could not track 112 pending transactions simultaneously. Progressive reduction: '
-        '56 &rarr; 20 &rarr; 10, with batch=10 proving stable across 69 rounds with zero errors.'
-    ))
-    story.append(S(
-        '<b>Priority fee:</b> 10 gwei (pump: max SMMA growth, ~0.57 ETH/round); 2 gwei (attempted: '
-        'RPC timeouts at round 1); 1 gwei (final: stable, ~0.012 ETH/round); 0.2 gwei (theoretical: '
-        '+73 rounds, but SMMA eventually decays below breakeven).'
-    ))
-    story.append(S(
-        '<b>Lighthouse timeout:</b> <font face="Courier">timeoutInBlocks=1</font> &mdash; the minimum '
-        'possible. Eliminated waiting periods between rounds. In production Robonomics, longer timeouts '
-        'provide fairness among multiple providers; for our single-provider experiment, minimum timeout '
-        'maximized throughput.'
-    ))
+    story += [
+        Paragraph('3.6. Parameter Tuning and Iteration', H2),
+        S(
+            'The final parameters emerged from iterative trial and adjustment, revealing practical '
+            'constraints that theoretical analysis alone would not predict.'
+        ),
+        S(
+            '<b>Batch size:</b> Initially batch=56 (maximum for lighthouse quota). Worked for pump phase, '
+            'but at lower priority fees caused cascading RPC timeouts &mdash; the free-tier DRPC provider '
+            'could not track 112 pending transactions simultaneously. Progressive reduction: '
+            '56 &rarr; 20 &rarr; 10, with batch=10 proving stable across 69 rounds with zero errors.'
+        ),
+        S(
+            '<b>Priority fee:</b> 10 gwei (pump: max SMMA growth, ~0.57 ETH/round); 2 gwei (attempted: '
+            'RPC timeouts at round 1); 1 gwei (final: stable, ~0.012 ETH/round); 0.2 gwei (theoretical: '
+            '+73 rounds, but SMMA eventually decays below breakeven).'
+        ),
+        S(
+            '<b>Lighthouse timeout:</b> <font face="Courier">timeoutInBlocks=1</font> &mdash; the minimum '
+            'possible. Eliminated waiting periods between rounds. In production Robonomics, longer timeouts '
+            'provide fairness among multiple providers; for our single-provider experiment, minimum timeout '
+            'maximized throughput.'
+        ),
+    ]
+    return story
 
-    # ── Section 4: Results ───────────────────────────
-    story.append(PageBreak())
-    story.append(S('4. Results', 'SectionH1'))
 
-    story.append(S('4.1. Phase 1: SMMA Pump', 'SectionH2'))
-    story.append(S(
-        'The pump phase completed 4 rounds of 56 liabilities each (448 contract calls), consuming '
-        '2.27 ETH in gas:'
-    ))
-    story.append(make_table(
-        ['Metric', 'Value'],
-        [
-            ['SMMA before', '1.03 gwei'],
-            ['SMMA after', '~4.0 gwei'],
-            ['SMMA amplification', 'x3.88'],
-            ['Rounds completed', '4'],
-            ['Contract calls', '448'],
-            ['Gas consumed', '~2.27 ETH'],
-            ['XRT minted (pump)', '~15,519 XRT'],
-            ['XRT sold post-pump', '~16,899 XRT -> 0.763 ETH'],
-        ],
-        col_widths=[170, 200],
-    ))
-    story.append(sp(4))
-    story.append(S(
-        'The SMMA responded as predicted by the convergence formula. Each call moved SMMA by '
-        '(10.2 &minus; SMMA) / 1000. The exponential approach to the target value is visible in Figure 2.'
-    ))
-    add_figure(story, 'fig1_smma_dynamics.png',
+def _section_results():
+    """Section 4: Results."""
+    story = []
+    smma = smma_fragment()
+    story += [
+        CondPageBreak(_NEW_PAGE),
+        Paragraph('4. Results', H1),
+    ]
+
+    story += [
+        Paragraph('4.1. Phase 1: SMMA Pump', H2),
+        S(
+            'The pump phase completed 4 rounds of 56 liabilities each (448 contract calls), consuming '
+            '2.27 ETH in gas:'
+        ),
+        make_table(_PUMP_HDR, _PUMP_ROWS, col_widths=_PUMP_COLW),
+        Spacer(1, 4),
+        S(
+            'The SMMA responded as predicted by the convergence formula. Each call moved SMMA by '
+            f'(10.2 &minus; SMMA) / {smma["period"]}. The exponential approach to the target value is visible in Figure 2.'
+        ),
+        figure('fig1_smma_dynamics.png',
                '<b>Figure 2.</b> SMMA trajectory during the experiment. '
                'Pump phase (red) raised SMMA from 1.03 to ~4.0 gwei via 448 calls at 10.2 gwei. '
-               'Mine phase (green) shows exponential decay toward the 1.2 gwei effective gas price.')
-
-    story.append(S('4.2. Phase 2: Mine', 'SectionH2'))
-    story.append(S(
-        'After transitioning to 1 gwei priority fee, the mine phase ran 69 rounds with zero errors:'
-    ))
-    story.append(make_table(
-        ['Metric', 'Value'],
-        [
-            ['Rounds completed', '69'],
-            ['Liabilities created', '~1,360'],
-            ['Total XRT minted', '24,190 XRT'],
-            ['Average XRT per round', '355.73'],
-            ['XRT in first round', '443.66'],
-            ['XRT in last round', '257.13'],
-            ['Emission decline', '-42.0%'],
-            ['Total gas consumed', '~729 M gas'],
-            ['Errors', '0'],
-        ],
-        col_widths=[170, 200],
-    ))
+               'Mine phase (green) shows exponential decay toward the 1.2 gwei effective gas price.'),
+    ]
 
-    add_figure(story, 'fig2_xrt_per_round.png',
+    story += [
+        Paragraph('4.2. Phase 2: Mine', H2),
+        S(
+            'After transitioning to 1 gwei priority fee, the mine phase ran 69 rounds with zero errors:'
+        ),
+        make_table(_MINE_HDR, _MINE_ROWS, col_widths=_MINE_COLW),
+        figure('fig2_xrt_per_round.png',
                '<b>Figure 3.</b> XRT emission per round (mine phase). Bars show per-round minting; '
-               'red line shows cumulative total. Vertical dotted lines mark auto-sell events.')
-
-    story.append(S('4.3. SMMA Decay Dynamics', 'SectionH2'))
-    story.append(S(
-        'The SMMA decayed from ~1.94 gwei (at mine start, after transition period losses) toward '
-        'the effective gas price of ~1.2 gwei. With 20 calls per round (10 create + 10 finalize), '
-        'the SMMA decreased approximately 2% per round:'
-    ))
-    story.append(S(
-        '<font face="Courier">SMMA[n+1] = SMMA[n] x (999/1000)' + sup('20') + ' + 1.2 x (1 - (999/1000)' + sup('20') + ')</font>',
-        'Formula'
-    ))
-    story.append(S(
-        'The empirical half-life was approximately 35 rounds, consistent with the theoretical '
-        'prediction of ln(2) x 1000 / 20 = 34.7 rounds for a period-1000 SMMA with 20 updates '
-        'per round.'
-    ))
+               'red line shows cumulative total. Vertical dotted lines mark auto-sell events.'),
+    ]
 
-    add_figure(story, 'fig4_smma_convergence.png',
+    story += [
+        Paragraph('4.3. SMMA Decay Dynamics', H2),
+        S(
+            'The SMMA decayed from ~1.94 gwei (at mine start, after transition period losses) toward '
+            f'the effective gas price of ~1.2 gwei. With {smma["calls"]} calls per round (10 create + 10 finalize), '
+            f'the SMMA decreased approximately {smma["decay_per_round"]} per round:'
+        ),
+        S(
+            f'SMMA[n+1] = SMMA[n] x {smma["keep"]} + 1.2 x (1 - {smma["keep"]})',
+            FORMULA
+        ),
+        S(
+            f'The empirical half-life was approximately {smma["half_life_rounds"]} rounds, consistent with the theoretical '
+            f'prediction of ln(2) x {smma["period"]} / {smma["calls"]} = {smma["half_life"]} rounds '
+            f'for a period-{smma["period"]} SMMA with {smma["calls"]} updates '
+            'per round.'
+        ),
+        figure('fig4_smma_convergence.png',
                '<b>Figure 4.</b> SMMA convergence at different priority fees, starting from 1.94 gwei. '
                'Higher priority &rarr; SMMA rises; lower priority &rarr; SMMA decays. Horizontal dashed line '
-               'marks the breakeven SMMA at 0.674 gwei.', width=440)
-
-    story.append(PageBreak())
-    story.append(S('4.4. Market Impact on Uniswap V2', 'SectionH2'))
-    story.append(S(
-        'Eleven automated sell events over ~75 minutes revealed consistent price degradation:'
-    ))
-    story.append(make_table(
-        ['Sell #', 'XRT Sold', 'ETH Received', 'Price (uETH/XRT)', 'Delta'],
-        [
-            ['1', '4,801', '0.1616', '33.65', '---'],
-            ['2', '2,094', '0.0691', '33.01', '-1.9%'],
-            ['3', '2,019', '0.0659', '32.63', '-1.2%'],
-            ['4', '2,331', '0.0758', '32.52', '-0.3%'],
-            ['5', '2,248', '0.0723', '32.18', '-1.0%'],
-            ['6', '2,177', '0.0692', '31.78', '-1.2%'],
-            ['7', '2,116', '0.0665', '31.40', '-1.2%'],
-            ['8', '2,064', '0.0642', '31.11', '-0.9%'],
-            ['9', '2,256', '0.0694', '30.76', '-1.1%'],
-            ['10', '2,146', '0.0652', '30.39', '-1.2%'],
-            ['11', '2,044', '0.0615', '30.07', '-1.1%'],
-            ['Total', '26,296', '0.8406', '31.97 (avg)', '-10.6%'],
-        ],
-        col_widths=[45, 65, 85, 100, 55],
-    ))
+               'marks the breakeven SMMA at 0.674 gwei.', width=440),
+    ]
 
-    add_figure(story, 'fig3_price_decay.png',
+    story += [
+        CondPageBreak(_NEW_PAGE),
+        Paragraph('4.4. Market Impact on Uniswap V2', H2),
+        S(
+            'Eleven automated sell events over ~75 minutes revealed consistent price degradation:'
+        ),
+        make_table(_SELLS_HDR, _SELLS_ROWS, col_widths=_SELLS_COLW),
+        figure('fig3_price_decay.png',
                '<b>Figure 5.</b> XRT price impact from 11 sequential sells on Uniswap V2. '
                'Blue bars: volume sold; red line: realized price per XRT. '
-               'Total decline: 10.6% over ~75 minutes.')
+               'Total decline: 10.6% over ~75 minutes.'),
+        S(
+            'The approximately linear price decay (~1% per sell event) is consistent with the constant-product '
+            'AMM model of Uniswap V2 [5], where each trade shifts the reserve ratio. With thin liquidity '
+            '(~25 ETH in the pool), even modest sell volumes create measurable impact.'
+        ),
+    ]
 
-    story.append(S(
-        'The approximately linear price decay (~1% per sell event) is consistent with the constant-product '
-        'AMM model of Uniswap V2 [5], where each trade shifts the reserve ratio. With thin liquidity '
-        '(~25 ETH in the pool), even modest sell volumes create measurable impact.'
-    ))
+    story += [
+        Paragraph('4.5. Financial Summary', H2),
+        make_table(_FINANCE_HDR, _FINANCE_ROWS, col_widths=_FINANCE_COLW),
+    ]
+    return story
 
-    story.append(S('4.5. Financial Summary', 'SectionH2'))
-    story.append(make_table(
-        ['Item', 'ETH', 'USD'],
-        [
-            ['Starting balance', '3.544', '$6,892'],
-            ['Gas spent (pump)', '-2.270', '-$4,413'],
-            ['Gas spent (mine)', '-0.840', '-$1,634'],
-            ['XRT sold (total)', '+1.604', '+$3,118'],
-            ['Remaining XRT (675 XRT)', '+0.020', '+$39'],
-            ['Final balance', '3.182', '$6,186'],
-            ['Net result', '-0.342', '-$665'],
-        ],
-        col_widths=[180, 80, 80],
-    ))
 
-    # ── Section 5: Analysis ──────────────────────────
-    story.append(PageBreak())
-    story.append(S('5. Analysis and Discussion', 'SectionH1'))
-
-    story.append(S('5.1. The SMMA as an Endogenous Price Oracle', 'SectionH2'))
-    story.append(S(
-        'The central insight from this experiment is that the <font face="Courier">gasPrice</font> '
-        'SMMA in the Factory contract functions as an <b>endogenous price oracle</b> &mdash; a mechanism '
-        'that derives its signal entirely from the behavior of system participants rather than from an '
-        'external data feed. This design choice reflects a principled decision by the Robonomics '
-        'architects: rather than introducing oracle risk (the dependency on an external, potentially '
-        'manipulable data source), the emission mechanism directly observes the cost that providers '
-        'actually pay to operate the system.'
-    ))
-    story.append(S(
-        'The elegance of this approach is that it creates a <b>truthful mechanism</b> under the original '
-        'design assumptions. When gas costs are a meaningful expense for providers (as they were at '
-        '20&ndash;200 gwei in 2018), <font face="Courier">tx.gasprice</font> is a credible signal of '
-        'the marginal cost of network operation. The emission formula then ensures that providers are '
-        'compensated proportionally to their actual costs. Our experiment demonstrates that this mechanism '
-        'continues to function correctly in a mathematical sense &mdash; the SMMA converges as predicted, '
-        'emission responds proportionally &mdash; even under conditions vastly different from the design era.'
-    ))
+def _section_analysis():
+    """Section 5: Analysis and discussion."""
+    story = []
+    smma = smma_fragment()
+    story += [
+        CondPageBreak(_NEW_PAGE),
+        Paragraph('5. Analysis and Discussion', H1),
+    ]
 
-    story.append(S('5.2. The Reflexive Feedback Loop', 'SectionH2'))
-    add_figure(story, 'fig6_feedback_loop.png',
+    story += [
+        Paragraph('5.1. The SMMA as an Endogenous Price Oracle', H2),
+        S(
+            f'The central insight from this experiment is that the {GAS_PRICE} '
+            'SMMA in the Factory contract functions as an <b>endogenous price oracle</b> &mdash; a mechanism '
+            'that derives its signal entirely from the behavior of system participants rather than from an '
+            'external data feed. This design choice reflects a principled decision by the Robonomics '
+            'architects: rather than introducing oracle risk (the dependency on an external, potentially '
+            'manipulable data source), the emission mechanism directly observes the cost that providers '
+            'actually pay to operate the system.'
+        ),
+        S(
+            'The elegance of this approach is that it creates a <b>truthful mechanism</b> under the original '
+            'design assumptions. When gas costs are a meaningful expense for providers (as they were at '
+            f'20&ndash;200 gwei in 2018), {TX_GASPRICE} is a credible signal of '
+            'the marginal cost of network operation. The emission formula then ensures that providers are '
+            'compensated proportionally to their actual costs. Our experiment demonstrates that this mechanism '
+            'continues to function correctly in a mathematical sense &mdash; the SMMA converges as predicted, '
+            'emission responds proportionally &mdash; even under conditions vastly different from the design era.'
+        ),
+        Paragraph('5.2. The Reflexive Feedback Loop', H2),
+        figure('fig6_feedback_loop.png',
                '<b>Figure 6.</b> The reflexive incentive cycle in XRT emission. Miners\' gas price choices '
                'update the SMMA, which determines emission, which affects profitability, which informs '
-               'future gas price choices.', width=320)
-    story.append(S(
-        'The emission mechanism exhibits a fascinating reflexive property. The cycle operates as follows: '
-        '(1) the miner chooses <font face="Courier">tx.gasprice</font> via priority fee; '
-        '(2) each transaction updates the SMMA toward the chosen gas price; '
-        '(3) the SMMA determines emission rate: higher SMMA means more XRT per gas unit; '
-        '(4) minted XRT can be sold on secondary markets for ETH; '
-        '(5) revenue from sales determines whether the operation is profitable; '
-        '(6) profitability assessment informs the miner\'s choice of gas price for the next round.'
-    ))
-    story.append(S(
-        'This creates a <b>natural equilibrium</b>: miners will bid gas prices up only to the point '
-        'where the additional emission revenue covers the additional gas cost. Under the 2018 gas '
-        'regime, this equilibrium naturally tracked market gas prices. Under 2026 conditions, the '
-        'equilibrium point is much lower, but the feedback mechanism still operates.'
-    ))
+               'future gas price choices.', width=320),
+        S(
+            'The emission mechanism exhibits a fascinating reflexive property. The cycle operates as follows: '
+            f'(1) the miner chooses {TX_GASPRICE} via priority fee; '
+            '(2) each transaction updates the SMMA toward the chosen gas price; '
+            '(3) the SMMA determines emission rate: higher SMMA means more XRT per gas unit; '
+            '(4) minted XRT can be sold on secondary markets for ETH; '
+            '(5) revenue from sales determines whether the operation is profitable; '
+            '(6) profitability assessment informs the miner\'s choice of gas price for the next round.'
+        ),
+        S(
+            'This creates a <b>natural equilibrium</b>: miners will bid gas prices up only to the point '
+            'where the additional emission revenue covers the additional gas cost. Under the 2018 gas '
+            'regime, this equilibrium naturally tracked market gas prices. Under 2026 conditions, the '
+            'equilibrium point is much lower, but the feedback mechanism still operates.'
+        ),
+    ]
 
-    story.append(S('5.2.1. Formal Equilibrium Model', 'SectionH3'))
-    story.append(S(
-        'We can formalize the equilibrium condition. Let <i>p</i> denote the priority fee, <i>b</i> '
-        'the base fee, and P' + sup('xrt') + ' the market price of XRT in ETH. At steady state, the '
-        'SMMA converges to the effective gas price g' + sup('eff') + ' = b + p. The revenue per round '
-        '(10 liabilities, 20 contract calls) is:'
-    ))
-    story.append(S(
-        '<font face="Courier">R(p) = 10 x G_lib x g_eff x 10' + sup('9') + ' / F_auction x P_xrt / 10' + sup('9') + '</font>',
-        'Formula'
-    ))
-    story.append(S(
-        'The cost per round is simply the gas spent: '
-        '<font face="Courier">C(p) = 20 x G_lib x g_eff x 10' + sup('-9') + '</font> ETH. '
-        'The equilibrium priority fee p* satisfies R(p*) = C(p*). Figure 8 illustrates this equilibrium.'
-    ))
-    add_figure(story, 'fig8_economic_model.png',
+    story += [
+        Paragraph('5.2.1. Formal Equilibrium Model', H3),
+        S(
+            'We can formalize the equilibrium condition. Let <i>p</i> denote the priority fee, <i>b</i> '
+            f'the base fee, and P{SUP["xrt"]} the market price of XRT in ETH. At steady state, the '
+            f'SMMA converges to the effective gas price g{SUP["eff"]} = b + p. The revenue per round '
+            '(10 liabilities, 20 contract calls) is:'
+        ),
+        S(
+            f'R(p) = 10 x G_lib x g_eff x 10{SUP["9"]} / F_auction x P_xrt / 10{SUP["9"]}',
+            FORMULA
+        ),
+        S(
+            'The cost per round is simply the gas spent: '
+            f'<font face="Courier">C(p) = 20 x G_lib x g_eff x 10{SUP["-9"]}</font> ETH. '
+            'The equilibrium priority fee p* satisfies R(p*) = C(p*). Figure 8 illustrates this equilibrium.'
+        ),
+        figure('fig8_economic_model.png',
                '<b>Figure 8.</b> Economic equilibrium: emission revenue vs gas cost as a function of priority fee. '
                'The green zone marks where mining is profitable; the red zone marks losses. '
-               'The crossover point defines the break-even priority fee at steady state.', width=440)
-    story.append(S(
-        'The key insight is that the equilibrium is <b>self-limiting</b>: increasing the priority fee '
-        'raises both revenue (via higher SMMA &rarr; more XRT) and cost (via higher gas expenditure). '
-        'At our observed XRT price of ~32 uETH, the model predicts that the &ldquo;Pump &amp; Mine&rdquo; '
-        'strategy is only profitable in the transient regime where SMMA exceeds the steady-state value '
-        '&mdash; precisely what we observed empirically.'
-    ))
-
-    story.append(S('5.3. Properties of the Period-1000 SMMA', 'SectionH2'))
-    story.append(S(
-        '<b>Convergence rate.</b> The SMMA half-life is ln(2) x P / N = 693 / 20 ~ 35 rounds, '
-        'where P = 1000 is the smoothing period and N = 20 is calls per round. We observed a decline '
-        'from 1.94 to ~1.41 gwei over 69 rounds, consistent with ~50% convergence toward the target (1.2 gwei).'
-    ))
-    story.append(S(
-        '<b>Manipulation cost.</b> Increasing SMMA from 1.03 to 4.0 gwei required 448 calls at '
-        '10.2 gwei effective price, costing 2.27 ETH. The cost scales linearly with the desired '
-        'shift magnitude and the gas consumed per call.'
-    ))
-    story.append(S(
-        '<b>Resistance to single-block manipulation.</b> The SMMA can shift at most '
-        '(target &minus; SMMA) / 1000 per call. This provides strong protection against flash-loan-style '
-        'attacks &mdash; a property that many DeFi protocols adopted only after costly exploits revealed '
-        'the dangers of instantaneous price manipulation.'
-    ))
+               'The crossover point defines the break-even priority fee at steady state.', width=440),
+        S(
+            'The key insight is that the equilibrium is <b>self-limiting</b>: increasing the priority fee '
+            'raises both revenue (via higher SMMA &rarr; more XRT) and cost (via higher gas expenditure). '
+            'At our observed XRT price of ~32 uETH, the model predicts that the &ldquo;Pump &amp; Mine&rdquo; '
+            'strategy is only profitable in the transient regime where SMMA exceeds the steady-state value '
+            '&mdash; precisely what we observed empirically.'
+        ),
+    ]
 
-    story.append(S('5.4. The Changing Gas Landscape', 'SectionH2'))
-    add_figure(story, 'fig7_gas_landscape.png',
+    story += [
+        Paragraph(f'5.3. Properties of the Period-{smma["period"]} SMMA', H2),
+        S(
+            f'<b>Convergence rate.</b> The SMMA half-life is ln(2) x P / N = {smma["obs_half_life"]} / {smma["calls"]} '
+            f'~ {smma["half_life_rounds"]} rounds, '
+            f'where P = {smma["period"]} is the smoothing period and N = {smma["calls"]} is calls per round. We observed a decline '
+            'from 1.94 to ~1.41 gwei over 69 rounds, consistent with ~50% convergence toward the target (1.2 gwei).'
+        ),
+        S(
+            '<b>Manipulation cost.</b> Increasing SMMA from 1.03 to 4.0 gwei required 448 calls at '
+            '10.2 gwei effective price, costing 2.27 ETH. The cost scales linearly with the desired '
+            'shift magnitude and the gas consumed per call.'
+        ),
+        S(
+            '<b>Resistance to single-block manipulation.</b> The SMMA can shift at most '
+            f'(target &minus; SMMA) / {smma["period"]} per call. This provides strong protection against flash-loan-style '
+            'attacks &mdash; a property that many DeFi protocols adopted only after costly exploits revealed '
+            'the dangers of instantaneous price manipulation.'
+        ),
+        Paragraph('5.4. The Changing Gas Landscape', H2),
+        figure('fig7_gas_landscape.png',
                '<b>Figure 7.</b> (a) Ethereum gas price evolution 2018&ndash;2026. (b) Cost per liability as a '
                'function of gas price. The 100x decrease from design era to experiment era fundamentally '
-               'altered the economic equilibrium.', width=460)
-
-    story.append(S(
-        'The most significant contextual factor is the ~100x decrease in Ethereum gas prices between '
-        'the design era (2018) and our experiment (2026). This transformation was driven by multiple '
-        'Ethereum protocol upgrades (EIP-1559 [6], The Merge [7], EIP-4844/Dencun [8]) and the migration '
-        'of activity to L2 rollups. At 2018 gas prices of 20 gwei, each liability cost ~$42 to create, '
-        'making empty liability mining economically infeasible. At 2026 prices of 0.25 gwei, the cost '
-        'dropped to $0.53 &mdash; a reduction of ~80x.'
-    ))
+               'altered the economic equilibrium.', width=460),
+        S(
+            'The most significant contextual factor is the ~100x decrease in Ethereum gas prices between '
+            'the design era (2018) and our experiment (2026). This transformation was driven by multiple '
+            'Ethereum protocol upgrades (EIP-1559 [6], The Merge [7], EIP-4844/Dencun [8]) and the migration '
+            'of activity to L2 rollups. At 2018 gas prices of 20 gwei, each liability cost ~$42 to create, '
+            'making empty liability mining economically infeasible. At 2026 prices of 0.25 gwei, the cost '
+            'dropped to $0.53 &mdash; a reduction of ~80x.'
+        ),
+    ]
 
-    story.append(S('5.5. Design Lessons', 'SectionH2'))
-    story.append(S(
-        '<b>Lesson 1: Environmental assumptions are the most fragile invariant.</b> The Robonomics '
-        'architects correctly identified gas cost as the fundamental unit of account. The emission '
-        'formula faithfully tracks this metric. What changed was the external environment &mdash; gas prices '
-        'decreased 100x &mdash; not any internal property of the mechanism.'
-    ))
-    story.append(S(
-        '<b>Lesson 2: Endogenous oracles have bounded domains of applicability.</b> The SMMA works '
-        'excellently when <font face="Courier">tx.gasprice</font> reflects genuine market conditions. '
-        'The exponential smoothing prevents single-block manipulation &mdash; a property many later '
-        'protocols failed to incorporate. However, like all oracle designs, it has a domain of '
-        'applicability bounded by the assumptions about participant behavior.'
-    ))
-    story.append(S(
-        '<b>Lesson 3: Immutable contracts are time capsules of their design era.</b> The Robonomics '
-        'v5 contracts &mdash; still correctly minting tokens, managing lighthouses, processing liabilities '
-        'in 2026 &mdash; are a testament to the quality of the implementation. That the economic equilibrium '
-        'has shifted illustrates the fundamental challenge of encoding economic policy in immutable code.'
-    ))
+    story += [
+        Paragraph('5.5. Design Lessons', H2),
+        S(
+            '<b>Lesson 1: Environmental assumptions are the most fragile invariant.</b> The Robonomics '
+            'architects correctly identified gas cost as the fundamental unit of account. The emission '
+            'formula faithfully tracks this metric. What changed was the external environment &mdash; gas prices '
+            'decreased 100x &mdash; not any internal property of the mechanism.'
+        ),
+        S(
+            '<b>Lesson 2: Endogenous oracles have bounded domains of applicability.</b> The SMMA works '
+            f'excellently when {TX_GASPRICE} reflects genuine market conditions. '
+            'The exponential smoothing prevents single-block manipulation &mdash; a property many later '
+            'protocols failed to incorporate. However, like all oracle designs, it has a domain of '
+            'applicability bounded by the assumptions about participant behavior.'
+        ),
+        S(
+            '<b>Lesson 3: Immutable contracts are time capsules of their design era.</b> The Robonomics '
+            'v5 contracts &mdash; still correctly minting tokens, managing lighthouses, processing liabilities '
+            'in 2026 &mdash; are a testament to the quality of the implementation. That the economic equilibrium '
+            'has shifted illustrates the fundamental challenge of encoding economic policy in immutable code.'
+        ),
+    ]
+    return story
 
-    # ── Section 6: Art of Early Ethereum Design ──────
-    story.append(S('6. The Art of Early Ethereum Mechanism Design', 'SectionH1'))
-    story.append(S(
-        'The Robonomics whitepaper was published on May 12, 2018, during a period of extraordinary '
-        'creativity in smart contract architecture. The authors &mdash; Lonshakov and Krupenkin as lead '
-        'architects, along with Radchenko, Kapitonov, Khassanov, and Starostin &mdash; drew on a remarkable '
-        'intellectual synthesis: Wiener\'s '
-        'cybernetics, Coase\'s economics, ROS robotics, and Ethereum\'s programmable state machine. '
-        'Several design decisions deserve recognition as pioneering contributions:'
-    ))
 
-    story.append(S('6.1. The Lightweight Contract Pattern', 'SectionH2'))
-    story.append(S(
-        'The Factory uses <font face="Courier">DELEGATECALL</font> to create liability contracts that '
-        'share implementation code but maintain separate state. This pattern saved 30&ndash;40% gas per '
-        'contract creation and predated the widespread adoption of minimal proxy contracts (EIP-1167, 2018). '
-        'The Robonomics team was at the frontier of gas optimization.'
-    ))
+def _section_early_design():
+    """Section 6: The art of early Ethereum mechanism design."""
+    story = []
+    story += [
+        Paragraph('6. The Art of Early Ethereum Mechanism Design', H1),
+        S(
+            'The Robonomics whitepaper was published on May 12, 2018, during a period of extraordinary '
+            'creativity in smart contract architecture. The authors &mdash; Lonshakov and Krupenkin as lead '
+            'architects, along with Radchenko, Kapitonov, Khassanov, and Starostin &mdash; drew on a remarkable '
+            'intellectual synthesis: Wiener\'s '
+            'cybernetics, Coase\'s economics, ROS robotics, and Ethereum\'s programmable state machine. '
+            'Several design decisions deserve recognition as pioneering contributions:'
+        ),
+    ]
 
-    story.append(S('6.2. Deferred Signature Architecture', 'SectionH2'))
-    story.append(S(
-        'Rather than requiring both parties to submit on-chain transactions, Robonomics uses deferred '
-        'signatures &mdash; off-chain signed messages that a provider submits on behalf of both parties. '
-        'This meta-transaction pattern anticipated EIP-2612 (permit) and EIP-4337 (account abstraction) '
-        'by several years. The implementation uses <font face="Courier">ecrecover</font> to verify '
-        'demand and offer signatures, ensuring that the transaction sender cannot forge parties\' identities.'
-    ))
+    story += [
+        Paragraph('6.1. The Lightweight Contract Pattern', H2),
+        S(
+            'The Factory uses <font face="Courier">DELEGATECALL</font> to create liability contracts that '
+            'share implementation code but maintain separate state. This pattern saved 30&ndash;40% gas per '
+            'contract creation and predated the widespread adoption of minimal proxy contracts (EIP-1167, 2018). '
+            'The Robonomics team was at the frontier of gas optimization.'
+        ),
+    ]
 
-    story.append(S('6.3. Gas-as-Unit-of-Account', 'SectionH2'))
-    story.append(S(
-        'The whitepaper\'s principle <i>&ldquo;Emission of 1 Wn = 1 gas utilized by Robonomics&rdquo;</i> '
-        'is a conceptual breakthrough. It recognizes that in the EVM, gas is the fundamental measure of '
-        'computational work &mdash; and therefore the natural unit of account for a protocol that monetizes '
-        'computational work by robots. The emission formula directly embodies this principle, creating a '
-        'token whose supply growth is algorithmically linked to EVM resource utilization.'
-    ))
+    story += [
+        Paragraph('6.2. Deferred Signature Architecture', H2),
+        S(
+            'Rather than requiring both parties to submit on-chain transactions, Robonomics uses deferred '
+            'signatures &mdash; off-chain signed messages that a provider submits on behalf of both parties. '
+            'This meta-transaction pattern anticipated EIP-2612 (permit) and EIP-4337 (account abstraction) '
+            'by several years. The implementation uses <font face="Courier">ecrecover</font> to verify '
+            'demand and offer signatures, ensuring that the transaction sender cannot forge parties\' identities.'
+        ),
+    ]
 
-    story.append(S('6.4. The Denomination System', 'SectionH2'))
-    story.append(S(
-        'The XRT denomination system &mdash; wiener (1), coase (10' + sup('3') + '), glushkov (10' + sup('6') +
-        '), robonomics token (10' + sup('9') + ') &mdash; encodes the interdisciplinary philosophy of the '
-        'project, paying homage to the intellectual lineage: Norbert Wiener (cybernetics), Ronald Coase '
-        '(transaction cost economics), and Viktor Glushkov (Soviet cybernetics pioneer).'
-    ))
+    story += [
+        Paragraph('6.3. Gas-as-Unit-of-Account', H2),
+        S(
+            'The whitepaper\'s principle <i>&ldquo;Emission of 1 Wn = 1 gas utilized by Robonomics&rdquo;</i> '
+            'is a conceptual breakthrough. It recognizes that in the EVM, gas is the fundamental measure of '
+            'computational work &mdash; and therefore the natural unit of account for a protocol that monetizes '
+            'computational work by robots. The emission formula directly embodies this principle, creating a '
+            'token whose supply growth is algorithmically linked to EVM resource utilization.'
+        ),
+    ]
+
+    story += [
+        Paragraph('6.4. The Denomination System', H2),
+        S(
+            f'The XRT denomination system &mdash; wiener (1), coase (10{SUP["3"]}), glushkov (10{SUP["6"]}'
+            f'), robonomics token (10{SUP["9"]}) &mdash; encodes the interdisciplinary philosophy of the '
+            'project, paying homage to the intellectual lineage: Norbert Wiener (cybernetics), Ronald Coase '
+            '(transaction cost economics), and Viktor Glushkov (Soviet cybernetics pioneer).'
+        ),
+    ]
+    return story
 
-    # ── Section 7: Conclusion ────────────────────────
-    story.append(S('7. Conclusion', 'SectionH1'))
-    story.append(S(
-        'We have presented an empirical study of the Robonomics XRT emission mechanism, conducting '
-        'a controlled experiment on Ethereum mainnet that generated 24,190 XRT tokens through 1,360 '
-        'liability contracts. The experiment demonstrates that the SMMA-based emission formula '
-        'continues to function as mathematically specified eight years after deployment, while the '
-        'economic equilibrium has shifted due to the ~100x decrease in Ethereum gas prices.'
-    ))
-    story.append(S(
-        'The &ldquo;Pump &amp; Mine&rdquo; strategy &mdash; artificially inflating the SMMA through '
-        'high-priority transactions, then mining at lower cost &mdash; proved technically successful but '
-        'economically constrained by secondary market dynamics. The thin liquidity of the XRT/ETH pool '
-        'on Uniswap V2 imposed a natural limit on extraction, with each sell event degrading the price '
-        'by approximately 1%.'
-    ))
-    story.append(S(
-        'Our key finding is that the Robonomics emission mechanism represents a sophisticated piece of '
-        'early Ethereum mechanism design that correctly implements its stated economic principles. '
-        '<b>A mechanism that correctly tracks its specified parameters is well-designed, even when '
-        'external conditions shift its equilibrium point.</b>'
-    ))
-    story.append(S(
-        'The Robonomics architecture &mdash; with its Factory pattern, lighthouse coordination, deferred '
-        'signatures, and gas-proportional emission &mdash; stands as a monument to the creativity and '
-        'ambition of early Ethereum builders. Studying these systems years later provides invaluable '
-        'insights into the art and science of encoding economic behavior in immutable code.'
-    ))
 
-    # ── References ───────────────────────────────────
-    story.append(sp(12))
-    story.append(HRFlowable(width='100%', color=HexColor('#cccccc')))
-    story.append(S('References', 'SectionH1'))
-    refs = [
+def _section_conclusion():
+    """Section 7: Conclusion."""
+    story = []
+    story += [
+        Paragraph('7. Conclusion', H1),
+        S(
+            'We have presented an empirical study of the Robonomics XRT emission mechanism, conducting '
+            'a controlled experiment on Ethereum mainnet that generated 24,190 XRT tokens through 1,360 '
+            'liability contracts. The experiment demonstrates that the SMMA-based emission formula '
+            'continues to function as mathematically specified eight years after deployment, while the '
+            'economic equilibrium has shifted due to the ~100x decrease in Ethereum gas prices.'
+        ),
+        S(
+            'The &ldquo;Pump &amp; Mine&rdquo; strategy &mdash; artificially inflating the SMMA through '
+            'high-priority transactions, then mining at lower cost &mdash; proved technically successful but '
+            'economically constrained by secondary market dynamics. The thin liquidity of the XRT/ETH pool '
+            'on Uniswap V2 imposed a natural limit on extraction, with each sell event degrading the price '
+            'by approximately 1%.'
+        ),
+        S(
+            'Our key finding is that the Robonomics emission mechanism represents a sophisticated piece of '
+            'early Ethereum mechanism design that correctly implements its stated economic principles. '
+            '<b>A mechanism that correctly tracks its specified parameters is well-designed, even when '
+            'external conditions shift its equilibrium point.</b>'
+        ),
+        S(
+            'The Robonomics architecture &mdash; with its Factory pattern, lighthouse coordination, deferred '
+            'signatures, and gas-proportional emission &mdash; stands as a monument to the creativity and '
+            'ambition of early Ethereum builders. Studying these systems years later provides invaluable '
+            'insights into the art and science of encoding economic behavior in immutable code.'
+        ),
+    ]
+    return story
+
+
+def _section_references():
+    """References."""
+    story = []
+    story += [
+        Spacer(1, 12),
+        HRFlowable(width='100%', color=C_GRID),
+        Paragraph('References', H1),
+    ]
+    refs = (
         '[1] S. Lonshakov, A. Krupenkin, E. Radchenko, A. Kapitonov, A. Khassanov, A. Starostin, '
         '&ldquo;Robonomics: platform for integration of cyber physical systems into human economy,&rdquo; May 2018.',
         '[2] N. Wiener, <i>Cybernetics: or Control and Communication in the Animal and the Machine</i>, MIT Press, 1948.',
@@ -878,78 +1305,94 @@ def build():
         '[9] S. Nakamoto, &ldquo;Bitcoin: A Peer-to-Peer Electronic Cash System,&rdquo; 2008.',
         '[10] Protocol Labs, &ldquo;Filecoin: A Decentralized Storage Network,&rdquo; 2017.',
         '[11] W. Warren, A. Bandeali, &ldquo;0x: An open protocol for decentralized exchange on the Ethereum blockchain,&rdquo; 2017.',
+    )
+    story.extend(Paragraph(r, REF) for r in refs)
+    return story
+
+
+def _section_appendices():
+    """Appendices A-D."""
+    story = []
+    story += [
+        Spacer(1, 16),
+        HRFlowable(width='100%', color=C_GRID),
+        Paragraph('Appendix A. Observed Gas Parameters', H1),
+        make_table(_APPX_A_HDR, _APPX_A_ROWS, col_widths=_APPX_A_COLW),
     ]
-    for r in refs:
-        story.append(S(r, 'RefStyle'))
-
-    # ── Appendices ───────────────────────────────────
-    story.append(sp(16))
-    story.append(HRFlowable(width='100%', color=HexColor('#cccccc')))
-    story.append(S('Appendix A. Observed Gas Parameters', 'SectionH1'))
-    story.append(make_table(
-        ['Operation', 'Gas (observed)', 'Std. dev.'],
-        [
-            ['createLiability', '789,000', '+/- 5,000'],
-            ['finalizeLiability', '267,000', '+/- 1,000'],
-            ['swapExactTokensForETH', '112,000', '+/- 3,000'],
-            ['Per liability (create + finalize)', '1,058,000', '---'],
-            ['Per round (10 create + 10 finalize)', '10,564,000', '---'],
-        ],
-        col_widths=[200, 100, 80],
-    ))
 
-    story.append(sp(12))
-    story.append(S('Appendix B. Smart Contract Addresses', 'SectionH1'))
-    story.append(make_table(
-        ['Contract', 'Address'],
-        [
-            ['Factory', '0x7e384AD1FE06747594a6102EE5b377b273DC1225'],
-            ['XRT (ERC-20)', '0x7dE91B204C1C737bcEe6F000AAA6569Cf7061cb7'],
-            ['Lighthouse (exp.)', '0x04C672af1e54d6C9Bd3f153d590f5681d8EcbbeE'],
-            ['Auction', '0x86da63b3341924c88baa5adbb2b8f930cc02e586'],
-            ['Uniswap V2 Router', '0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D'],
-            ['Chainlink ETH/USD', '0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419'],
-        ],
-        col_widths=[130, 310],
-    ))
+    story += [
+        Spacer(1, 12),
+        Paragraph('Appendix B. Smart Contract Addresses', H1),
+        make_table(_APPX_B_HDR, _APPX_B_ROWS, col_widths=_APPX_B_COLW),
+    ]
 
-    story.append(sp(12))
-    story.append(S('Appendix C. Experiment Timeline', 'SectionH1'))
-    story.append(make_table(
-        ['Time', 'Event', 'Key metric'],
-        [
-            ['T+0 min', 'Pump launched (batch=56, prio=10 gwei)', 'SMMA = 1.03 gwei'],
-            ['T+15 min', 'Pump complete (4 rounds, budget exhausted)', 'SMMA ~ 4.0 gwei'],
-            ['T+20 min', 'Cleanup: finalize remaining, sell 16,899 XRT', '0.763 ETH received'],
-            ['T+25 min', 'Mine attempt #1 (batch=56, prio=1 gwei)', 'TX timeouts at round 13'],
-            ['T+45 min', 'Mine attempt #2 (batch=56, prio=2 gwei)', 'TX timeout at round 1'],
-            ['T+55 min', 'Mine attempt #3 (batch=20, prio=2 gwei)', 'TX timeout at round 1'],
-            ['T+60 min', 'Mine attempt #4 (batch=10, prio=1 gwei)', 'Stable (0 errors)'],
-            ['T+135 min', '69 rounds complete, mining unprofitable', 'SMMA = 1.41 gwei'],
-            ['T+140 min', 'Experiment terminated', 'Net: -0.342 ETH'],
-        ],
-        col_widths=[65, 215, 130],
-    ))
+    story += [
+        Spacer(1, 12),
+        Paragraph('Appendix C. Experiment Timeline', H1),
+        make_table(_APPX_C_HDR, _APPX_C_ROWS, col_widths=_APPX_C_COLW),
+    ]
 
-    story.append(sp(12))
-    story.append(S('Appendix D. Source Code', 'SectionH1'))
-    story.append(S(
-        'The complete source code for <font face="Courier">xrt-classic-miner</font> is available at: '
-        '<font face="Courier">/home/ens/sources/xrt-classic-miner/</font>'
-    ))
-    story.append(make_table(
-        ['Module', 'Description', 'Lines'],
-        [
-            ['xrt_miner/miner.py', 'Core mining logic (XRTMiner class)', '~620'],
-            ['xrt_miner/signer.py', 'Demand/offer/result encoding', '~183'],
-            ['xrt_miner/abi.py', 'Contract interfaces and addresses', '~150'],
-            ['xrt_miner/__main__.py', 'CLI entry point (Click)', '~400'],
-        ],
-        col_widths=[130, 200, 50],
-    ))
+    story += [
+        Spacer(1, 12),
+        Paragraph('Appendix D. Source Code', H1),
+        S(
+            f'The complete source code for {XRT_MINER} is available at: '
+            '<font face="Courier">/home/ens/sources/xrt-classic-miner/</font>'
+        ),
+        make_table(_APPX_D_HDR, _APPX_D_ROWS, col_widths=_APPX_D_COLW),
+    ]
+    return story
+
+
+# Assembled in this order by build()
+_SECTIONS = (
+    _section_title,
+    _section_abstract,
+    _section_introduction,
+    _section_background,
+    _section_methodology,
+    _section_results,
+    _section_analysis,
+    _section_early_design,
+    _section_conclusion,
+    _section_references,
+    _section_appendices,
+)
+
+
+def build(force=False):
+    """Build OUT_PDF, reusing a cached copy when the inputs are unchanged."""
+    cached_pdf = os.path.join(CACHE_DIR, f'{_build_key()}.pdf')
+    if not force and os.path.exists(cached_pdf):
+        shutil.copyfile(cached_pdf, OUT_PDF)
+        print(f'PDF up to date (cached): {OUT_PDF}')
+        return
+
+    # Sections are cheap to build relative to layout, and flowables hold
+    # stylesheet references, so they are built in-process rather than
+    # pickled back from worker processes
+    story = list(chain.from_iterable(section() for section in _SECTIONS))
 
-    # Build with page numbers
-    doc.build(story, onFirstPage=page_footer, onLaterPages=page_footer)
+    # Build with page numbers into memory; reportlab serialises the whole
+    # document in one buffer anyway, so the output and the cache copy are
+    # each written with a single call and nothing is read back
+    buf = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buf, pagesize=A4,
+        leftMargin=22 * mm, rightMargin=22 * mm,
+        topMargin=22 * mm, bottomMargin=22 * mm,
+        _pageBreakQuick=1, allowSplitting=1,
+    )
+    doc.build(story, onFirstPage=first_page, onLaterPages=page_footer)
+    data = buf.getbuffer()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for path in (OUT_PDF, cached_pdf):
+        with open(path, 'wb') as fh:
+            fh.write(data)
+    # Only the latest build is ever reused: drop the copies of earlier inputs
+    for entry in os.scandir(CACHE_DIR):
+        if entry.name.endswith('.pdf') and entry.path != cached_pdf:
+            os.remove(entry.path)
     print(f'PDF generated: {OUT_PDF}')
 
 
@@ -8,15 +8,28 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
 import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, ArrowStyle
+from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, ArrowStyle, BoxStyle
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import hashlib
+import inspect
 import os
-
-OUT = os.path.join(os.path.dirname(__file__), 'figures')
-os.makedirs(OUT, exist_ok=True)
-
-# Global style — publication quality
-plt.rcParams.update({
+from pathlib import Path
+
+OUT = Path(__file__).parent / 'figures'
+OUT.mkdir(exist_ok=True)
+# Per-figure content hashes; shares build_pdf.py's untracked cache directory
+CACHE = Path(__file__).parent / '.cache' / 'figures'
+# 150 dpi is what build_pdf.py embeds; export FIG_DPI=300 for final artwork
+DPI = int(os.environ.get('FIG_DPI', '150'))
+
+# Publication style, applied around each figure with matplotlib.rc_context
+# so importing this module leaves the global rcParams untouched
+PAPER_STYLE = {
     'font.size': 11,
     'font.family': 'sans-serif',
     'axes.titlesize': 13,
@@ -24,18 +37,18 @@ plt.rcParams.update({
     'axes.linewidth': 0.8,
     'xtick.labelsize': 10,
     'ytick.labelsize': 10,
-    'figure.dpi': 200,
-    'savefig.dpi': 200,
+    'figure.dpi': DPI,
+    'savefig.dpi': DPI,
+    'figure.max_open_warning': 0,
     'savefig.bbox': 'tight',
     'savefig.pad_inches': 0.15,
     'figure.facecolor': 'white',
     'axes.facecolor': '#fafbfc',
-    'axes.grid': True,
     'grid.alpha': 0.25,
     'grid.linewidth': 0.5,
     'legend.framealpha': 0.9,
     'legend.edgecolor': '#cccccc',
-})
+}
 
 # Color palette
 C_BLUE = '#2563eb'
@@ -48,61 +61,175 @@ C_LIGHT_BLUE = '#93c5fd'
 C_LIGHT_RED = '#fca5a5'
 C_LIGHT_GREEN = '#86efac'
 
+# Arrow head size annotate() would use (its text size) for bare FancyArrowPatches
+ARROW_SCALE = PAPER_STYLE['font.size']
 
-# ═══════════════════════════════════════════════════════════════════
-# Figure 1: SMMA dynamics — pump phase + mine phase
-# ═══════════════════════════════════════════════════════════════════
-def fig1_smma_dynamics():
-    fig, ax = plt.subplots(figsize=(10, 4.5))
-
-    # Simulate SMMA trajectory
-    smma = 1.03  # starting SMMA (gwei)
-    PERIOD = 1000
-    trajectory = []
-
-    # Phase 1: PUMP — 4 rounds, batch=56, eff_gp=10.2 gwei
-    for r in range(4):
-        for call in range(112):  # 56 create + 56 finalize
-            trajectory.append(smma)
-            smma += (10.2 - smma) / PERIOD
-
-    pump_end = len(trajectory)
+SMMA_PERIOD = 1000
 
-    # Transition gap (finalization, selling, reconfiguration) — ~200 calls
-    for call in range(200):
-        trajectory.append(smma)
-        smma += (1.2 - smma) / PERIOD
 
-    mine_start = len(trajectory)
+def smma_path(smma0, target, n, period=SMMA_PERIOD):
+    """SMMA seen before each of n updates toward target, and the value after the last.
+
+    Closed form of the contract's ``smma += (target - smma) / period`` update.
+    """
+    path = target + (smma0 - target) * (1 - 1 / period) ** np.arange(n + 1)
+    return path[:-1], path[-1]
+
+
+@functools.lru_cache
+def box_style(spec):
+    """Parsed BoxStyle for a spec such as 'round,pad=0.3', shared by every patch using it."""
+    return BoxStyle(spec)
+
+
+@functools.lru_cache
+def arrow_style(spec):
+    """Parsed ArrowStyle for a spec such as '->', shared by every arrow using it."""
+    return ArrowStyle(spec)
+
+
+def new_figure(**kw):
+    """A Figure on its own Agg canvas, kept out of pyplot's global figure registry."""
+    fig = Figure(**kw)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _save(fig, name):
+    """Write fig to OUT/name with fast zlib level 1 and no Software metadata.
+
+    The PNGs are re-encoded for the PDF anyway, so file size matters less
+    than encode time here.
+    """
+    fig.savefig(OUT / name, metadata={'Software': None}, pil_kwargs={'compress_level': 1})
+
+
+def fast_bar(ax, x, height, width=0.8, **kw):
+    """Vertical bars from zero as one PolyCollection instead of a Rectangle per bar."""
+    x = np.asarray(x, dtype=float)
+    height = np.asarray(height, dtype=float)
+    left, right, zero = x - width / 2, x + width / 2, np.zeros_like(height)
+    verts = np.stack([
+        np.stack([left, left, right, right], axis=1),
+        np.stack([zero, height, height, zero], axis=1),
+    ], axis=2)
+    bars = PolyCollection(verts, **kw)
+    bars.sticky_edges.y.append(0)  # like ax.bar: no margin below the baseline
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    return bars
+
+
+def _referenced_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _referenced_names(const)
+    return names
+
+
+def _fingerprint(fn):
+    """SHA-256 of fn's source, the module data and helpers it uses, and the active rcParams.
+
+    Same-module helpers are followed transitively, and their default argument values
+    are hashed too, so a constant reached only through a helper (fig1 gets
+    SMMA_PERIOD via smma_path's default) still changes the fingerprint.
+    """
+    parts = [repr(sorted(plt.rcParams.items())).encode()]
+    env = fn.__globals__
+    seen = set()
+
+    def visit(func):
+        if func in seen:
+            return
+        seen.add(func)
+        parts.append(inspect.getsource(func).encode())
+        parts.append(repr((func.__defaults__, func.__kwdefaults__)).encode())
+        for name in sorted(_referenced_names(func.__code__) & env.keys()):
+            value = env[name]
+            if isinstance(value, np.ndarray):
+                parts.append(value.tobytes())
+            elif inspect.isfunction(value) and value.__module__ == fn.__module__:
+                visit(value)
+            elif isinstance(value, (int, float, str, tuple)):
+                parts.append(repr(value).encode())
+
+    visit(fn)
+    return hashlib.sha256(b'\0'.join(parts)).hexdigest()
+
+
+def cached_figure(filename):
+    """Skip a figure function when its PNG exists and nothing it depends on has changed.
+
+    PAPER_STYLE is applied around both the fingerprint and the drawing, so a figure
+    called directly is styled and keyed the same as one run from __main__.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper():
+            with matplotlib.rc_context(PAPER_STYLE):
+                stamp = CACHE / f'{filename}.sha256'
+                digest = _fingerprint(fn)
+                try:
+                    fresh = stamp.read_text() == digest and (OUT / filename).exists()
+                except FileNotFoundError:
+                    fresh = False
+                if fresh:
+                    print(f'{filename} up to date')
+                    return
+                fn()
+                CACHE.mkdir(parents=True, exist_ok=True)
+                stamp.write_text(digest)
+        return wrapper
+    return decorate
 
-    # Phase 2: MINE — 69 rounds, batch=10, eff_gp=1.2 gwei
-    for r in range(69):
-        for call in range(20):  # 10 create + 10 finalize
-            trajectory.append(smma)
-            smma += (1.2 - smma) / PERIOD
 
-    x = np.arange(len(trajectory))
-    ax.plot(x, trajectory, color=C_BLUE, linewidth=1.8, alpha=0.95, zorder=3)
+# ═══════════════════════════════════════════════════════════════════
+# Figure 1: SMMA dynamics — pump phase + mine phase
+# ═══════════════════════════════════════════════════════════════════
+@cached_figure('fig1_smma_dynamics.png')
+def fig1_smma_dynamics():
+    fig = new_figure(figsize=(10, 4.5))
+    ax = fig.subplots()
+    ax.grid(True)
+
+    # Simulate SMMA trajectory, starting from 1.03 gwei, into one preallocated array:
+    # pump (4 rounds x 56 create + 56 finalize), a ~200-call transition gap
+    # (finalization, selling, reconfiguration), then mine (69 rounds x 10 + 10)
+    pump_end = 4 * 112
+    mine_start = pump_end + 200
+    total = mine_start + 69 * 20
+    trajectory = np.empty(total)
+
+    # Phase 1: PUMP — eff_gp=10.2 gwei
+    trajectory[:pump_end], smma = smma_path(1.03, 10.2, pump_end)
+    # Transition — eff_gp=1.2 gwei
+    trajectory[pump_end:mine_start], smma = smma_path(smma, 1.2, mine_start - pump_end)
+    # Phase 2: MINE — batch=10, eff_gp=1.2 gwei
+    trajectory[mine_start:], smma = smma_path(smma, 1.2, total - mine_start)
+
+    x = np.arange(total)
+    ax.plot(x, trajectory, color=C_BLUE, linewidth=1.8, alpha=0.95, zorder=3, rasterized=True)
 
     # Shade phases
     ax.axvspan(0, pump_end, alpha=0.10, color=C_RED, label='Phase 1: Pump (10 gwei priority)')
     ax.axvspan(pump_end, mine_start, alpha=0.06, color=C_AMBER, label='Transition (reconfiguration)')
-    ax.axvspan(mine_start, len(trajectory), alpha=0.07, color=C_GREEN, label='Phase 2: Mine (1 gwei priority)')
+    ax.axvspan(mine_start, total, alpha=0.07, color=C_GREEN, label='Phase 2: Mine (1 gwei priority)')
 
     # Breakeven line
     ax.axhline(y=0.674, color=C_RED, linestyle='--', alpha=0.5, linewidth=1)
-    ax.text(len(trajectory) * 0.78, 0.80, 'Breakeven SMMA\n(at 0.45 gwei eff.)',
+    ax.text(total * 0.78, 0.80, 'Breakeven SMMA\n(at 0.45 gwei eff.)',
             fontsize=9, color=C_RED, ha='center', style='italic')
 
     # Target lines
     ax.axhline(y=10.2, color=C_RED, linestyle=':', alpha=0.3, linewidth=0.8)
     ax.text(pump_end * 0.5, 10.5, 'pump target: 10.2 gwei', fontsize=8, color=C_RED, ha='center', alpha=0.6)
     ax.axhline(y=1.2, color=C_GREEN, linestyle=':', alpha=0.3, linewidth=0.8)
-    ax.text(len(trajectory) * 0.9, 1.35, 'mine target: 1.2 gwei', fontsize=8, color=C_GREEN, ha='center', alpha=0.6)
+    ax.text(total * 0.9, 1.35, 'mine target: 1.2 gwei', fontsize=8, color=C_GREEN, ha='center', alpha=0.6)
 
     # Phase annotations
     ax.annotate('SMMA peak\n~4.0 gwei', xy=(pump_end, 4.0), xytext=(pump_end + 100, 4.3),
-                fontsize=9, ha='left', arrowprops=dict(arrowstyle='->', color=C_GRAY, lw=1),
+                fontsize=9, ha='left', arrowprops=dict(arrowstyle=arrow_style('->'), color=C_GRAY, lw=1),
                 color=C_GRAY)
 
     ax.set_xlabel('Contract calls (cumulative)')
@@ -111,37 +238,45 @@ def fig1_smma_dynamics():
     ax.legend(loc='upper right', fontsize=9)
     ax.set_ylim(0, 11)
 
-    fig.savefig(os.path.join(OUT, 'fig1_smma_dynamics.png'))
-    plt.close()
+    _save(fig, 'fig1_smma_dynamics.png')
     print('fig1 done')
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Figure 2: XRT emission per round (mine phase)
 # ═══════════════════════════════════════════════════════════════════
+# XRT minted per round, mine phase rounds 2-69; built once at import
+MINE_ROUNDS = np.arange(2, 70)
+MINE_XRT = np.array([
+    443.66, 439.50, 435.82, 432.18, 428.68, 425.57, 421.88, 418.79,
+    415.50, 412.51, 409.85, 406.36, 403.53, 400.63, 398.59, 395.26,
+    392.55, 389.80, 386.95, 384.58, 382.28, 380.58, 377.66, 375.58,
+    373.36, 371.23, 369.23, 367.86, 365.40, 363.60, 361.72, 359.92,
+    358.26, 357.06, 354.84, 353.34, 351.70, 350.25, 348.71, 347.75,
+    345.78, 344.57, 343.33, 342.06, 340.81, 340.38, 304.66, 337.54,
+    303.51, 335.49, 301.01, 333.61, 299.69, 298.62, 297.92, 297.16,
+    329.48, 328.15, 294.54, 326.78, 293.04, 324.84, 324.08, 258.86,
+    258.35, 258.18, 257.88, 257.13,
+], dtype=np.float32)
+
+
+@cached_figure('fig2_xrt_per_round.png')
 def fig2_xrt_per_round():
-    rounds = list(range(2, 70))
-    xrt = [
-        443.66, 439.50, 435.82, 432.18, 428.68, 425.57, 421.88, 418.79,
-        415.50, 412.51, 409.85, 406.36, 403.53, 400.63, 398.59, 395.26,
-        392.55, 389.80, 386.95, 384.58, 382.28, 380.58, 377.66, 375.58,
-        373.36, 371.23, 369.23, 367.86, 365.40, 363.60, 361.72, 359.92,
-        358.26, 357.06, 354.84, 353.34, 351.70, 350.25, 348.71, 347.75,
-        345.78, 344.57, 343.33, 342.06, 340.81, 340.38, 304.66, 337.54,
-        303.51, 335.49, 301.01, 333.61, 299.69, 298.62, 297.92, 297.16,
-        329.48, 328.15, 294.54, 326.78, 293.04, 324.84, 324.08, 258.86,
-        258.35, 258.18, 257.88, 257.13,
-    ]
+    rounds = MINE_ROUNDS
+    xrt = MINE_XRT
 
-    fig, ax1 = plt.subplots(figsize=(10, 4.5))
+    fig = new_figure(figsize=(10, 4.5))
+    ax1 = fig.subplots()
+    ax1.grid(True)
 
-    bars = ax1.bar(rounds, xrt, color=C_LIGHT_BLUE, edgecolor=C_BLUE, alpha=0.7,
-                   width=0.8, linewidth=0.3, label='XRT minted per round')
+    bars = fast_bar(ax1, rounds, xrt, facecolor=C_LIGHT_BLUE, edgecolor=C_BLUE, alpha=0.7,
+                    width=0.8, linewidth=0.3, label='XRT minted per round', rasterized=True)
 
     # Cumulative
     ax2 = ax1.twinx()
+    ax2.grid(True)
     cumulative = np.cumsum(xrt)
-    ax2.plot(rounds, cumulative, color=C_RED, linewidth=2.2, label='Cumulative XRT', zorder=5)
+    cum_line, = ax2.plot(rounds, cumulative, color=C_RED, linewidth=2.2, label='Cumulative XRT', zorder=5)
     ax2.set_ylabel('Cumulative XRT', color=C_RED)
     ax2.tick_params(axis='y', labelcolor=C_RED)
 
@@ -150,51 +285,58 @@ def fig2_xrt_per_round():
     ax1.set_title('XRT Emission per Round (Mine Phase, batch=10, prio=1 gwei)', fontweight='bold')
 
     # Mark sell events with subtle vertical lines
+    # as one collection spanning the axes height (what axvline does per line)
     sell_rounds = [6, 11, 16, 22, 28, 34, 40, 46, 53, 58, 64]
-    for i, sr in enumerate(sell_rounds):
-        if sr - 2 < len(xrt):
-            ax1.axvline(x=sr, color=C_AMBER, linestyle=':', alpha=0.4, linewidth=1)
+    segs = [[(sr, 0), (sr, 1)] for sr in sell_rounds if sr - 2 < len(xrt)]
+    ax1.add_collection(LineCollection(segs, colors=C_AMBER, linestyles=':', alpha=0.4, linewidths=1,
+                                      transform=ax1.get_xaxis_transform()), autolim=False)
     ax1.text(8, 460, 'auto-sell events', fontsize=8, color=C_AMBER, style='italic')
 
-    # Trend line
-    z = np.polyfit(rounds, xrt, 1)
-    p = np.poly1d(z)
-    ax1.plot(rounds, p(rounds), '--', color=C_PURPLE, alpha=0.5, linewidth=1.2, label='Trend')
+    # Trend line: least-squares slope/intercept, no LAPACK solve needed for one regressor
+    x = rounds.astype(np.float64)
+    y = xrt.astype(np.float64)
+    dx = x - x.mean()
+    slope = dx @ (y - y.mean()) / (dx @ dx)
+    intercept = y.mean() - slope * x.mean()
+    trend, = ax1.plot(rounds, slope * x + intercept, '--', color=C_PURPLE, alpha=0.5, linewidth=1.2, label='Trend')
 
-    lines1, labels1 = ax1.get_legend_handles_labels()
-    lines2, labels2 = ax2.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2, labels1 + labels2, loc='center right', fontsize=9)
+    ax1.legend(handles=[trend, bars, cum_line], loc='center right', fontsize=9)
 
-    fig.savefig(os.path.join(OUT, 'fig2_xrt_per_round.png'))
-    plt.close()
+    _save(fig, 'fig2_xrt_per_round.png')
     print('fig2 done')
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Figure 3: XRT sell price decay on Uniswap V2
 # ═══════════════════════════════════════════════════════════════════
+# Sell events: (#, XRT sold, ETH received)
+SELLS = np.array([
+    (1, 4801.06, 0.161558), (2, 2094.24, 0.069128), (3, 2018.96, 0.065870),
+    (4, 2331.42, 0.075817), (5, 2247.64, 0.072325), (6, 2176.76, 0.069183),
+    (7, 2115.91, 0.066450), (8, 2064.30, 0.064211), (9, 2256.19, 0.069402),
+    (10, 2145.56, 0.065208), (11, 2044.14, 0.061474),
+], dtype=np.float64)
+
+
+@cached_figure('fig3_price_decay.png')
 def fig3_price_decay():
-    sells = [
-        (1, 4801.06, 0.161558), (2, 2094.24, 0.069128), (3, 2018.96, 0.065870),
-        (4, 2331.42, 0.075817), (5, 2247.64, 0.072325), (6, 2176.76, 0.069183),
-        (7, 2115.91, 0.066450), (8, 2064.30, 0.064211), (9, 2256.19, 0.069402),
-        (10, 2145.56, 0.065208), (11, 2044.14, 0.061474),
-    ]
-    nums = [s[0] for s in sells]
-    prices = [s[2] / s[1] * 1e6 for s in sells]  # micro-ETH per XRT
-    volumes = [s[1] for s in sells]
+    nums, volumes, eth = SELLS[:, 0], SELLS[:, 1], SELLS[:, 2]
+    prices = eth / volumes * 1e6  # micro-ETH per XRT
 
-    fig, ax1 = plt.subplots(figsize=(9, 4.5))
+    fig = new_figure(figsize=(9, 4.5))
+    ax1 = fig.subplots()
+    ax1.grid(True)
 
-    ax1.bar(nums, volumes, color=C_LIGHT_BLUE, edgecolor=C_BLUE, alpha=0.6,
-            width=0.6, linewidth=0.5, label='XRT sold per swap')
+    bars = fast_bar(ax1, nums, volumes, facecolor=C_LIGHT_BLUE, edgecolor=C_BLUE, alpha=0.6,
+                    width=0.6, linewidth=0.5, label='XRT sold per swap', rasterized=True)
     ax1.set_ylabel('XRT sold per swap', color=C_BLUE)
     ax1.set_xlabel('Sell event #')
     ax1.tick_params(axis='y', labelcolor=C_BLUE)
 
     ax2 = ax1.twinx()
-    ax2.plot(nums, prices, 'o-', color=C_RED, linewidth=2.2, markersize=7,
-             markeredgecolor='white', markeredgewidth=1.5, label='Price (uETH/XRT)', zorder=5)
+    ax2.grid(True)
+    price_line, = ax2.plot(nums, prices, 'o-', color=C_RED, linewidth=2.2, markersize=7,
+                           markeredgecolor='white', markeredgewidth=1.5, label='Price (uETH/XRT)', zorder=5)
     ax2.set_ylabel('Price (uETH per XRT)', color=C_RED)
     ax2.tick_params(axis='y', labelcolor=C_RED)
 
@@ -207,28 +349,30 @@ def fig3_price_decay():
     ax2.annotate(f'{prices[-1]:.1f}', xy=(11, prices[-1]), xytext=(10.5, prices[-1] - 1.0),
                 fontsize=9, color=C_RED, fontweight='bold')
     ax2.annotate('', xy=(11.3, prices[-1]), xytext=(11.3, prices[0]),
-                arrowprops=dict(arrowstyle='<->', color=C_GRAY, lw=1.5))
+                arrowprops=dict(arrowstyle=arrow_style('<->'), color=C_GRAY, lw=1.5))
     ax2.text(11.6, (prices[0] + prices[-1]) / 2, '-10.6%', fontsize=10, color=C_RED,
              fontweight='bold', va='center')
 
     ax1.set_title('XRT Price Impact from Sequential Sells on Uniswap V2', fontweight='bold')
 
-    lines1, labels1 = ax1.get_legend_handles_labels()
-    lines2, labels2 = ax2.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper right', fontsize=9)
+    ax1.legend(handles=[bars, price_line], loc='upper right', fontsize=9)
 
-    fig.savefig(os.path.join(OUT, 'fig3_price_decay.png'))
-    plt.close()
+    _save(fig, 'fig3_price_decay.png')
     print('fig3 done')
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Figure 4: SMMA convergence simulation at different priority fees
 # ═══════════════════════════════════════════════════════════════════
+CONVERGENCE_ROUNDS = np.arange(101)
+
+
+@cached_figure('fig4_smma_convergence.png')
 def fig4_smma_convergence():
-    fig, ax = plt.subplots(figsize=(10, 4.5))
+    fig = new_figure(figsize=(10, 4.5))
+    ax = fig.subplots()
+    ax.grid(True)
     SMMA_START = 1.94
-    PERIOD = 1000
     CALLS_PER_ROUND = 20
 
     scenarios = [
@@ -239,21 +383,21 @@ def fig4_smma_convergence():
         (0.0, C_PURPLE, '0.0 gwei (theoretical min)', ':'),
     ]
 
+    # SMMA at each round boundary, i.e. after every CALLS_PER_ROUND updates;
+    # the decay factor is the same for every scenario
+    rounds = CONVERGENCE_ROUNDS
+    decay = (1 - 1 / SMMA_PERIOD) ** (rounds * CALLS_PER_ROUND)
     for prio, color, label, ls in scenarios:
         base = 0.25
         eff = base + prio
-        smma = SMMA_START
-        values = [smma]
-        for r in range(100):
-            for _ in range(CALLS_PER_ROUND):
-                smma += (eff - smma) / PERIOD
-            values.append(smma)
-        ax.plot(range(101), values, color=color, linewidth=2, label=f'prio={label}', linestyle=ls)
+        values = eff + (SMMA_START - eff) * decay
+        ax.plot(rounds, values, color=color, linewidth=2, label=f'prio={label}', linestyle=ls,
+                rasterized=True)
 
     ax.axhline(y=0.674, color=C_GRAY, linestyle='--', alpha=0.5, linewidth=1.2)
     ax.text(87, 0.85, 'Breakeven\n(0.674 gwei)', fontsize=9, color=C_GRAY, ha='center',
             style='italic',
-            bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor=C_GRAY, alpha=0.8))
+            bbox=dict(boxstyle=box_style('round,pad=0.3'), facecolor='white', edgecolor=C_GRAY, alpha=0.8))
 
     # Mark half-life
     ax.axvline(x=35, color=C_BLUE, linestyle=':', alpha=0.3, linewidth=1)
@@ -265,30 +409,33 @@ def fig4_smma_convergence():
     ax.legend(fontsize=8.5, loc='right')
     ax.set_ylim(0, 12)
 
-    fig.savefig(os.path.join(OUT, 'fig4_smma_convergence.png'))
-    plt.close()
+    _save(fig, 'fig4_smma_convergence.png')
     print('fig4 done')
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Figure 5: Architecture diagram (Robonomics emission flow)
 # ═══════════════════════════════════════════════════════════════════
+@cached_figure('fig5_architecture.png')
 def fig5_architecture():
-    fig, ax = plt.subplots(figsize=(12, 6.5))
+    fig = new_figure(figsize=(12, 6.5))
+    ax = fig.subplots()
     ax.set_xlim(-0.5, 12)
     ax.set_ylim(-0.5, 7)
     ax.axis('off')
 
     def box(ax, x, y, w, h, text, fc, ec, fontsize=11, bold=False):
         rect = FancyBboxPatch((x - w/2, y - h/2), w, h,
-                              boxstyle="round,pad=0.15", facecolor=fc, edgecolor=ec, linewidth=1.8)
+                              boxstyle=box_style('round,pad=0.15'), facecolor=fc, edgecolor=ec, linewidth=1.8)
         ax.add_patch(rect)
         weight = 'bold' if bold else 'normal'
         ax.text(x, y, text, fontsize=fontsize, ha='center', va='center', fontweight=weight, zorder=10)
 
     def arrow(ax, x1, y1, x2, y2, color='#374151', style='->', lw=1.5, ls='-'):
-        ax.annotate('', xy=(x2, y2), xytext=(x1, y1),
-                    arrowprops=dict(arrowstyle=style, color=color, lw=lw, linestyle=ls))
+        # Bare patch rather than an empty-text annotate(); same geometry and layering
+        ax.add_patch(FancyArrowPatch((x1, y1), (x2, y2), arrowstyle=arrow_style(style),
+                                     color=color, lw=lw, linestyle=ls,
+                                     mutation_scale=ARROW_SCALE, zorder=3))
 
     def label(ax, x, y, text, **kw):
         defaults = dict(fontsize=8.5, ha='center', va='center', color='#374151')
@@ -338,16 +485,17 @@ def fig5_architecture():
 
     ax.set_title('XRT Emission Pipeline Architecture', fontsize=14, fontweight='bold', pad=15)
 
-    fig.savefig(os.path.join(OUT, 'fig5_architecture.png'))
-    plt.close()
+    _save(fig, 'fig5_architecture.png')
     print('fig5 done')
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Figure 6: Emission formula feedback loop
 # ═══════════════════════════════════════════════════════════════════
+@cached_figure('fig6_feedback_loop.png')
 def fig6_feedback_loop():
-    fig, ax = plt.subplots(figsize=(8, 8))
+    fig = new_figure(figsize=(8, 8))
+    ax = fig.subplots()
     ax.set_xlim(-3.2, 3.2)
     ax.set_ylim(-3.2, 3.2)
     ax.axis('off')
@@ -371,7 +519,7 @@ def fig6_feedback_loop():
         rad = np.radians(ang)
         x, y = r * np.cos(rad), r * np.sin(rad)
         positions.append((x, y))
-        bbox = dict(boxstyle='round,pad=0.5', facecolor=fc, edgecolor=ec, linewidth=2.2)
+        bbox = dict(boxstyle=box_style('round,pad=0.5'), facecolor=fc, edgecolor=ec, linewidth=2.2)
         ax.text(x, y, label, fontsize=9.5, ha='center', va='center', bbox=bbox, zorder=5)
 
     # Draw arrows between consecutive nodes
@@ -382,15 +530,16 @@ def fig6_feedback_loop():
         dy = y2 - y1
         length = np.sqrt(dx**2 + dy**2)
         shrink = 0.62 / length
-        ax.annotate('', xy=(x2 - dx * shrink, y2 - dy * shrink),
-                    xytext=(x1 + dx * shrink, y1 + dy * shrink),
-                    arrowprops=dict(arrowstyle='->', color='#374151', lw=2.2,
-                                    connectionstyle='arc3,rad=0.08'))
+        ax.add_patch(FancyArrowPatch((x1 + dx * shrink, y1 + dy * shrink),
+                                     (x2 - dx * shrink, y2 - dy * shrink),
+                                     arrowstyle=arrow_style('->'), color='#374151', lw=2.2,
+                                     connectionstyle='arc3,rad=0.08',
+                                     mutation_scale=ARROW_SCALE, zorder=3))
 
     # Center label
     ax.text(0, 0, 'Robonomics\nEmission\nFeedback Loop', fontsize=13, ha='center', va='center',
             style='italic', color='#374151', fontweight='bold',
-            bbox=dict(boxstyle='round,pad=0.6', facecolor='white', edgecolor='#d1d5db',
+            bbox=dict(boxstyle=box_style('round,pad=0.6'), facecolor='white', edgecolor='#d1d5db',
                       linewidth=1.5, alpha=0.95))
 
     # Equilibrium note
@@ -399,16 +548,24 @@ def fig6_feedback_loop():
 
     ax.set_title('Reflexive Incentive Cycle in XRT Emission', fontsize=14, fontweight='bold', pad=15)
 
-    fig.savefig(os.path.join(OUT, 'fig6_feedback_loop.png'))
-    plt.close()
+    _save(fig, 'fig6_feedback_loop.png')
     print('fig6 done')
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Figure 7: Gas cost landscape — 2018 vs 2026
 # ═══════════════════════════════════════════════════════════════════
+# Cost per liability at ETH=$2000 over 0.2 to 300 gwei; fixed, so built once
+GAS_CURVE = np.logspace(-0.7, 2.5, 200, dtype=np.float32)
+GAS_CURVE_COST = GAS_CURVE * np.float32(1.058e6 / 1e9 * 2000)
+
+
+@cached_figure('fig7_gas_landscape.png')
 def fig7_gas_landscape():
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    fig = new_figure(figsize=(12, 5))
+    ax1, ax2 = fig.subplots(1, 2)
+    ax1.grid(True)
+    ax2.grid(True)
 
     # Left: Gas price evolution
     periods = ['2018\n(design)', '2020\n(DeFi)', '2022\n(Merge)', '2024\n(Dencun)', '2026\n(exper.)']
@@ -416,35 +573,31 @@ def fig7_gas_landscape():
     gas_peak = [200, 600, 300, 100, 5]
     x = np.arange(len(periods))
 
-    bars1 = ax1.bar(x - 0.17, gas_typical, 0.32, color=C_LIGHT_BLUE, edgecolor=C_BLUE,
-                    linewidth=0.8, label='Typical gas (gwei)')
-    bars2 = ax1.bar(x + 0.17, gas_peak, 0.32, color=C_LIGHT_RED, edgecolor=C_RED,
-                    linewidth=0.8, alpha=0.7, label='Peak gas (gwei)')
+    typical = fast_bar(ax1, x - 0.17, gas_typical, 0.32, facecolor=C_LIGHT_BLUE, edgecolor=C_BLUE,
+                       linewidth=0.8, label='Typical gas (gwei)', rasterized=True)
+    peak = fast_bar(ax1, x + 0.17, gas_peak, 0.32, facecolor=C_LIGHT_RED, edgecolor=C_RED,
+                    linewidth=0.8, alpha=0.7, label='Peak gas (gwei)', rasterized=True)
 
     # Value labels on bars
-    for bar, val in zip(bars1, gas_typical):
-        ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() * 1.2,
-                f'{val}', ha='center', va='bottom', fontsize=8, color=C_BLUE)
+    for bx, val in zip(x - 0.17, gas_typical):
+        ax1.text(bx, val * 1.2, f'{val}', ha='center', va='bottom', fontsize=8, color=C_BLUE)
 
     ax1.set_xticks(x)
     ax1.set_xticklabels(periods, fontsize=9)
     ax1.set_ylabel('Gas price (gwei)')
     ax1.set_yscale('log')
-    ax1.legend(fontsize=8.5, loc='upper right')
+    ax1.legend(handles=[typical, peak], fontsize=8.5, loc='upper right')
     ax1.set_title('(a) Ethereum Gas Price Evolution', fontsize=11, fontweight='bold')
 
     # Highlight the drop
     ax1.annotate('', xy=(4, 0.25), xytext=(0, 20),
-                arrowprops=dict(arrowstyle='->', color=C_RED, lw=1.5, ls='dashed',
+                arrowprops=dict(arrowstyle=arrow_style('->'), color=C_RED, lw=1.5, ls='dashed',
                                 connectionstyle='arc3,rad=0.3'))
     ax1.text(2, 3, '~100x\ndrop', fontsize=10, color=C_RED, ha='center', fontweight='bold')
 
     # Right: Cost per liability
-    gas_prices = np.logspace(-0.7, 2.5, 200)  # 0.2 to 300 gwei
-    cost_usd_at_2000 = gas_prices * 1.058e6 / 1e9 * 2000
-
-    ax2.plot(gas_prices, cost_usd_at_2000, color=C_BLUE, linewidth=2.5)
-    ax2.fill_between(gas_prices, cost_usd_at_2000, alpha=0.05, color=C_BLUE)
+    ax2.plot(GAS_CURVE, GAS_CURVE_COST, color=C_BLUE, linewidth=2.5)
+    ax2.fill_between(GAS_CURVE, GAS_CURVE_COST, alpha=0.05, color=C_BLUE)
 
     # Era markers
     markers = [
@@ -458,7 +611,7 @@ def fig7_gas_landscape():
         ax2.plot(gp, cost, 'o', color=color, markersize=8, zorder=5)
         ax2.annotate(txt, xy=(gp, cost), xytext=(gp * 1.5, cost * 1.5),
                     fontsize=8.5, color=color, fontweight='bold',
-                    arrowprops=dict(arrowstyle='->', color=color, lw=1))
+                    arrowprops=dict(arrowstyle=arrow_style('->'), color=color, lw=1))
 
     ax2.set_xlabel('Gas price (gwei)')
     ax2.set_ylabel('Cost per liability (USD, at ETH=$2000)')
@@ -469,77 +622,66 @@ def fig7_gas_landscape():
     fig.suptitle('Ethereum Gas Price Landscape: Design Era vs Experiment Era',
                  fontsize=13, fontweight='bold', y=1.02)
     fig.tight_layout()
-    fig.savefig(os.path.join(OUT, 'fig7_gas_landscape.png'))
-    plt.close()
+    _save(fig, 'fig7_gas_landscape.png')
     print('fig7 done')
 
 
 # ═══════════════════════════════════════════════════════════════════
 # Figure 8: Economic equilibrium model (NEW)
 # ═══════════════════════════════════════════════════════════════════
+@cached_figure('fig8_economic_model.png')
 def fig8_economic_model():
     """Show the economic equilibrium: emission revenue vs gas cost as a function of priority fee."""
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig = new_figure(figsize=(10, 5))
+    ax = fig.subplots()
+    ax.grid(True)
 
     GAS_PER_LIABILITY = 1_058_000
     FINAL_PRICE = 5_662_799_692_218  # from contract
     BASE_FEE = 0.25  # gwei
     SMMA_START = 1.94  # gwei
     XRT_PRICE_ETH = 32e-6  # ~32 uETH per XRT (from sells data)
-    PERIOD = 1000
 
     # Range of priority fees to analyze
     prios = np.linspace(0, 15, 300)
-
-    # For each priority fee, simulate 50 rounds then compute steady state
-    revenues = []
-    costs = []
-    profits = []
-
-    for prio in prios:
-        eff_gp = BASE_FEE + prio  # gwei
-
-        # Cost per liability in ETH
-        cost_eth = eff_gp * 1e-9 * GAS_PER_LIABILITY
-        cost_per_round = cost_eth * 20  # 10 create + 10 finalize ~ 20 txs
-
-        # Steady-state SMMA converges to eff_gp
-        # But in practice, SMMA lags. Use SMMA after 30 rounds from start.
-        smma = SMMA_START * 1e9  # in wei
-        for _ in range(30 * 20):  # 30 rounds * 20 calls
-            smma += (eff_gp * 1e9 - smma) / PERIOD
-
-        # XRT minted per round (gas per round * smma / finalPrice)
-        gas_per_round = GAS_PER_LIABILITY * 10  # 10 liabilities
-        # Actually: wn per liability = gas * smma * 1e9 / finalPrice
-        # But smma is already in wei (gwei * 1e9)
-        # wnFromGas: gas * gasPrice * 1e9 / finalPrice
-        # where gasPrice is in wei
-        wn_per_round = gas_per_round * smma * 1e9 / FINAL_PRICE
-        xrt_per_round = wn_per_round / 1e9
-
-        # Revenue in ETH
-        revenue = xrt_per_round * XRT_PRICE_ETH
-
-        revenues.append(revenue)
-        costs.append(cost_per_round)
-        profits.append(revenue - cost_per_round)
-
-    revenues = np.array(revenues)
-    costs = np.array(costs)
-    profits = np.array(profits)
-
-    ax.plot(prios, revenues * 1000, color=C_GREEN, linewidth=2.5, label='XRT revenue (mETH/round)')
-    ax.plot(prios, costs * 1000, color=C_RED, linewidth=2.5, label='Gas cost (mETH/round)')
-    ax.fill_between(prios, revenues * 1000, costs * 1000,
-                    where=revenues > costs, alpha=0.12, color=C_GREEN, label='Profit zone')
-    ax.fill_between(prios, revenues * 1000, costs * 1000,
-                    where=revenues < costs, alpha=0.08, color=C_RED, label='Loss zone')
-
-    # Find crossover
-    crossover_idx = np.where(np.diff(np.sign(profits)))[0]
-    if len(crossover_idx) > 0:
-        cross_prio = prios[crossover_idx[0]]
+    eff_gp = BASE_FEE + prios  # gwei
+
+    # Cost per liability in ETH
+    cost_eth = eff_gp * 1e-9 * GAS_PER_LIABILITY
+    costs = cost_eth * 20  # 10 create + 10 finalize ~ 20 txs
+
+    # Steady-state SMMA converges to eff_gp
+    # But in practice, SMMA lags. Use SMMA after 30 rounds from start.
+    smma = eff_gp * 1e9 + (SMMA_START - eff_gp) * 1e9 * (1 - 1 / SMMA_PERIOD) ** (30 * 20)  # in wei
+
+    # XRT minted per round (gas per round * smma / finalPrice)
+    gas_per_round = GAS_PER_LIABILITY * 10  # 10 liabilities
+    # Actually: wn per liability = gas * smma * 1e9 / finalPrice
+    # But smma is already in wei (gwei * 1e9)
+    # wnFromGas: gas * gasPrice * 1e9 / finalPrice
+    # where gasPrice is in wei
+    wn_per_round = gas_per_round * smma * 1e9 / FINAL_PRICE
+    xrt_per_round = wn_per_round / 1e9
+
+    # Revenue in ETH
+    revenues = xrt_per_round * XRT_PRICE_ETH
+    profits = revenues - costs
+
+    rev_line, = ax.plot(prios, revenues * 1000, color=C_GREEN, linewidth=2.5, label='XRT revenue (mETH/round)')
+    cost_line, = ax.plot(prios, costs * 1000, color=C_RED, linewidth=2.5, label='Gas cost (mETH/round)')
+    profit_zone = ax.fill_between(prios, revenues * 1000, costs * 1000,
+                                  where=revenues > costs, alpha=0.12, color=C_GREEN, label='Profit zone')
+    loss_zone = ax.fill_between(prios, revenues * 1000, costs * 1000,
+                                where=revenues < costs, alpha=0.08, color=C_RED, label='Loss zone')
+
+    # Find crossover: revenue and cost are both linear in the priority fee,
+    # so their difference is monotonic and the sign change is a binary search,
+    # refined by linear interpolation between the bracketing samples
+    loss = -profits
+    i = np.searchsorted(loss if loss[0] <= loss[-1] else -loss, 0.0)
+    if 0 < i < len(prios):
+        l0, l1 = loss[i - 1], loss[i]
+        cross_prio = prios[i - 1] + (prios[i] - prios[i - 1]) * l0 / (l0 - l1)
         ax.axvline(x=cross_prio, color=C_GRAY, linestyle=':', alpha=0.7)
         ax.text(cross_prio + 0.3, ax.get_ylim()[1] * 0.85,
                 f'Break-even\nprio ~ {cross_prio:.1f} gwei',
@@ -554,21 +696,32 @@ def fig8_economic_model():
     ax.set_ylabel('mETH per round')
     ax.set_title('Economic Equilibrium: Emission Revenue vs Gas Cost\n(after 30 rounds of SMMA convergence)',
                  fontweight='bold')
-    ax.legend(fontsize=9, loc='upper left')
+    ax.legend(handles=[rev_line, cost_line, profit_zone, loss_zone], fontsize=9, loc='upper left')
     ax.set_xlim(0, 15)
 
-    fig.savefig(os.path.join(OUT, 'fig8_economic_model.png'))
-    plt.close()
+    _save(fig, 'fig8_economic_model.png')
     print('fig8 done')
 
 
+FIGURES = (
+    fig1_smma_dynamics,
+    fig2_xrt_per_round,
+    fig3_price_decay,
+    fig4_smma_convergence,
+    fig5_architecture,
+    fig6_feedback_loop,
+    fig7_gas_landscape,
+    fig8_economic_model,
+)
+
+
+def _invoke(fn):
+    fn()
+
+
 if __name__ == '__main__':
-    fig1_smma_dynamics()
-    fig2_xrt_per_round()
-    fig3_price_decay()
-    fig4_smma_convergence()
-    fig5_architecture()
-    fig6_feedback_loop()
-    fig7_gas_landscape()
-    fig8_economic_model()
+    # Figures share no state and each writes its own PNG, so they are
+    # rendered in separate processes (Agg holds the GIL while drawing)
+    with ProcessPoolExecutor(max_workers=len(FIGURES)) as ex:
+        list(ex.map(_invoke, FIGURES))
     print('\nAll figures generated in', OUT)
@@ -0,0 +1,116 @@
+"""Generate xrt_miner/_contracts_generated.py from the ABIs in xrt_miner/abi.py.
+
+Emits one plain function per contract method the miner calls, with the
+4-byte selector inlined, so hot-path calls skip web3's per-call ABI lookup.
+Every method gets a <contract>_<method>_data(*args) calldata builder; views
+also get <contract>_<method>(w3, address, *args), returning the decoded result. Re-run after changing abi.py or USED:
+
+    python scripts/gen_contracts.py
+"""
+
+from pathlib import Path
+import sys
+
+from eth_utils import function_signature_to_4byte_selector
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from xrt_miner import abi as contract_abi  # noqa: E402
+
+OUT = ROOT / "xrt_miner" / "_contracts_generated.py"
+
+# ABI name -> (function prefix, methods to generate)
+USED = {
+    "FACTORY_ABI": ("factory", (
+        "wnFromGas", "nonceOf", "gasPrice", "totalGasConsumed", "isLighthouse",
+    )),
+    "LIGHTHOUSE_ABI": ("lighthouse", (
+        "minimalStake", "stakes", "keepAliveBlock", "timeoutInBlocks",
+        "indexOf", "marker", "quota", "createLiability", "finalizeLiability",
+    )),
+    "XRT_ABI": ("xrt", ("balanceOf", "allowance", "approve")),
+    "UNISWAP_V2_ROUTER_ABI": ("uniswap", ("getAmountsOut", "getAmountsIn")),
+    "CHAINLINK_ABI": ("chainlink", ("latestAnswer",)),
+    "AUCTION_ABI": ("auction", ("finalPrice",)),
+    "MULTICALL3_ABI": ("multicall", (
+        "aggregate3", "getBlockNumber", "getEthBalance", "getCurrentBlockTimestamp",
+    )),
+}
+
+HEADER = '''\
+# Generated by scripts/gen_contracts.py from xrt_miner/abi.py -- do not edit.
+"""Selector-inlined calls for the contract methods the miner uses."""
+
+from eth_abi import decode, encode
+'''
+
+
+def _type(param) -> str:
+    """Canonical ABI type, with tuple components spelled out."""
+    kind = param["type"]
+    if kind.startswith("tuple"):
+        return f"({','.join(_type(c) for c in param['components'])}){kind[len('tuple'):]}"
+    return kind
+
+
+def _types(params) -> tuple[str, ...]:
+    return tuple(_type(p) for p in params)
+
+
+def _tuple(items) -> str:
+    body = ", ".join(items)
+    return f"({body},)" if len(items) == 1 else f"({body})"
+
+
+def _type_tuple(types) -> str:
+    return _tuple([f'"{t}"' for t in types])
+
+
+def _emit(prefix: str, fn) -> str:
+    name = fn["name"]
+    in_types = _types(fn["inputs"])
+    out_types = _types(fn["outputs"])
+    args = [p["name"] for p in fn["inputs"]]
+    signature = f"{name}({','.join(in_types)})"
+    selector = "".join(f"\\x{b:02x}" for b in function_signature_to_4byte_selector(signature))
+
+    data = f'b"{selector}"'
+    if args:
+        data += f" + encode({_type_tuple(in_types)}, {_tuple(args)})"
+
+    encoder = (
+        f"\n\ndef {prefix}_{name}_data({', '.join(args)}) -> bytes:\n"
+        f'    """{signature} calldata."""\n'
+        f"    return {data}\n"
+    )
+    if not fn.get("constant"):
+        return encoder
+
+    result = f'decode({_type_tuple(out_types)}, w3.eth.call({{"to": address, "data": data}}))'
+    if len(out_types) == 1:
+        result += "[0]"
+        if out_types[0] == "address":
+            result = f"to_checksum_address({result})"
+    return encoder + (
+        f"\n\ndef {prefix}_{name}({', '.join(['w3', 'address', *args])}):\n"
+        f'    """{signature} -> {", ".join(out_types)}"""\n'
+        f"    data = {data}\n"
+        f"    return {result}\n"
+    )
+
+
+def main():
+    body = []
+    for abi_name, (prefix, methods) in USED.items():
+        functions = {e["name"]: e for e in getattr(contract_abi, abi_name) if e["type"] == "function"}
+        body += [_emit(prefix, functions[m]) for m in methods]
+    header = HEADER
+    if any("to_checksum_address(" in part for part in body):
+        header += "from eth_utils import to_checksum_address\n"
+    OUT.write_text(header + "".join(body))
+    print(f"wrote {OUT.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
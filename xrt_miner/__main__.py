@@ -1,33 +1,99 @@
 """CLI entry point for xrt-classic-miner."""
 
+import copy
+import os
+import re
+from collections import OrderedDict
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
 import click
-import yaml
-from eth_account import Account
-from web3 import Web3
 
 from .abi import FACTORY_ADDRESS
-from .miner import XRTMiner
+
+if TYPE_CHECKING:
+    from .miner import XRTMiner
+
+# yaml, web3 and eth_account are imported where first used, so --help and
+# shell completion do not pay for web3's import chain
+
+# Unprefixed 32-byte hex private key (anything else given to --key is a keyfile path)
+_HEX_KEY = re.compile(r"[0-9a-fA-F]{64}").fullmatch
+
+_WEI_PER_ETH = Decimal(10**18)
+
+_CONFIG_CACHE_SIZE = 100
+# path -> (st_mtime, st_size, parsed config), least recently used first
+_CONFIG_CACHE: OrderedDict[str, tuple[float, int, dict]] = OrderedDict()
+
+
+def _read_config(path: str) -> dict:
+    """Parse the YAML config."""
+    import yaml
+    # libyaml's C loader when PyYAML was built against it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path) as f:
+        return yaml.load(f, Loader=loader) or {}
 
 
 def load_config(path: str | None) -> dict:
     if path is None:
         return {}
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    st = os.stat(path)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+        _CONFIG_CACHE.move_to_end(path)
+        return copy.deepcopy(cached[2])
+    cfg = _read_config(path)
+    _CONFIG_CACHE[path] = (st.st_mtime, st.st_size, cfg)
+    _CONFIG_CACHE.move_to_end(path)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    return copy.deepcopy(cfg)
+
+
+def _eth(wei: int) -> Decimal:
+    """wei -> ETH, as Web3.from_wei(wei, "ether") prints it."""
+    return Decimal(wei) / _WEI_PER_ETH if wei else Decimal(0)
+
+
+def _xrt(wn: int) -> str:
+    """wn -> XRT with 4 decimals, rounded in integers (no float round-trip)."""
+    whole, frac = divmod((wn + 50_000) // 100_000, 10_000)
+    return f"{whole}.{frac:04d}"
 
 
 def make_miner(rpc_url: str, private_key: str, factory: str,
                lighthouse: str | None,
-               priority_gwei: float = 1.0) -> XRTMiner:
+               priority_gwei: float = 1.0,
+               approve_max: bool = False) -> "XRTMiner":
+    from eth_account import Account
+    from web3 import Web3
+
+    from .miner import BROADCAST_WORKERS, XRTMiner
+    from .provider import http_provider
+
     if rpc_url.startswith("ws://") or rpc_url.startswith("wss://"):
         from web3 import Web3 as _W3
         w3 = _W3(Web3.LegacyWebSocketProvider(rpc_url))
     else:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # One keep-alive pool for the whole run, with a connection per broadcast
+        # worker so concurrent sends never queue for (or reopen) a socket
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=BROADCAST_WORKERS, pool_block=True,
+                              max_retries=Retry(total=3, backoff_factor=0.1))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        w3 = Web3(http_provider(rpc_url, session=session))
     if not w3.is_connected():
         raise click.ClickException(f"Cannot connect to RPC: {rpc_url}")
     account = Account.from_key(private_key)
-    return XRTMiner(w3, account, factory, lighthouse, priority_gwei=priority_gwei)
+    return XRTMiner(w3, account, factory, lighthouse, priority_gwei=priority_gwei,
+                    approve_max=approve_max)
 
 
 @click.group()
@@ -36,8 +102,9 @@ def make_miner(rpc_url: str, private_key: str, factory: str,
 @click.option("--config", "config_path", default=None, type=click.Path(exists=True), help="Path to config.yaml")
 @click.option("--lighthouse", default=None, help="Lighthouse contract address")
 @click.option("--priority-fee", "priority_gwei", default=1.0, type=float, help="Priority fee in gwei (default: 1.0)")
+@click.option("--approve-max", is_flag=True, default=False, help="Approve unlimited XRT once per spender instead of the exact amount each time")
 @click.pass_context
-def cli(ctx, rpc, key, config_path, lighthouse, priority_gwei):
+def cli(ctx, rpc, key, config_path, lighthouse, priority_gwei, approve_max):
     """XRT Classic Miner — mine XRT via Robonomics liability emission."""
     cfg = load_config(config_path)
     ctx.ensure_object(dict)
@@ -46,12 +113,13 @@ def cli(ctx, rpc, key, config_path, lighthouse, priority_gwei):
     ctx.obj["lighthouse"] = lighthouse or cfg.get("lighthouse") or None
     ctx.obj["factory"] = cfg.get("factory", FACTORY_ADDRESS)
     ctx.obj["priority_gwei"] = priority_gwei
+    ctx.obj["approve_max"] = approve_max or bool(cfg.get("approve_max", False))
     ctx.obj["config"] = cfg
 
     raw_key = key or cfg.get("private_key")
     if raw_key and not raw_key.startswith("0x"):
         # Could be a hex key without prefix or a file path
-        if len(raw_key) == 64 and all(c in "0123456789abcdefABCDEF" for c in raw_key):
+        if _HEX_KEY(raw_key):
             raw_key = "0x" + raw_key
         else:
             with open(raw_key) as f:
@@ -59,7 +127,7 @@ def cli(ctx, rpc, key, config_path, lighthouse, priority_gwei):
     ctx.obj["private_key"] = raw_key
 
 
-def get_miner(ctx) -> XRTMiner:
+def get_miner(ctx) -> "XRTMiner":
     obj = ctx.obj
     if not obj.get("rpc_url"):
         raise click.ClickException("RPC URL required (--rpc or config rpc_url)")
@@ -69,6 +137,7 @@ def get_miner(ctx) -> XRTMiner:
         obj["rpc_url"], obj["private_key"], obj["factory"],
         obj.get("lighthouse"),
         priority_gwei=obj.get("priority_gwei", 1.0),
+        approve_max=obj.get("approve_max", False),
     )
 
 
@@ -93,12 +162,17 @@ def setup(ctx, name, stake_amount, minimal_stake, timeout_blocks):
 @click.option("--objective", default=None, help="Objective bytes (hex)")
 @click.option("--min-margin", default=0.0, type=float, help="Minimum profit margin %% to mine (default: 0 = break-even)")
 @click.option("--force", is_flag=True, default=False, help="Skip profitability check")
+@click.option("--batch-read", is_flag=True, default=False, help="Read preflight inputs with one Multicall3 call per iteration")
+@click.option("--dry-run", is_flag=True, default=False, help="Print one preflight read and exit without sending transactions")
 @click.pass_context
-def mine(ctx, count, model, objective, min_margin, force):
+def mine(ctx, count, model, objective, min_margin, force, batch_read, dry_run):
     """Start mining XRT via liability creation & finalization."""
     miner = get_miner(ctx)
     if not miner.lighthouse:
         raise click.ClickException("Lighthouse address required (--lighthouse or config)")
+    if dry_run:
+        _echo_preflight(miner)
+        return
 
     model_bytes = bytes.fromhex(model) if model else None
     objective_bytes = bytes.fromhex(objective) if objective else None
@@ -113,16 +187,17 @@ def mine(ctx, count, model, objective, min_margin, force):
         click.echo("Count: infinite (Ctrl+C to stop)")
 
     miner.mine_loop(count=count, model=model_bytes, objective=objective_bytes,
-                    min_margin=min_margin, force=force)
+                    min_margin=min_margin, force=force, batch_read=batch_read)
 
 
 @cli.command()
-@click.option("--batch-size", default=20, type=int, help="Liabilities per batch (default: 20)")
-@click.option("--budget", default=1.0, type=float, help="ETH budget to spend on gas (default: 1.0)")
-@click.option("--sell-every", default=1000.0, type=float, help="Sell XRT every N XRT minted (default: 1000)")
-@click.option("--slippage", default=5.0, type=float, help="Slippage tolerance %% for sells (default: 5)")
+@click.option("--batch-size", envvar="XRT_BATCH_SIZE", default=20, type=int, help="Liabilities per batch (default: 20)")
+@click.option("--budget", envvar="XRT_BUDGET", default=1.0, type=float, help="ETH budget to spend on gas (default: 1.0)")
+@click.option("--sell-every", envvar="XRT_SELL_EVERY", default=1000.0, type=float, help="Sell XRT every N XRT minted (default: 1000)")
+@click.option("--slippage", envvar="XRT_SLIPPAGE", default=5.0, type=float, help="Slippage tolerance %% for sells (default: 5)")
+@click.option("--nonce-contingent", default=1, type=int, help="Send phases per account-nonce fetch; nonces in between are assigned locally, 0 = fetch once (default: 1)")
 @click.pass_context
-def batch(ctx, batch_size, budget, sell_every, slippage):
+def batch(ctx, batch_size, budget, sell_every, slippage, nonce_contingent):
     """Batch mine: create+finalize N liabilities per round, auto-sell XRT."""
     miner = get_miner(ctx)
     if not miner.lighthouse:
@@ -132,30 +207,66 @@ def batch(ctx, batch_size, budget, sell_every, slippage):
         eth_budget=budget,
         sell_every_xrt=sell_every,
         slippage=slippage / 100,
+        nonce_contingent=nonce_contingent,
     )
 
 
 @cli.command()
-@click.option("--batch-size", default=20, type=int, help="Liabilities per batch (default: 20)")
-@click.option("--budget", default=1.0, type=float, help="ETH budget to spend on gas (default: 1.0)")
-@click.option("--sell-every", default=1000.0, type=float, help="Sell XRT every N XRT minted (default: 1000)")
-@click.option("--slippage", default=5.0, type=float, help="Slippage tolerance %% (default: 5)")
+@click.option("--batch-size", envvar="XRT_BATCH_SIZE", default=20, type=int, help="Liabilities per batch (default: 20)")
+@click.option("--budget", envvar="XRT_BUDGET", default=1.0, type=float, help="ETH budget to spend on gas (default: 1.0)")
+@click.option("--sell-every", envvar="XRT_SELL_EVERY", default=1000.0, type=float, help="Sell XRT every N XRT minted (default: 1000)")
+@click.option("--slippage", envvar="XRT_SLIPPAGE", default=5.0, type=float, help="Slippage tolerance %% (default: 5)")
 @click.option("--max-cost", default=0.0, type=float, help="Max cost per liability in USD (0 = no limit)")
+@click.option("--nonce-contingent", default=1, type=int, help="Send phases per account-nonce fetch; nonces in between are assigned locally, 0 = fetch once (default: 1)")
+@click.option("--batch-read", is_flag=True, default=False, help="Read preflight inputs with one Multicall3 call per iteration")
+@click.option("--dry-run", is_flag=True, default=False, help="Print one preflight read and exit without sending transactions")
+@click.option("--adaptive", is_flag=True, default=False, help="Grow the batch by 1 after clean rounds and halve it after reverts, up to --batch-size")
 @click.pass_context
-def pipeline(ctx, batch_size, budget, sell_every, slippage, max_cost):
+def pipeline(ctx, batch_size, budget, sell_every, slippage, max_cost, nonce_contingent,
+             batch_read, dry_run, adaptive):
     """Pipeline mine: finalize(prev)+create(next) in same block for 2x speed."""
     miner = get_miner(ctx)
     if not miner.lighthouse:
         raise click.ClickException("Lighthouse address required (--lighthouse or config)")
+    if dry_run:
+        snapshot = _echo_preflight(miner)
+        if max_cost > 0:
+            size = miner._effective_batch_size(batch_size, max_cost,
+                                               snapshot["gas_price"], snapshot["eth_usd"])
+            click.echo(f"Batch size at ${max_cost:.2f}/liability: {size}/{batch_size}")
+        return
     miner.mine_pipeline_loop(
         batch_size=batch_size,
         eth_budget=budget,
         sell_every_xrt=sell_every,
         slippage=slippage / 100,
         max_cost_usd=max_cost,
+        nonce_contingent=nonce_contingent,
+        batch_read=batch_read,
+        adaptive=adaptive,
     )
 
 
+def _echo_preflight(miner) -> dict:
+    """Print one preflight() read and the profitability it implies."""
+    snapshot = miner.preflight()
+    prof = miner.check_profitability(
+        gas_price=snapshot["gas_price"], xrt_minted=snapshot["xrt_minted"],
+    )
+    eth_usd = snapshot["eth_usd"]
+    click.echo("\n".join([
+        f"Gas price:           {snapshot['gas_price'] / 1e9:.2f} gwei",
+        f"Factory gas price:   {snapshot['factory_gas_price']}",
+        f"Total gas consumed:  {snapshot['total_gas_consumed']}",
+        f"Auction final price: {snapshot['auction_final_price']}",
+        f"ETH/USD:             {'n/a' if eth_usd is None else f'{eth_usd:.2f}'}",
+        f"XRT per cycle:       {prof['xrt_minted']} wn ({_xrt(prof['xrt_minted'])} XRT)",
+        f"Margin:              {prof['margin']:.1f}% "
+        f"({'PROFITABLE' if prof['profitable'] else 'UNPROFITABLE'})",
+    ]))
+    return snapshot
+
+
 @cli.command()
 @click.pass_context
 def status(ctx):
@@ -163,37 +274,43 @@ def status(ctx):
     miner = get_miner(ctx)
     info = miner.status()
 
-    click.echo(f"Account:             {info['address']}")
-    click.echo(f"ETH balance:         {Web3.from_wei(info['eth_balance'], 'ether')} ETH")
-    click.echo(f"XRT token:           {info['xrt_address']}")
-    click.echo(f"XRT balance:         {info['xrt_balance']} wn ({info['xrt_balance'] / 1e9:.4f} XRT)")
-    click.echo(f"Factory:             {info['factory']}")
-    click.echo(f"Factory gas price:   {info['factory_gas_price']}")
-    click.echo(f"Total gas consumed:  {info['total_gas_consumed']}")
-    click.echo(f"Est. XRT per cycle:  {info['estimated_xrt_per_cycle']} wn")
-
     prof = info["profitability"]
-    click.echo(f"\nProfitability (est. {prof['gas_estimate']} gas/cycle):")
-    click.echo(f"  Gas price:         {prof['gas_price_gwei']:.2f} gwei")
-    click.echo(f"  Gas cost:          {prof['gas_cost_eth']:.6f} ETH")
-    click.echo(f"  XRT minted:        {prof['xrt_minted']} wn")
-    click.echo(f"  XRT sell value:    {prof['xrt_value_eth']:.6f} ETH")
-    click.echo(f"  Profit:            {prof['profit_eth']:.6f} ETH")
-    click.echo(f"  Margin:            {prof['margin']:.1f}%")
-    click.echo(f"  Verdict:           {'PROFITABLE' if prof['profitable'] else 'UNPROFITABLE'}")
+    lines = [
+        f"Account:             {info['address']}",
+        f"ETH balance:         {_eth(info['eth_balance'])} ETH",
+        f"XRT token:           {info['xrt_address']}",
+        f"XRT balance:         {info['xrt_balance']} wn ({_xrt(info['xrt_balance'])} XRT)",
+        f"Factory:             {info['factory']}",
+        f"Factory gas price:   {info['factory_gas_price']}",
+        f"Total gas consumed:  {info['total_gas_consumed']}",
+        f"Est. XRT per cycle:  {info['estimated_xrt_per_cycle']} wn",
+        f"\nProfitability (est. {prof['gas_estimate']} gas/cycle):",
+        f"  Gas price:         {prof['gas_price_gwei']:.2f} gwei",
+        f"  Gas cost:          {prof['gas_cost_eth']:.6f} ETH",
+        f"  XRT minted:        {prof['xrt_minted']} wn",
+        f"  XRT sell value:    {prof['xrt_value_eth']:.6f} ETH",
+        f"  Profit:            {prof['profit_eth']:.6f} ETH",
+        f"  Margin:            {prof['margin']:.1f}%",
+        f"  Verdict:           {'PROFITABLE' if prof['profitable'] else 'UNPROFITABLE'}",
+    ]
 
     if "lighthouse" in info:
-        click.echo(f"\nLighthouse:          {info['lighthouse']}")
-        click.echo(f"  Is valid:          {info['is_lighthouse']}")
-        click.echo(f"  Minimal stake:     {info['minimal_stake']} wn")
-        click.echo(f"  Timeout:           {info['timeout_blocks']} blocks")
-        click.echo(f"  My stake:          {info['my_stake']} wn")
-        click.echo(f"  My index:          {info['my_index']}")
-        click.echo(f"  Current marker:    {info['marker']}")
-        click.echo(f"  Quota:             {info['quota']}")
-        click.echo(f"  Keep-alive block:  {info['keep_alive_block']}")
+        lines += [
+            f"\nLighthouse:          {info['lighthouse']}",
+            f"  Is valid:          {info['is_lighthouse']}",
+            f"  Minimal stake:     {info['minimal_stake']} wn",
+            f"  Timeout:           {info['timeout_blocks']} blocks",
+            f"  My stake:          {info['my_stake']} wn",
+            f"  My index:          {info['my_index']}",
+            f"  Current marker:    {info['marker']}",
+            f"  Quota:             {info['quota']}",
+            f"  Keep-alive block:  {info['keep_alive_block']}",
+        ]
     else:
-        click.echo("\nNo lighthouse configured.")
+        lines.append("\nNo lighthouse configured.")
+
+    # One write for the whole report
+    click.echo("\n".join(lines))
 
 
 @cli.command("stake")
@@ -218,7 +335,7 @@ def buy_cmd(ctx, amount, slippage):
     click.echo(f"Buying {amount} XRT ({wn_amount} wn)")
     miner.swap_eth_to_xrt(wn_amount, slippage=slippage / 100)
     xrt_bal = miner.xrt.functions.balanceOf(miner.address).call()
-    click.echo(f"XRT balance: {xrt_bal} wn ({xrt_bal/1e9:.4f} XRT)")
+    click.echo(f"XRT balance: {xrt_bal} wn ({_xrt(xrt_bal)} XRT)")
 
 
 @cli.command("swap")
@@ -232,7 +349,7 @@ def swap_cmd(ctx, amount, slippage):
         amount = miner.xrt.functions.balanceOf(miner.address).call()
         if amount == 0:
             raise click.ClickException("No XRT to swap")
-    click.echo(f"Swapping {amount} wn ({amount/1e9:.4f} XRT)")
+    click.echo(f"Swapping {amount} wn ({_xrt(amount)} XRT)")
     miner.swap_xrt_to_eth(amount, slippage=slippage / 100)
 
 
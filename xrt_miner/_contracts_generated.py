@@ -0,0 +1,255 @@
+# Generated by scripts/gen_contracts.py from xrt_miner/abi.py -- do not edit.
+"""Selector-inlined calls for the contract methods the miner uses."""
+
+from eth_abi import decode, encode
+
+
+def factory_wnFromGas_data(_gas) -> bytes:
+    """wnFromGas(uint256) calldata."""
+    return b"\xd6\x4d\x13\x6d" + encode(("uint256",), (_gas,))
+
+
+def factory_wnFromGas(w3, address, _gas):
+    """wnFromGas(uint256) -> uint256"""
+    data = b"\xd6\x4d\x13\x6d" + encode(("uint256",), (_gas,))
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def factory_nonceOf_data(_account) -> bytes:
+    """nonceOf(address) calldata."""
+    return b"\xed\x2a\x2d\x64" + encode(("address",), (_account,))
+
+
+def factory_nonceOf(w3, address, _account):
+    """nonceOf(address) -> uint256"""
+    data = b"\xed\x2a\x2d\x64" + encode(("address",), (_account,))
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def factory_gasPrice_data() -> bytes:
+    """gasPrice() calldata."""
+    return b"\xfe\x17\x3b\x97"
+
+
+def factory_gasPrice(w3, address):
+    """gasPrice() -> uint256"""
+    data = b"\xfe\x17\x3b\x97"
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def factory_totalGasConsumed_data() -> bytes:
+    """totalGasConsumed() calldata."""
+    return b"\xd8\xfe\x92\x50"
+
+
+def factory_totalGasConsumed(w3, address):
+    """totalGasConsumed() -> uint256"""
+    data = b"\xd8\xfe\x92\x50"
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def factory_isLighthouse_data(_lighthouse) -> bytes:
+    """isLighthouse(address) calldata."""
+    return b"\xbb\xb6\x63\x0f" + encode(("address",), (_lighthouse,))
+
+
+def factory_isLighthouse(w3, address, _lighthouse):
+    """isLighthouse(address) -> bool"""
+    data = b"\xbb\xb6\x63\x0f" + encode(("address",), (_lighthouse,))
+    return decode(("bool",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def lighthouse_minimalStake_data() -> bytes:
+    """minimalStake() calldata."""
+    return b"\x9e\xc4\x1a\x2d"
+
+
+def lighthouse_minimalStake(w3, address):
+    """minimalStake() -> uint256"""
+    data = b"\x9e\xc4\x1a\x2d"
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def lighthouse_stakes_data(_provider) -> bytes:
+    """stakes(address) calldata."""
+    return b"\x16\x93\x4f\xc4" + encode(("address",), (_provider,))
+
+
+def lighthouse_stakes(w3, address, _provider):
+    """stakes(address) -> uint256"""
+    data = b"\x16\x93\x4f\xc4" + encode(("address",), (_provider,))
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def lighthouse_keepAliveBlock_data() -> bytes:
+    """keepAliveBlock() calldata."""
+    return b"\x4e\xd7\x5d\xed"
+
+
+def lighthouse_keepAliveBlock(w3, address):
+    """keepAliveBlock() -> uint256"""
+    data = b"\x4e\xd7\x5d\xed"
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def lighthouse_timeoutInBlocks_data() -> bytes:
+    """timeoutInBlocks() calldata."""
+    return b"\x67\x8b\xd1\x69"
+
+
+def lighthouse_timeoutInBlocks(w3, address):
+    """timeoutInBlocks() -> uint256"""
+    data = b"\x67\x8b\xd1\x69"
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def lighthouse_indexOf_data(_provider) -> bytes:
+    """indexOf(address) calldata."""
+    return b"\xfd\x6a\xad\x25" + encode(("address",), (_provider,))
+
+
+def lighthouse_indexOf(w3, address, _provider):
+    """indexOf(address) -> uint256"""
+    data = b"\xfd\x6a\xad\x25" + encode(("address",), (_provider,))
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def lighthouse_marker_data() -> bytes:
+    """marker() calldata."""
+    return b"\x3a\xcd\xdf\xc1"
+
+
+def lighthouse_marker(w3, address):
+    """marker() -> uint256"""
+    data = b"\x3a\xcd\xdf\xc1"
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def lighthouse_quota_data() -> bytes:
+    """quota() calldata."""
+    return b"\xce\xbe\x09\xc9"
+
+
+def lighthouse_quota(w3, address):
+    """quota() -> uint256"""
+    data = b"\xce\xbe\x09\xc9"
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def lighthouse_createLiability_data(_demand, _offer) -> bytes:
+    """createLiability(bytes,bytes) calldata."""
+    return b"\xd2\xb9\x62\xf2" + encode(("bytes", "bytes"), (_demand, _offer))
+
+
+def lighthouse_finalizeLiability_data(_liability, _result, _success, _signature) -> bytes:
+    """finalizeLiability(address,bytes,bool,bytes) calldata."""
+    return b"\x56\x3e\x52\xd5" + encode(("address", "bytes", "bool", "bytes"), (_liability, _result, _success, _signature))
+
+
+def xrt_balanceOf_data(_owner) -> bytes:
+    """balanceOf(address) calldata."""
+    return b"\x70\xa0\x82\x31" + encode(("address",), (_owner,))
+
+
+def xrt_balanceOf(w3, address, _owner):
+    """balanceOf(address) -> uint256"""
+    data = b"\x70\xa0\x82\x31" + encode(("address",), (_owner,))
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def xrt_allowance_data(_owner, _spender) -> bytes:
+    """allowance(address,address) calldata."""
+    return b"\xdd\x62\xed\x3e" + encode(("address", "address"), (_owner, _spender))
+
+
+def xrt_allowance(w3, address, _owner, _spender):
+    """allowance(address,address) -> uint256"""
+    data = b"\xdd\x62\xed\x3e" + encode(("address", "address"), (_owner, _spender))
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def xrt_approve_data(_spender, _value) -> bytes:
+    """approve(address,uint256) calldata."""
+    return b"\x09\x5e\xa7\xb3" + encode(("address", "uint256"), (_spender, _value))
+
+
+def uniswap_getAmountsOut_data(amountIn, path) -> bytes:
+    """getAmountsOut(uint256,address[]) calldata."""
+    return b"\xd0\x6c\xa6\x1f" + encode(("uint256", "address[]"), (amountIn, path))
+
+
+def uniswap_getAmountsOut(w3, address, amountIn, path):
+    """getAmountsOut(uint256,address[]) -> uint256[]"""
+    data = b"\xd0\x6c\xa6\x1f" + encode(("uint256", "address[]"), (amountIn, path))
+    return decode(("uint256[]",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def uniswap_getAmountsIn_data(amountOut, path) -> bytes:
+    """getAmountsIn(uint256,address[]) calldata."""
+    return b"\x1f\x00\xca\x74" + encode(("uint256", "address[]"), (amountOut, path))
+
+
+def uniswap_getAmountsIn(w3, address, amountOut, path):
+    """getAmountsIn(uint256,address[]) -> uint256[]"""
+    data = b"\x1f\x00\xca\x74" + encode(("uint256", "address[]"), (amountOut, path))
+    return decode(("uint256[]",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def chainlink_latestAnswer_data() -> bytes:
+    """latestAnswer() calldata."""
+    return b"\x50\xd2\x5b\xcd"
+
+
+def chainlink_latestAnswer(w3, address):
+    """latestAnswer() -> int256"""
+    data = b"\x50\xd2\x5b\xcd"
+    return decode(("int256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def auction_finalPrice_data() -> bytes:
+    """finalPrice() calldata."""
+    return b"\xa6\xb5\x13\xee"
+
+
+def auction_finalPrice(w3, address):
+    """finalPrice() -> uint256"""
+    data = b"\xa6\xb5\x13\xee"
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def multicall_aggregate3_data(calls) -> bytes:
+    """aggregate3((address,bool,bytes)[]) calldata."""
+    return b"\x82\xad\x56\xcb" + encode(("(address,bool,bytes)[]",), (calls,))
+
+
+def multicall_getBlockNumber_data() -> bytes:
+    """getBlockNumber() calldata."""
+    return b"\x42\xcb\xb1\x5c"
+
+
+def multicall_getBlockNumber(w3, address):
+    """getBlockNumber() -> uint256"""
+    data = b"\x42\xcb\xb1\x5c"
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def multicall_getEthBalance_data(addr) -> bytes:
+    """getEthBalance(address) calldata."""
+    return b"\x4d\x23\x01\xcc" + encode(("address",), (addr,))
+
+
+def multicall_getEthBalance(w3, address, addr):
+    """getEthBalance(address) -> uint256"""
+    data = b"\x4d\x23\x01\xcc" + encode(("address",), (addr,))
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
+
+
+def multicall_getCurrentBlockTimestamp_data() -> bytes:
+    """getCurrentBlockTimestamp() calldata."""
+    return b"\x0f\x28\xc9\x7d"
+
+
+def multicall_getCurrentBlockTimestamp(w3, address):
+    """getCurrentBlockTimestamp() -> uint256"""
+    data = b"\x0f\x28\xc9\x7d"
+    return decode(("uint256",), w3.eth.call({"to": address, "data": data}))[0]
@@ -1,12 +1,48 @@
 """Minimal contract ABIs and mainnet addresses for Robonomics v5."""
 
-# Ethereum Mainnet addresses
+import sys
+from types import MappingProxyType
+
+
+# Frozen fragments by content, so the many identical parameter/output dicts
+# ({"name": "", "type": "uint256"}, ...) across the ABIs become one object.
+_POOL = {}
+
+
+def _pool_key(value):
+    # children are already pooled, so identity stands in for their content
+    return id(value) if isinstance(value, (MappingProxyType, tuple)) else value
+
+
+def _freeze(node):
+    """Read-only copy of an ABI: lists -> tuples, dicts -> mappingproxy, strings interned.
+
+    Equal fragments are shared through _POOL.
+    """
+    if isinstance(node, dict):
+        items = {sys.intern(k): _freeze(v) for k, v in node.items()}
+        key = (dict, tuple((k, _pool_key(v)) for k, v in items.items()))
+        frozen = MappingProxyType(items)
+    elif isinstance(node, list):
+        items = tuple(_freeze(v) for v in node)
+        key = (tuple, tuple(_pool_key(v) for v in items))
+        frozen = items
+    elif isinstance(node, str):
+        return sys.intern(node)
+    else:
+        return node
+    return _POOL.setdefault(key, frozen)
+
+
+# Ethereum Mainnet addresses, EIP-55 checksummed so web3 takes them as-is
 FACTORY_ADDRESS = "0x7e384AD1FE06747594a6102EE5b377b273DC1225"
-XRT_ADDRESS = "0x7de91b204c1c737bcee6f000aaa6569cf7061cb7"
+XRT_ADDRESS = "0x7dE91B204C1C737bcEe6F000AAA6569Cf7061cb7"
 WETH_ADDRESS = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
 UNISWAP_V2_ROUTER = "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
 CHAINLINK_ETH_USD = "0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419"
-AUCTION_ADDRESS = "0x86da63b3341924c88baa5adbb2b8f930cc02e586"
+AUCTION_ADDRESS = "0x86Da63B3341924c88BaA5adbB2b8F930cc02E586"
+# Same address on mainnet and most L2s
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 
 FACTORY_ABI = [
     {
@@ -297,6 +333,58 @@ CHAINLINK_ABI = [
     },
 ]
 
+MULTICALL3_ABI = [
+    {
+        "constant": False,
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            },
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            },
+        ],
+        "type": "function",
+        "payable": True,
+        "stateMutability": "payable",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "getBlockNumber",
+        "outputs": [{"name": "blockNumber", "type": "uint256"}],
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [{"name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "getCurrentBlockTimestamp",
+        "outputs": [{"name": "timestamp", "type": "uint256"}],
+        "type": "function",
+    },
+]
+
 LIABILITY_ABI = [
     {
         "constant": True,
@@ -320,3 +408,14 @@ LIABILITY_ABI = [
         "type": "function",
     },
 ]
+
+# web3 only reads ABIs; frozen, they can be shared safely between contract classes.
+# MULTICALL3_ABI stays mutable: web3 copy.copy()s tuple parameters to rewrite
+# their components, which mappingproxy does not support.
+FACTORY_ABI = _freeze(FACTORY_ABI)
+LIGHTHOUSE_ABI = _freeze(LIGHTHOUSE_ABI)
+XRT_ABI = _freeze(XRT_ABI)
+UNISWAP_V2_ROUTER_ABI = _freeze(UNISWAP_V2_ROUTER_ABI)
+AUCTION_ABI = _freeze(AUCTION_ABI)
+CHAINLINK_ABI = _freeze(CHAINLINK_ABI)
+LIABILITY_ABI = _freeze(LIABILITY_ABI)
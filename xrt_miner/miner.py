@@ -2,101 +2,315 @@
 
 import os
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
+from eth_abi import decode
+from eth_abi.exceptions import DecodingError
 from web3 import Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.exceptions import TimeExhausted, TransactionNotFound
 
+from . import _contracts_generated as contracts
 from . import abi as contract_abi
 from . import signer
 
 
 ESTIMATED_GAS_PER_CYCLE = 1_100_000  # calibrated after first batch
-TRANSFER_TOPIC = Web3.keccak(text="Transfer(address,address,uint256)").hex()
+# Event topics as bytes, as in receipt logs
+TRANSFER_TOPIC = Web3.keccak(text="Transfer(address,address,uint256)")
+NEW_LIABILITY_TOPIC = Web3.keccak(text="NewLiability(address)")
 # Observed gas per single liability (from pipeline data)
 GAS_PER_CREATE = 790_000
 GAS_PER_FINALIZE = 268_000
 GAS_PER_LIABILITY = GAS_PER_CREATE + GAS_PER_FINALIZE
+RECEIPT_POLL_SECONDS = 1.0
+# Single sends (mine_once, stake, swaps) wait on the critical path: poll as
+# often as web3's wait_for_transaction_receipt does
+SEND_POLL_SECONDS = 0.1
+BROADCAST_WORKERS = 16  # concurrent send_raw_transaction requests
+BLOCK_TIME_SECONDS = 12
+# maxFeePerGas = next base fee * headroom + priority: covers one full-block base-fee rise (12.5%)
+BASE_FEE_HEADROOM = 1.25
+BLOCK_POLL_SECONDS = 3
+# Lighthouse minimalStake / timeoutInBlocks are fixed at creation: re-read them this rarely
+LIGHTHOUSE_PARAMS_TTL_BLOCKS = 50
+# wnFromGas moves only when a liability is finalized on the factory: reuse a read
+# for this many blocks, or until we send a tx ourselves
+EMISSION_TTL_BLOCKS = 5
+MAX_UINT256 = 2**256 - 1
+# mine_loop re-checks an unprofitable market after this wait, doubling it
+# (up to the cap) while the margin keeps getting worse
+UNPROFITABLE_WAIT_SECONDS = 60
+UNPROFITABLE_WAIT_MAX_SECONDS = 300
+RANDOM_FIELD_BYTES = 34  # model / objective / result payload length
+# Web3 -> {ABI name: contract class}; ABIs are processed once per connection,
+# however many XRTMiner instances share it
+_CONTRACT_CLASSES: "weakref.WeakKeyDictionary[Web3, dict]" = weakref.WeakKeyDictionary()
 
 
 class XRTMiner:
     def __init__(self, w3: Web3, account, factory_address: str,
                  lighthouse_address: str | None = None,
-                 priority_gwei: float = 1.0):
+                 priority_gwei: float = 1.0, eth_usd_ttl: float = 30.0,
+                 approve_max: bool = False):
         self.w3 = w3
         self.account = account
         self.address = account.address
         self.private_key = account.key.hex()
         self.priority_gwei = priority_gwei
-
-        self.factory = w3.eth.contract(
-            address=Web3.to_checksum_address(factory_address),
-            abi=contract_abi.FACTORY_ABI,
-        )
+        # Account nonces are fetched from the node (pending tag) once per
+        # nonce_contingent reservations and handed out locally in between;
+        # 0 fetches once and only refetches after a failed send
+        self.nonce_contingent = 1
+        self._next_nonce = None
+        self._nonce_reservations_left = 0
+        # Next factory.nonceOf(address), tracked the same way (see _reserve_factory_nonces)
+        self._factory_nonce = None
+        self._chain_id = None
+        # Pipeline create deadline: (block read, time.monotonic() of the read, deadline block)
+        self._deadline = None
+        # Receipt polling: "batch" (JSON-RPC batches, HTTP) or "blocks"
+        # (eth_getBlockReceipts per new block, for websocket nodes)
+        self._receipt_strategy = "blocks" if "websocket" in type(w3.provider).__name__.lower() else "batch"
+        # Chainlink ETH/USD moves on a block-time scale: reuse a read for eth_usd_ttl seconds
+        self.eth_usd_ttl = eth_usd_ttl
+        self._eth_usd_cache = (float("-inf"), 0.0)  # (time.monotonic() of read, USD per ETH)
+        # XRT allowance per spender as last read/approved, minus what we spent since;
+        # approve_max approves 2**256-1 once instead of the exact amount each time
+        self.approve_max = approve_max
+        self._allowances: dict[str, int] = {}
+        # Slow-moving views: (name, *args) -> (time.monotonic() of read, value), see _cached_view
+        self._view_cache: dict[tuple, tuple[float, object]] = {}
+
+        self.factory = self._contract("FACTORY_ABI", factory_address)
 
         real_xrt = self.factory.functions.xrt().call()
-        self.xrt = w3.eth.contract(
-            address=Web3.to_checksum_address(real_xrt),
-            abi=contract_abi.XRT_ABI,
-        )
+        self.xrt = self._contract("XRT_ABI", real_xrt)
         click_echo(f"Factory XRT: {self.xrt.address}")
 
-        self.uniswap = w3.eth.contract(
-            address=Web3.to_checksum_address(contract_abi.UNISWAP_V2_ROUTER),
-            abi=contract_abi.UNISWAP_V2_ROUTER_ABI,
-        )
-        self.chainlink = w3.eth.contract(
-            address=Web3.to_checksum_address(contract_abi.CHAINLINK_ETH_USD),
-            abi=contract_abi.CHAINLINK_ABI,
-        )
+        self.uniswap = self._contract("UNISWAP_V2_ROUTER_ABI", contract_abi.UNISWAP_V2_ROUTER)
+        self.chainlink = self._contract("CHAINLINK_ABI", contract_abi.CHAINLINK_ETH_USD)
+        self.auction_address = contract_abi.AUCTION_ADDRESS
+
+        self.sell_path = [self.xrt.address, contract_abi.WETH_ADDRESS]
+        self.buy_path = [contract_abi.WETH_ADDRESS, self.xrt.address]
 
         self.lighthouse = None
         self.lighthouse_address = None
         if lighthouse_address:
             self.set_lighthouse(lighthouse_address)
 
+    def _contract(self, abi_name: str, address: str):
+        """Bind contract_abi.<abi_name> to address, building its contract class once per w3."""
+        classes = _CONTRACT_CLASSES.setdefault(self.w3, {})
+        cls = classes.get(abi_name)
+        if cls is None:
+            cls = classes[abi_name] = self.w3.eth.contract(abi=getattr(contract_abi, abi_name))
+        return cls(address=Web3.to_checksum_address(address))
+
     def set_lighthouse(self, address: str):
-        self.lighthouse_address = Web3.to_checksum_address(address)
-        self.lighthouse = self.w3.eth.contract(
-            address=self.lighthouse_address,
-            abi=contract_abi.LIGHTHOUSE_ABI,
+        self.lighthouse = self._contract("LIGHTHOUSE_ABI", address)
+        self.lighthouse_address = self.lighthouse.address
+        self._view_cache.clear()
+
+    def _cached_view(self, key: tuple, read, ttl_blocks: int):
+        """read() memoized under key for about ttl_blocks blocks (BLOCK_TIME_SECONDS each).
+        Entries are dropped early by set_lighthouse() and, for emission views, by our own sends."""
+        now = time.monotonic()
+        cached = self._view_cache.get(key)
+        if cached is not None and now - cached[0] < ttl_blocks * BLOCK_TIME_SECONDS:
+            return cached[1]
+        value = read()
+        self._view_cache[key] = (now, value)
+        return value
+
+    def _forget_emission_views(self):
+        """Drop cached wnFromGas reads: our finalizes move the factory's gas price SMMA."""
+        for key in [key for key in self._view_cache if key[0] == "wnFromGas"]:
+            del self._view_cache[key]
+
+    def _wn_from_gas(self, gas: int) -> int:
+        return self._cached_view(
+            ("wnFromGas", gas),
+            lambda: contracts.factory_wnFromGas(self.w3, self.factory.address, gas),
+            EMISSION_TTL_BLOCKS,
+        )
+
+    def _lighthouse_param(self, name: str) -> int:
+        """lighthouse.minimalStake() / timeoutInBlocks(), cached for LIGHTHOUSE_PARAMS_TTL_BLOCKS."""
+        read = getattr(contracts, f"lighthouse_{name}")
+        return self._cached_view(
+            (name,), lambda: read(self.w3, self.lighthouse.address), LIGHTHOUSE_PARAMS_TTL_BLOCKS,
         )
 
     def xrt_to_eth(self, xrt_amount: int) -> int:
         """Get ETH value of xrt_amount (in wn) via Uniswap V2. Returns wei."""
         if xrt_amount == 0:
             return 0
-        path = [
-            self.xrt.address,
-            Web3.to_checksum_address(contract_abi.WETH_ADDRESS),
-        ]
         try:
-            amounts = self.uniswap.functions.getAmountsOut(xrt_amount, path).call()
+            amounts = contracts.uniswap_getAmountsOut(self.w3, self.uniswap.address, xrt_amount, self.sell_path)
             return amounts[1]
         except Exception:
             return 0
 
     def get_eth_usd_price(self) -> float:
-        """Get ETH/USD price from Chainlink oracle. Returns USD per ETH."""
-        answer = self.chainlink.functions.latestAnswer().call()
-        return answer / 1e8  # Chainlink ETH/USD has 8 decimals
+        """Get ETH/USD price from Chainlink oracle. Returns USD per ETH.
+        Served from cache while the last read is younger than eth_usd_ttl seconds."""
+        read_at, price = self._eth_usd_cache
+        now = time.monotonic()
+        if now - read_at < self.eth_usd_ttl:
+            return price
+        answer = contracts.chainlink_latestAnswer(self.w3, self.chainlink.address)
+        price = answer / 1e8  # Chainlink ETH/USD has 8 decimals
+        self._eth_usd_cache = (now, price)
+        return price
+
+    def read_multicall(self, calls: list) -> list:
+        """Run view calls [(target, calldata, output_types), ...] as one Multicall3 eth_call.
+        Returns decoded results (bare values for single outputs), None where a call reverted
+        or returned nothing decodable (e.g. a lighthouse address without code), so that
+        one bad view does not fail the whole read."""
+        data = contracts.multicall_aggregate3_data(
+            [(target, True, calldata) for target, calldata, _ in calls]
+        )
+        raw = self.w3.eth.call({"to": contract_abi.MULTICALL3_ADDRESS, "data": data})
+        results = []
+        for (_, _, types), (success, ret) in zip(calls, decode(("(bool,bytes)[]",), raw)[0]):
+            if not success:
+                results.append(None)
+                continue
+            try:
+                values = decode(types, ret)
+            except DecodingError:
+                results.append(None)
+                continue
+            results.append(values[0] if len(types) == 1 else values)
+        return results
+
+    def _read_view(self, target: str, calldata: bytes, output_types: tuple):
+        """One read_multicall() entry as a plain eth_call."""
+        values = decode(output_types, self.w3.eth.call({"to": target, "data": calldata}))
+        return values[0] if len(output_types) == 1 else values
 
-    def _effective_batch_size(self, max_batch: int, max_cost_usd: float) -> int:
+    def _try_read_view(self, target: str, calldata: bytes, output_types: tuple):
+        """_read_view(), None where the call reverts, as in read_multicall() results."""
+        try:
+            return self._read_view(target, calldata, output_types)
+        except Exception:
+            return None
+
+    def _read_block_and_factory_nonce(self) -> tuple[int, int]:
+        """(block number, factory.nonceOf(address)) in one Multicall3 eth_call, both
+        as of the same block; two plain reads where Multicall3 is not deployed."""
+        try:
+            block_number, nonce = self.read_multicall([
+                (contract_abi.MULTICALL3_ADDRESS, contracts.multicall_getBlockNumber_data(), ("uint256",)),
+                (self.factory.address, contracts.factory_nonceOf_data(self.address), ("uint256",)),
+            ])
+        except Exception:
+            block_number = nonce = None
+        if block_number is None or nonce is None:
+            block_number = self.w3.eth.block_number
+            nonce = contracts.factory_nonceOf(self.w3, self.factory.address, self.address)
+        return block_number, nonce
+
+    def preflight(self, gas_estimate: int = ESTIMATED_GAS_PER_CYCLE) -> dict:
+        """Per-iteration mining inputs in two parallel round trips: one Multicall3 aggregate
+        for the factory/Chainlink/auction/block views (plus the lighthouse stake and quota
+        views once a lighthouse is set), and eth_gasPrice (not visible to eth_call).
+        If the aggregate fails the views go out as separate parallel eth_calls; a view
+        that reverts is None, which callers replace with their own read."""
+        multicall = contract_abi.MULTICALL3_ADDRESS
+        calls = [
+            (self.factory.address, contracts.factory_gasPrice_data(), ("uint256",)),
+            (self.factory.address, contracts.factory_totalGasConsumed_data(), ("uint256",)),
+            (self.factory.address, contracts.factory_wnFromGas_data(gas_estimate), ("uint256",)),
+            (self.chainlink.address, contracts.chainlink_latestAnswer_data(), ("int256",)),
+            (self.auction_address, contracts.auction_finalPrice_data(), ("uint256",)),
+            (multicall, contracts.multicall_getBlockNumber_data(), ("uint256",)),
+        ]
+        if self.lighthouse:
+            lighthouse = self.lighthouse.address
+            calls += [
+                (lighthouse, contracts.lighthouse_stakes_data(self.address), ("uint256",)),
+                (lighthouse, contracts.lighthouse_minimalStake_data(), ("uint256",)),
+                (lighthouse, contracts.lighthouse_keepAliveBlock_data(), ("uint256",)),
+                (lighthouse, contracts.lighthouse_timeoutInBlocks_data(), ("uint256",)),
+            ]
+        try:
+            gas_price, results = self._read_concurrently([
+                lambda: self.w3.eth.gas_price, lambda: self.read_multicall(calls),
+            ])
+        except Exception:
+            gas_price, *results = self._read_concurrently([
+                lambda: self.w3.eth.gas_price,
+                *(partial(self._try_read_view, *call) for call in calls[:5]),
+                lambda: self.w3.eth.block_number,
+                *(partial(self._try_read_view, *call) for call in calls[6:]),
+            ])
+        factory_gas_price, total_gas_consumed, xrt_minted, answer, final_price, block_number = results[:6]
+        if answer is not None:
+            self._eth_usd_cache = (time.monotonic(), answer / 1e8)
+        snapshot = {
+            "gas_price": gas_price,
+            "gas_estimate": gas_estimate,
+            "factory_gas_price": factory_gas_price,
+            "total_gas_consumed": total_gas_consumed,
+            "xrt_minted": xrt_minted,
+            "eth_usd": answer / 1e8 if answer is not None else None,
+            "auction_final_price": final_price,
+            "block_number": block_number,
+        }
+        if self.lighthouse:
+            (snapshot["my_stake"], snapshot["minimal_stake"],
+             snapshot["keep_alive_block"], snapshot["timeout_blocks"]) = results[6:]
+        return snapshot
+
+    def _effective_batch_size(self, max_batch: int, max_cost_usd: float,
+                              gas_price: int | None = None,
+                              eth_usd: float | None = None) -> int:
         """Calculate batch size based on current gas price and ETH/USD.
         Scales proportionally: if cost is 2x the limit, batch halves.
-        Returns 0 if cost is too high even for a single liability."""
-        gas_price = self.w3.eth.gas_price
-        eth_usd = self.get_eth_usd_price()
+        Returns 0 if cost is too high even for a single liability.
+        gas_price / eth_usd skip their reads when already known (e.g. from preflight)."""
+        if gas_price is None and eth_usd is None:
+            gas_price, eth_usd = self._read_concurrently([
+                lambda: self.w3.eth.gas_price, self.get_eth_usd_price,
+            ])
+        elif gas_price is None:
+            gas_price = self.w3.eth.gas_price
+        elif eth_usd is None:
+            eth_usd = self.get_eth_usd_price()
         cost_per_liability_usd = gas_price * GAS_PER_LIABILITY / 1e18 * eth_usd
         if cost_per_liability_usd <= max_cost_usd:
             return max_batch
         effective = int(max_batch * max_cost_usd / cost_per_liability_usd)
         return max(0, effective)
 
-    def check_profitability(self, gas_estimate: int = ESTIMATED_GAS_PER_CYCLE) -> dict:
-        """Check if mining is profitable at current gas price and XRT/ETH rate."""
-        gas_price = self.w3.eth.gas_price
+    @staticmethod
+    def _read_concurrently(reads: list) -> list:
+        """Run zero-argument read callables in parallel threads. Results keep the order of reads."""
+        with ThreadPoolExecutor(max_workers=len(reads)) as pool:
+            return list(pool.map(lambda read: read(), reads))
+
+    def check_profitability(self, gas_estimate: int = ESTIMATED_GAS_PER_CYCLE,
+                            gas_price: int | None = None,
+                            xrt_minted: int | None = None) -> dict:
+        """Check if mining is profitable at current gas price and XRT/ETH rate.
+        gas_price / xrt_minted (wnFromGas(gas_estimate)) skip their RPC reads when already known."""
+        if gas_price is None and xrt_minted is None:
+            gas_price, xrt_minted = self._read_concurrently([
+                lambda: self.w3.eth.gas_price,
+                lambda: self._wn_from_gas(gas_estimate),
+            ])
+        elif gas_price is None:
+            gas_price = self.w3.eth.gas_price
+        elif xrt_minted is None:
+            xrt_minted = self._wn_from_gas(gas_estimate)
         gas_cost = gas_price * gas_estimate
 
-        xrt_minted = self.factory.functions.wnFromGas(gas_estimate).call()
         xrt_value = self.xrt_to_eth(xrt_minted)
 
         profit = xrt_value - gas_cost
@@ -116,12 +330,29 @@ class XRTMiner:
             "margin": margin,
         }
 
-    def _build_tx(self, tx_func, eth_nonce: int, gas: int = 500_000,
-                  value: int = 0) -> bytes:
-        """Build and sign a transaction, return raw bytes. Does not send."""
-        base_fee = self.w3.eth.gas_price
+    @property
+    def chain_id(self) -> int:
+        """eth_chainId, read once per miner."""
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+
+    def _next_base_fee(self) -> int:
+        """Base fee of the pending block from eth_feeHistory, or eth_gasPrice on
+        nodes without fee history."""
+        try:
+            return self.w3.eth.fee_history(1, "latest")["baseFeePerGas"][-1]
+        except Exception:
+            return self.w3.eth.gas_price
+
+    def _tx_params(self, eth_nonce: int, gas: int, value: int,
+                   base_fee: int | None = None) -> dict:
+        """EIP-1559 fields shared by every transaction we sign.
+        base_fee: _next_base_fee() already read for this round (one fee for the whole batch)."""
+        if base_fee is None:
+            base_fee = self._next_base_fee()
         prio_wei = self.w3.to_wei(self.priority_gwei, "gwei")
-        max_fee = max(base_fee + prio_wei, self.w3.to_wei(1, "gwei"))
+        max_fee = max(int(base_fee * BASE_FEE_HEADROOM) + prio_wei, self.w3.to_wei(1, "gwei"))
         priority_fee = min(prio_wei, max_fee)
         tx_params = {
             "from": self.address,
@@ -129,26 +360,189 @@ class XRTMiner:
             "gas": gas,
             "maxFeePerGas": max_fee,
             "maxPriorityFeePerGas": priority_fee,
+            "chainId": self.chain_id,
         }
         if value > 0:
             tx_params["value"] = value
-        tx = tx_func.build_transaction(tx_params)
+        return tx_params
+
+    def _build_tx(self, tx_func, eth_nonce: int, gas: int = 500_000,
+                  value: int = 0, base_fee: int | None = None) -> bytes:
+        """Build and sign a transaction, return raw bytes. Does not send."""
+        tx = tx_func.build_transaction(self._tx_params(eth_nonce, gas, value, base_fee))
         signed = self.account.sign_transaction(tx)
         return signed.raw_transaction
 
-    def _send_tx(self, tx_func, **kwargs):
+    def _build_raw_tx(self, to: str, data: bytes, eth_nonce: int, gas: int,
+                      value: int = 0, base_fee: int | None = None) -> bytes:
+        """_build_tx for ready calldata (e.g. from _contracts_generated), skipping
+        web3's build_transaction: no ABI lookup or re-encoding per tx."""
+        tx = self._tx_params(eth_nonce, gas, value, base_fee)
+        tx["to"] = to
+        tx["data"] = data
+        tx["type"] = 2
+        signed = self.account.sign_transaction(tx)
+        return signed.raw_transaction
+
+    def _reserve_nonces(self, count: int) -> int:
+        """Reserve count consecutive account nonces, returning the first one.
+        Reserved nonces must all be sent, in order: the node holds back every tx
+        behind a gap, so any failed send has to _resync_nonce()."""
+        if self._next_nonce is None or (self.nonce_contingent and self._nonce_reservations_left <= 0):
+            self._next_nonce = self.w3.eth.get_transaction_count(self.address, "pending")
+            self._nonce_reservations_left = self.nonce_contingent
+        self._nonce_reservations_left -= 1
+        first = self._next_nonce
+        self._next_nonce += count
+        return first
+
+    def _resync_nonce(self):
+        """Drop the local account and factory nonces after a failed send; the next
+        reservations refetch them."""
+        self._next_nonce = None
+        self._factory_nonce = None
+
+    def _reserve_factory_nonces(self, liabilities: int) -> int:
+        """First factory nonce for liabilities demand/offer pairs, two nonces each.
+        nonceOf() is read once and advanced locally; a pair that does not end up in a
+        created liability leaves the factory behind, so callers _resync_nonce()."""
+        if self._factory_nonce is None:
+            self._factory_nonce = contracts.factory_nonceOf(self.w3, self.factory.address, self.address)
+        first = self._factory_nonce
+        self._factory_nonce += 2 * liabilities
+        return first
+
+    def _send_tx(self, tx_func, eth_nonce: int | None = None, **kwargs):
         """Build, sign, send a contract transaction. Raises on revert."""
-        raw = self._build_tx(
-            tx_func,
-            self.w3.eth.get_transaction_count(self.address),
-            kwargs.get("gas", 500_000),
-            value=kwargs.get("value", 0),
+        return self._send_txs(
+            [(tx_func, kwargs.get("gas", 500_000), kwargs.get("value", 0))], eth_nonce,
+        )[0]
+
+    def _send_txs(self, calls: list, eth_nonce: int | None = None) -> list:
+        """Build, sign, send [(tx_func, gas, value), ...] on consecutive nonces, so they
+        can land in the same block, then wait for every receipt. Raises on any revert.
+        eth_nonce: first nonce of an earlier _reserve_nonces(); reserved here when not given."""
+        if eth_nonce is None:
+            eth_nonce = self._reserve_nonces(len(calls))
+        base_fee = self._next_base_fee()  # one fee for the whole burst
+        raws = [
+            self._build_tx(tx_func, eth_nonce + i, gas, value=value, base_fee=base_fee)
+            for i, (tx_func, gas, value) in enumerate(calls)
+        ]
+        self._forget_emission_views()
+        from_block = self._receipt_start_block()
+        try:
+            tx_hashes = [self.w3.eth.send_raw_transaction(raw) for raw in raws]
+        except Exception:
+            self._resync_nonce()
+            raise
+        receipts = self._wait_for_receipts(
+            tx_hashes, poll_seconds=SEND_POLL_SECONDS, from_block=from_block,
         )
-        tx_hash = self.w3.eth.send_raw_transaction(raw)
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
-        if receipt["status"] != 1:
-            raise RuntimeError(f"Transaction reverted. Hash: {tx_hash.hex()}")
-        return receipt
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            if receipt["status"] != 1:
+                raise RuntimeError(f"Transaction reverted. Hash: {tx_hash.hex()}")
+        return receipts
+
+    def _receipt_start_block(self) -> int | None:
+        """Head block to read before broadcasting, as from_block for _wait_for_receipts.
+        Only block-by-block waiting needs it, so other nodes skip the eth_blockNumber."""
+        if self._receipt_strategy != "blocks":
+            return None
+        return self.w3.eth.block_number
+
+    def _wait_for_receipts(self, hashes: list, timeout: float = 300,
+                           poll_seconds: float | None = None,
+                           from_block: int | None = None) -> list:
+        """Wait for the receipts of hashes, returned in the same order.
+        Each poll fetches every still-pending receipt in one JSON-RPC batch; falls back
+        to per-tx wait_for_transaction_receipt if the provider rejects batches.
+        Websocket nodes are read block by block instead (_wait_for_block_receipts).
+        poll_seconds defaults to RECEIPT_POLL_SECONDS (BLOCK_POLL_SECONDS block by block).
+        from_block: _receipt_start_block() read before the hashes were broadcast."""
+        if self._receipt_strategy == "blocks":
+            try:
+                return self._wait_for_block_receipts(
+                    hashes, timeout, poll_seconds or BLOCK_POLL_SECONDS, from_block,
+                )
+            except TimeExhausted:
+                raise
+            except Exception:
+                # Node without eth_getBlockReceipts: poll per tx from now on
+                self._receipt_strategy = "batch"
+        poll_seconds = poll_seconds or RECEIPT_POLL_SECONDS
+        receipts = [None] * len(hashes)
+        pending = list(range(len(hashes)))
+        deadline = time.monotonic() + timeout
+        try:
+            while pending:
+                # Raw provider batch: web3's batch_requests() raises for the whole
+                # batch as soon as one receipt is still null
+                responses = self.w3.provider.make_batch_request([
+                    ("eth_getTransactionReceipt", [Web3.to_hex(hashes[i])]) for i in pending
+                ])
+                if not isinstance(responses, list):
+                    raise ValueError(responses.get("error", responses))
+                still_pending = []
+                for i, response in zip(pending, responses):
+                    if "error" in response:
+                        raise ValueError(response["error"])
+                    if response.get("result") is None:
+                        still_pending.append(i)
+                    else:
+                        receipts[i] = receipt_formatter(response["result"])
+                pending = still_pending
+                if pending:
+                    if time.monotonic() >= deadline:
+                        raise TimeExhausted(f"{len(pending)} of {len(hashes)} transactions not mined after {timeout}s")
+                    time.sleep(poll_seconds)
+        except TimeExhausted:
+            raise
+        except Exception:
+            for i in pending:
+                receipts[i] = self.w3.eth.wait_for_transaction_receipt(
+                    hashes[i], timeout=max(deadline - time.monotonic(), poll_seconds),
+                    poll_latency=poll_seconds,
+                )
+        return receipts
+
+    def _wait_for_block_receipts(self, hashes: list, timeout: float = 300,
+                                 poll_seconds: float = BLOCK_POLL_SECONDS,
+                                 from_block: int | None = None) -> list:
+        """_wait_for_receipts via one eth_getBlockReceipts per new block, matched
+        against the pending hashes, instead of one receipt request per pending tx.
+        Between blocks only eth_blockNumber is polled, every poll_seconds.
+        Scanning starts at from_block (the head at broadcast), so txs mined while
+        other receipts were awaited are still found; without it, one block back."""
+        receipts = [None] * len(hashes)
+        pending = {bytes(tx_hash): i for i, tx_hash in enumerate(hashes)}
+        deadline = time.monotonic() + timeout
+        if from_block is None:
+            # The head may already hold txs broadcast just before it was sealed
+            from_block = self.w3.eth.block_number - 1
+        block = from_block
+        while True:
+            head = self.w3.eth.block_number
+            while block <= head and pending:
+                for receipt in self.w3.eth.get_block_receipts(block):
+                    i = pending.pop(bytes(receipt["transactionHash"]), None)
+                    if i is not None:
+                        receipts[i] = receipt
+                block += 1
+            if not pending:
+                return receipts
+            if time.monotonic() >= deadline:
+                # Last look per tx, in case a block was skipped or reorged away
+                for tx_hash, i in list(pending.items()):
+                    try:
+                        receipts[i] = self.w3.eth.get_transaction_receipt(tx_hash)
+                    except TransactionNotFound:
+                        continue
+                    del pending[tx_hash]
+                if not pending:
+                    return receipts
+                raise TimeExhausted(f"{len(pending)} of {len(hashes)} transactions not mined after {timeout}s")
+            time.sleep(poll_seconds)
 
     def create_lighthouse(self, name: str, minimal_stake: int, timeout_blocks: int) -> str:
         """Create new lighthouse via Factory. Returns lighthouse address."""
@@ -168,23 +562,51 @@ class XRTMiner:
         self.set_lighthouse(lh_address)
         return lh_address
 
-    def _ensure_allowance(self, spender: str, amount: int):
-        """Approve XRT spending if current allowance is insufficient."""
-        current = self.xrt.functions.allowance(self.address, spender).call()
-        if current < amount:
-            click_echo(f"Approving {amount} XRT for {spender}...")
-            self._send_tx(
-                self.xrt.functions.approve(spender, amount),
-                gas=60_000,
-            )
+    def _approval_needed(self, spender: str, amount: int,
+                         current: int | None = None) -> int | None:
+        """XRT amount to approve for spender before it can pull amount, or None when
+        the allowance already covers it. Skips the allowance() read while the locally
+        tracked allowance covers amount, or when current (a fresh allowance read) is given."""
+        if self._allowances.get(spender, 0) >= amount:
+            return None
+        if current is None:
+            current = contracts.xrt_allowance(self.w3, self.xrt.address, self.address, spender)
+        if current >= amount:
+            self._allowances[spender] = current
+            return None
+        return MAX_UINT256 if self.approve_max else amount
+
+    def _send_spending_tx(self, spender: str, amount: int, tx_func,
+                          allowance: int | None = None, **kwargs):
+        """_send_tx for a call that pulls amount XRT through spender's allowance.
+        A needed approve goes out on the preceding nonce in the same burst instead of
+        a block earlier. Keeps the tracked allowance in step; a failed tx drops it,
+        forcing a re-read. allowance: spender's allowance, if already read."""
+        calls = []
+        approval = self._approval_needed(spender, amount, allowance)
+        if approval is not None:
+            click_echo(f"Approving {'unlimited' if self.approve_max else amount} XRT for {spender}...")
+            calls.append((self.xrt.functions.approve(spender, approval), 60_000, 0))
+        calls.append((tx_func, kwargs.get("gas", 500_000), kwargs.get("value", 0)))
+        try:
+            receipt = self._send_txs(calls)[-1]
+        except Exception:
+            self._allowances.pop(spender, None)
+            raise
+        if approval is not None:
+            self._allowances[spender] = approval
+        self._allowances[spender] -= amount
+        return receipt
 
     def stake(self, amount: int):
         """Approve XRT and call lighthouse.refill(amount)."""
         if not self.lighthouse:
             raise RuntimeError("No lighthouse set")
-        self._ensure_allowance(self.lighthouse_address, amount)
         click_echo(f"Staking {amount} XRT...")
-        self._send_tx(self.lighthouse.functions.refill(amount), gas=200_000)
+        self._send_spending_tx(
+            self.lighthouse_address, amount,
+            self.lighthouse.functions.refill(amount), gas=200_000,
+        )
         click_echo("Staked.")
 
     def unstake(self, amount: int):
@@ -195,28 +617,40 @@ class XRTMiner:
         self._send_tx(self.lighthouse.functions.withdraw(amount), gas=100_000)
         click_echo("Withdrawn.")
 
-    def _wait_for_timeout(self):
-        """Wait until lighthouse timeout has passed so quota resets."""
-        keep_alive = self.lighthouse.functions.keepAliveBlock().call()
-        timeout = self.lighthouse.functions.timeoutInBlocks().call()
-        current_block = self.w3.eth.block_number
+    def _wait_for_timeout(self, snapshot: dict | None = None):
+        """Wait until lighthouse timeout has passed so quota resets.
+        snapshot: a fresh preflight() result, reused instead of reading the block and quota state."""
+        if _has_values(snapshot, "keep_alive_block", "timeout_blocks", "block_number"):
+            keep_alive = snapshot["keep_alive_block"]
+            timeout = snapshot["timeout_blocks"]
+            current_block = snapshot["block_number"]
+        else:
+            keep_alive = contracts.lighthouse_keepAliveBlock(self.w3, self.lighthouse.address)
+            timeout = self._lighthouse_param("timeoutInBlocks")
+            current_block = self.w3.eth.block_number
         target = keep_alive + timeout + 1
         if current_block >= target:
             return
         blocks_to_wait = target - current_block
-        wait_seconds = blocks_to_wait * 12
-        click_echo(f"  Waiting ~{blocks_to_wait} blocks ({wait_seconds}s) for quota reset...")
-        time.sleep(wait_seconds)
-
-    def _ensure_stake(self, needed_quota: int):
-        """Make sure we have enough stake for the given quota. Stakes from balance if possible."""
-        my_stake = self.lighthouse.functions.stakes(self.address).call()
-        min_stake = self.lighthouse.functions.minimalStake().call()
+        click_echo(f"  Waiting ~{blocks_to_wait} blocks ({blocks_to_wait * BLOCK_TIME_SECONDS}s) for quota reset...")
+        # Poll rather than sleeping the estimate: block times vary around 12s
+        while current_block < target:
+            time.sleep(min(BLOCK_POLL_SECONDS, (target - current_block) * BLOCK_TIME_SECONDS))
+            current_block = self.w3.eth.block_number
+
+    def _ensure_stake(self, needed_quota: int, snapshot: dict | None = None):
+        """Make sure we have enough stake for the given quota. Stakes from balance if possible.
+        snapshot: a preflight() result, reused instead of reading the stake views."""
+        if _has_values(snapshot, "my_stake", "minimal_stake"):
+            my_stake, min_stake = snapshot["my_stake"], snapshot["minimal_stake"]
+        else:
+            my_stake = contracts.lighthouse_stakes(self.w3, self.lighthouse.address, self.address)
+            min_stake = self._lighthouse_param("minimalStake")
         needed = needed_quota * min_stake
         if my_stake >= needed:
             return
         extra = needed - my_stake
-        xrt_bal = self.xrt.functions.balanceOf(self.address).call()
+        xrt_bal = contracts.xrt_balanceOf(self.w3, self.xrt.address, self.address)
         if xrt_bal < extra:
             click_echo(f"  Need {extra} wn stake but only {xrt_bal} XRT available (have {my_stake} staked)")
             if xrt_bal > 0:
@@ -248,15 +682,16 @@ class XRTMiner:
         current_block = self.w3.eth.block_number
         deadline = current_block + 200
 
-        factory_nonce = self.factory.functions.nonceOf(self.address).call()
-        eth_nonce = self.w3.eth.get_transaction_count(self.address)
+        factory_nonce = self._reserve_factory_nonces(batch_size)
+        eth_nonce = self._reserve_nonces(batch_size)
 
         # --- Phase 1: Build & send all createLiability txs ---
         click_echo(f"  Phase 1: sending {batch_size} createLiability txs...")
-        create_hashes = []
+        raws = []
+        randoms = _random_fields(2 * batch_size)
+        base_fee = self._next_base_fee()  # one fee for the whole phase
         for i in range(batch_size):
-            model = os.urandom(34)
-            objective = os.urandom(34)
+            model, objective = randoms[2 * i], randoms[2 * i + 1]
 
             demand_nonce = factory_nonce + 2 * i
             offer_nonce = factory_nonce + 2 * i + 1
@@ -272,82 +707,99 @@ class XRTMiner:
                 deadline, offer_nonce, self.address, self.private_key,
             )
 
-            raw = self._build_tx(
-                self.lighthouse.functions.createLiability(demand, offer),
+            raw = self._build_raw_tx(
+                self.lighthouse_address,
+                contracts.lighthouse_createLiability_data(demand, offer),
                 eth_nonce + i,
                 gas=1_500_000,
+                base_fee=base_fee,
             )
-            tx_hash = self.w3.eth.send_raw_transaction(raw)
-            create_hashes.append(tx_hash)
+            raws.append(raw)
+        from_block = self._receipt_start_block()
+        create_hashes = self._broadcast(raws)
 
         # Wait for all createLiability receipts
         click_echo(f"  Waiting for {batch_size} createLiability confirmations...")
         liabilities = []
         create_gas = 0
-        for i, tx_hash in enumerate(create_hashes):
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        create_receipts = self._wait_for_receipts(create_hashes, from_block=from_block)
+        for i, (tx_hash, receipt) in enumerate(zip(create_hashes, create_receipts)):
             if receipt["status"] != 1:
                 click_echo(f"  createLiability[{i}] REVERTED: {tx_hash.hex()}")
                 continue
             create_gas += receipt["gasUsed"]
-            logs = self.factory.events.NewLiability().process_receipt(receipt)
-            if logs:
-                liabilities.append(logs[0]["args"]["liability"])
+            liability, _ = self._scan_logs(receipt)
+            if liability:
+                liabilities.append(liability)
 
         click_echo(f"  Created {len(liabilities)}/{batch_size} liabilities, gas={create_gas}")
+        if len(liabilities) < batch_size:
+            self._resync_nonce()
 
         if not liabilities:
             return create_gas, 0
 
-        # --- Phase 2: Wait for quota reset ---
-        self._wait_for_timeout()
+        # --- Phase 2: Wait for quota reset, signing the results meanwhile ---
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            results = pool.submit(self._sign_results, liabilities)
+            self._wait_for_timeout()
+            results = results.result()
 
         # --- Phase 3: Build & send all finalizeLiability txs ---
         click_echo(f"  Phase 2: sending {len(liabilities)} finalizeLiability txs...")
-        eth_nonce = self.w3.eth.get_transaction_count(self.address)
-        finalize_hashes = []
-        for i, liability_addr in enumerate(liabilities):
-            result_data = os.urandom(34)
-            result_sig = signer.build_result(
-                liability_addr, result_data, True, self.private_key,
-            )
-            raw = self._build_tx(
-                self.lighthouse.functions.finalizeLiability(
+        eth_nonce = self._reserve_nonces(len(liabilities))
+        base_fee = self._next_base_fee()
+        raws = []
+        for i, (liability_addr, (result_data, result_sig)) in enumerate(zip(liabilities, results)):
+            raw = self._build_raw_tx(
+                self.lighthouse_address,
+                contracts.lighthouse_finalizeLiability_data(
                     liability_addr, result_data, True, result_sig,
                 ),
                 eth_nonce + i,
                 gas=400_000,
+                base_fee=base_fee,
             )
-            tx_hash = self.w3.eth.send_raw_transaction(raw)
-            finalize_hashes.append(tx_hash)
+            raws.append(raw)
+        from_block = self._receipt_start_block()
+        finalize_hashes = self._broadcast(raws)
 
         # Wait for all finalizeLiability receipts, parse XRT minted
         click_echo(f"  Waiting for {len(liabilities)} finalizeLiability confirmations...")
         finalize_gas = 0
         total_xrt = 0
-        for i, tx_hash in enumerate(finalize_hashes):
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        finalize_receipts = self._wait_for_receipts(finalize_hashes, from_block=from_block)
+        for i, (tx_hash, receipt) in enumerate(zip(finalize_hashes, finalize_receipts)):
             if receipt["status"] != 1:
                 click_echo(f"  finalizeLiability[{i}] REVERTED: {tx_hash.hex()}")
                 continue
             finalize_gas += receipt["gasUsed"]
-            for log in receipt["logs"]:
-                if (log["address"].lower() == self.xrt.address.lower()
-                        and len(log["topics"]) >= 3
-                        and log["topics"][0].hex() == TRANSFER_TOPIC):
-                    total_xrt += int(log["data"].hex(), 16)
+            total_xrt += self._scan_logs(receipt)[1]
 
         total_gas = create_gas + finalize_gas
         click_echo(f"  Finalized {len(liabilities)}, gas={finalize_gas}, XRT minted={total_xrt} wn ({total_xrt/1e9:.2f} XRT)")
         return total_gas, total_xrt
 
+    def _sign_results(self, liabilities: list) -> list:
+        """[(result_data, result_sig)] for finalizing each liability."""
+        results = []
+        for liability_addr, result_data in zip(liabilities, _random_fields(len(liabilities))):
+            results.append((result_data, signer.build_result(
+                liability_addr, result_data, True, self.private_key,
+            )))
+        return results
+
     def mine_batch_loop(self, batch_size: int = 20, eth_budget: float = 1.0,
-                        sell_every_xrt: float = 1000.0, slippage: float = 0.05):
+                        sell_every_xrt: float = 1000.0, slippage: float = 0.05,
+                        nonce_contingent: int = 1):
         """
         Continuous batch mining with auto-sell.
         eth_budget: stop after spending this much ETH on gas.
         sell_every_xrt: swap XRT→ETH after accumulating this many XRT.
+        nonce_contingent: send phases (and sells) served from one get_transaction_count;
+        0 = fetch once, refetch only after a failed send.
         """
+        self.nonce_contingent = max(0, nonce_contingent)
         click_echo(f"=== Batch mining: batch={batch_size}, budget={eth_budget} ETH, sell every {sell_every_xrt} XRT ===")
 
         self._ensure_stake(batch_size)
@@ -383,7 +835,7 @@ class XRTMiner:
 
                     # Auto-sell
                     if xrt_since_last_sell / 1e9 >= sell_every_xrt:
-                        xrt_bal = self.xrt.functions.balanceOf(self.address).call()
+                        xrt_bal = contracts.xrt_balanceOf(self.w3, self.xrt.address, self.address)
                         if xrt_bal > 0:
                             click_echo(f"\n  >>> Selling {xrt_bal/1e9:.2f} XRT...")
                             try:
@@ -395,6 +847,7 @@ class XRTMiner:
                                 click_echo(f"  >>> Sell failed: {e}")
 
                 except Exception as e:
+                    self._resync_nonce()
                     click_echo(f"  Batch {batch_num} error: {e}")
                     click_echo("  Retrying in 15 seconds...")
                     time.sleep(15)
@@ -403,7 +856,7 @@ class XRTMiner:
             pass
 
         eth_end = self.w3.eth.get_balance(self.address)
-        xrt_end = self.xrt.functions.balanceOf(self.address).call()
+        xrt_end = contracts.xrt_balanceOf(self.w3, self.xrt.address, self.address)
         eth_total_spent = (eth_start - eth_end) / 1e18
 
         click_echo(f"\n{'='*60}")
@@ -416,19 +869,19 @@ class XRTMiner:
         click_echo(f"  Total gas used:     {total_gas}")
         click_echo(f"{'='*60}")
 
-    def _build_create_txs(self, batch_size: int, eth_nonce: int) -> tuple[list, list]:
-        """Pre-sign batch_size createLiability txs. Returns (tx_hashes, raw_data_for_later)."""
+    def _sign_create_payloads(self, batch_size: int) -> tuple[list, list]:
+        """Signed (demand, offer) pairs for batch_size liabilities, not yet bound to
+        account nonces. Returns (pairs, result_datas)."""
         token = self.xrt.address
-        factory_nonce = self.factory.functions.nonceOf(self.address).call()
-        current_block = self.w3.eth.block_number
-        deadline = current_block + 300
+        factory_nonce = self._reserve_factory_nonces(batch_size)
+        deadline = self._create_deadline()
 
-        hashes = []
+        pairs = []
         # Store result_data per liability for later finalization
-        result_datas = []
+        randoms = _random_fields(3 * batch_size)
+        result_datas = randoms[2 * batch_size:]
         for i in range(batch_size):
-            model = os.urandom(34)
-            objective = os.urandom(34)
+            model, objective = randoms[2 * i], randoms[2 * i + 1]
 
             demand = signer.build_demand(
                 model, objective, token, 0,
@@ -440,77 +893,147 @@ class XRTMiner:
                 signer.ZERO_ADDRESS, self.lighthouse_address, 0,
                 deadline, factory_nonce + 2 * i + 1, self.address, self.private_key,
             )
-
-            raw = self._build_tx(
-                self.lighthouse.functions.createLiability(demand, offer),
+            pairs.append((demand, offer))
+
+        return pairs, result_datas
+
+    def _create_deadline(self, horizon: int = 300, margin: int = 50) -> int:
+        """Deadline block (about horizon blocks ahead) shared by consecutive rounds.
+        The block number is re-read only once the deadline is estimated, from elapsed
+        time, to be fewer than margin blocks away."""
+        if self._deadline is not None:
+            block, read_at, deadline = self._deadline
+            estimated_block = block + (time.monotonic() - read_at) / BLOCK_TIME_SECONDS
+            if deadline - estimated_block >= margin:
+                return deadline
+        block = self.w3.eth.block_number
+        self._deadline = (block, time.monotonic(), block + horizon)
+        return block + horizon
+
+    def _build_create_txs(self, batch_size: int, eth_nonce: int,
+                          payloads: tuple[list, list] | None = None,
+                          base_fee: int | None = None) -> tuple[list, list]:
+        """Pre-sign batch_size createLiability txs. Returns (tx_hashes, raw_data_for_later).
+        payloads: a _sign_create_payloads(batch_size) result prepared ahead of time.
+        base_fee: the round's _next_base_fee(); read once here when not given."""
+        pairs, result_datas = payloads or self._sign_create_payloads(batch_size)
+        if base_fee is None:
+            base_fee = self._next_base_fee()
+        raws = [
+            self._build_raw_tx(
+                self.lighthouse_address,
+                contracts.lighthouse_createLiability_data(demand, offer),
                 eth_nonce + i,
                 gas=1_500_000,
+                base_fee=base_fee,
             )
-            tx_hash = self.w3.eth.send_raw_transaction(raw)
-            hashes.append(tx_hash)
-            result_datas.append(os.urandom(34))
-
-        return hashes, result_datas
+            for i, (demand, offer) in enumerate(pairs)
+        ]
+        return self._broadcast(raws), result_datas
 
     def _build_finalize_txs(self, liabilities: list, result_datas: list,
-                            eth_nonce: int) -> list:
-        """Pre-sign finalizeLiability txs. Returns tx_hashes."""
-        hashes = []
+                            eth_nonce: int, base_fee: int | None = None) -> list:
+        """Pre-sign finalizeLiability txs. Returns tx_hashes.
+        base_fee: the round's _next_base_fee(); read once here when not given."""
+        if base_fee is None:
+            base_fee = self._next_base_fee()
+        raws = []
         for i, (liability_addr, result_data) in enumerate(zip(liabilities, result_datas)):
             result_sig = signer.build_result(
                 liability_addr, result_data, True, self.private_key,
             )
-            raw = self._build_tx(
-                self.lighthouse.functions.finalizeLiability(
+            raw = self._build_raw_tx(
+                self.lighthouse_address,
+                contracts.lighthouse_finalizeLiability_data(
                     liability_addr, result_data, True, result_sig,
                 ),
                 eth_nonce + i,
                 gas=400_000,
+                base_fee=base_fee,
             )
-            tx_hash = self.w3.eth.send_raw_transaction(raw)
-            hashes.append(tx_hash)
-        return hashes
-
-    def _collect_create_receipts(self, hashes: list) -> tuple[list, int]:
-        """Wait for createLiability receipts. Returns (liability_addresses, gas_used)."""
+            raws.append(raw)
+        return self._broadcast(raws)
+
+    def _broadcast(self, raws: list) -> list:
+        """Send signed raw txs concurrently. Returns tx hashes in the order of raws.
+        Nonces were fixed at signing, and the node queues early arrivals until
+        the nonce gap before them fills."""
+        if not raws:
+            return []
+        self._forget_emission_views()
+        with ThreadPoolExecutor(max_workers=min(BROADCAST_WORKERS, len(raws))) as pool:
+            return list(pool.map(self.w3.eth.send_raw_transaction, raws))
+
+    def _collect_create_receipts(self, hashes: list,
+                                 from_block: int | None = None) -> tuple[list, int]:
+        """Wait for createLiability receipts. Returns (liability_addresses, gas_used).
+        from_block: _receipt_start_block() read before the hashes were broadcast."""
         liabilities = []
         gas = 0
-        for i, tx_hash in enumerate(hashes):
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        for i, receipt in enumerate(self._wait_for_receipts(hashes, from_block=from_block)):
             if receipt["status"] != 1:
                 click_echo(f"    create[{i}] REVERTED")
                 continue
             gas += receipt["gasUsed"]
-            logs = self.factory.events.NewLiability().process_receipt(receipt)
-            if logs:
-                liabilities.append(logs[0]["args"]["liability"])
+            liability, _ = self._scan_logs(receipt)
+            if liability:
+                liabilities.append(liability)
+        if len(liabilities) < len(hashes):
+            # The factory skipped those demand/offer nonces
+            self._resync_nonce()
         return liabilities, gas
 
-    def _collect_finalize_receipts(self, hashes: list) -> tuple[int, int]:
-        """Wait for finalizeLiability receipts. Returns (gas_used, xrt_minted)."""
+    def _collect_finalize_receipts(self, hashes: list,
+                                   from_block: int | None = None) -> tuple[int, int, int]:
+        """Wait for finalizeLiability receipts. Returns (gas_used, xrt_minted, reverted).
+        Minted XRT comes from the Transfer logs of the receipts already fetched for
+        status and gas; an eth_getLogs query would only add a round trip.
+        from_block: _receipt_start_block() read before the hashes were broadcast."""
         gas = 0
         xrt = 0
-        for i, tx_hash in enumerate(hashes):
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        reverted = 0
+        for i, receipt in enumerate(self._wait_for_receipts(hashes, from_block=from_block)):
             if receipt["status"] != 1:
                 click_echo(f"    finalize[{i}] REVERTED")
+                reverted += 1
                 continue
             gas += receipt["gasUsed"]
-            for log in receipt["logs"]:
-                if (log["address"].lower() == self.xrt.address.lower()
-                        and len(log["topics"]) >= 3
-                        and log["topics"][0].hex() == TRANSFER_TOPIC):
-                    xrt += int(log["data"].hex(), 16)
-        return gas, xrt
+            xrt += self._scan_logs(receipt)[1]
+        return gas, xrt, reverted
+
+    def _scan_logs(self, receipt) -> tuple[str | None, int]:
+        """Walk receipt logs once, matching raw topics instead of ABI-decoding every log.
+        Returns (first NewLiability address or None, XRT moved by Transfer events)."""
+        liability = None
+        xrt = 0
+        for log in receipt["logs"]:
+            topics = log["topics"]
+            if not topics:
+                continue
+            # web3 checksums log addresses, so they compare equal to factory/xrt.address
+            if topics[0] == NEW_LIABILITY_TOPIC:
+                if liability is None and len(topics) >= 2 and log["address"] == self.factory.address:
+                    liability = Web3.to_checksum_address(topics[1][-20:])
+            elif (topics[0] == TRANSFER_TOPIC and len(topics) >= 3
+                    and log["address"] == self.xrt.address):
+                xrt += int.from_bytes(log["data"], "big")
+        return liability, xrt
 
     def mine_pipeline_loop(self, batch_size: int = 20, eth_budget: float = 1.0,
                            sell_every_xrt: float = 1000.0, slippage: float = 0.05,
-                           max_cost_usd: float = 0.0):
+                           max_cost_usd: float = 0.0, nonce_contingent: int = 1,
+                           batch_read: bool = False, adaptive: bool = False):
         """
         Pipeline mining: overlap finalize(prev) + create(next) in the same block.
         Each round sends batch_size finalize + batch_size create = 2*batch_size txs.
         max_cost_usd: if > 0, dynamically scale batch size based on gas cost per liability.
+        nonce_contingent: rounds (and sells) served from one get_transaction_count;
+        0 = fetch once, refetch only after a failed send.
+        batch_read: take the sizing and stake inputs from one preflight() Multicall3 read per round.
+        adaptive: AIMD batch target capped at batch_size: +1 after a round without
+        reverts, halved after a revert or a failed round.
         """
+        self.nonce_contingent = max(0, nonce_contingent)
         cost_info = ""
         if max_cost_usd > 0:
             cost_info = f", max ${max_cost_usd:.2f}/liability"
@@ -529,6 +1052,7 @@ class XRTMiner:
         # Bootstrap: first batch is create-only
         prev_liabilities = None
         prev_result_datas = None
+        batch_target = batch_size
 
         try:
             while True:
@@ -540,13 +1064,23 @@ class XRTMiner:
 
                 batch_num += 1
 
+                snapshot = self.preflight(GAS_PER_LIABILITY) if batch_read else None
+
                 # Dynamic batch sizing based on gas cost
                 current_batch = batch_size
                 if max_cost_usd > 0:
-                    current_batch = self._effective_batch_size(batch_size, max_cost_usd)
+                    if snapshot is not None:
+                        gas_price, eth_usd = snapshot["gas_price"], snapshot["eth_usd"]
+                    else:
+                        gas_price, eth_usd = None, None
+                    if eth_usd is None:
+                        gas_price, eth_usd = self._read_concurrently([
+                            lambda: self.w3.eth.gas_price, self.get_eth_usd_price,
+                        ])
+                    current_batch = self._effective_batch_size(
+                        batch_size, max_cost_usd, gas_price, eth_usd,
+                    )
                     if current_batch == 0:
-                        gas_price = self.w3.eth.gas_price
-                        eth_usd = self.get_eth_usd_price()
                         cost_usd = gas_price * GAS_PER_LIABILITY / 1e18 * eth_usd
                         click_echo(
                             f"\n  Gas too expensive: ${cost_usd:.2f}/liability "
@@ -557,51 +1091,63 @@ class XRTMiner:
                         time.sleep(30)
                         continue
                     if current_batch < batch_size:
-                        gas_price = self.w3.eth.gas_price
-                        eth_usd = self.get_eth_usd_price()
                         cost_usd = gas_price * GAS_PER_LIABILITY / 1e18 * eth_usd
                         click_echo(
                             f"  Throttle: ${cost_usd:.2f}/liability > ${max_cost_usd:.2f} limit → "
                             f"batch {batch_size}→{current_batch}"
                         )
+                if adaptive:
+                    current_batch = min(current_batch, batch_target)
 
-                eth_nonce = self.w3.eth.get_transaction_count(self.address)
+                n_fin = len(prev_liabilities) if prev_liabilities is not None else 0
+                eth_nonce = self._reserve_nonces(n_fin + current_batch)
 
                 try:
+                    # One fee base for every tx of the round
+                    round_base_fee = self._next_base_fee()
+                    # Creates are collected after the finalizes: scan both from here
+                    from_block = self._receipt_start_block()
                     if prev_liabilities is None:
                         # First round: create only
                         click_echo(f"\n--- Round {batch_num}: CREATE {current_batch} (bootstrap) ---")
-                        create_hashes, result_datas = self._build_create_txs(current_batch, eth_nonce)
+                        create_hashes, result_datas = self._build_create_txs(
+                            current_batch, eth_nonce, base_fee=round_base_fee,
+                        )
                         click_echo(f"  Sent {current_batch} create txs, waiting...")
-                        liabilities, create_gas = self._collect_create_receipts(create_hashes)
+                        liabilities, create_gas = self._collect_create_receipts(create_hashes, from_block)
                         click_echo(f"  Created {len(liabilities)}/{current_batch}, gas={create_gas}")
                         total_gas += create_gas
+                        reverted = current_batch - len(liabilities)
                         prev_liabilities = liabilities
                         prev_result_datas = result_datas[:len(liabilities)]
                     else:
                         # Pipeline: finalize(prev) + create(new) simultaneously
-                        n_fin = len(prev_liabilities)
                         click_echo(f"\n--- Round {batch_num}: FINALIZE {n_fin} + CREATE {current_batch} (spent {eth_spent:.4f} ETH) ---")
 
-                        # Send finalize txs first (lower nonces)
-                        fin_hashes = self._build_finalize_txs(
-                            prev_liabilities, prev_result_datas, eth_nonce,
-                        )
+                        # Send finalize txs first (lower nonces), signing the create
+                        # demands/offers on a worker while they go out
+                        with ThreadPoolExecutor(max_workers=1) as pool:
+                            payloads = pool.submit(self._sign_create_payloads, current_batch)
+                            fin_hashes = self._build_finalize_txs(
+                                prev_liabilities, prev_result_datas, eth_nonce, round_base_fee,
+                            )
+                            payloads = payloads.result()
                         # Then create txs (higher nonces, same block)
                         create_hashes, result_datas = self._build_create_txs(
-                            current_batch, eth_nonce + n_fin,
+                            current_batch, eth_nonce + n_fin, payloads, round_base_fee,
                         )
                         click_echo(f"  Sent {n_fin}+{current_batch} txs, waiting...")
 
                         # Collect finalize results
-                        fin_gas, xrt_minted = self._collect_finalize_receipts(fin_hashes)
+                        fin_gas, xrt_minted, reverted = self._collect_finalize_receipts(fin_hashes, from_block)
                         total_xrt_minted += xrt_minted
                         xrt_since_last_sell += xrt_minted
                         total_gas += fin_gas
 
                         # Collect create results
-                        liabilities, create_gas = self._collect_create_receipts(create_hashes)
+                        liabilities, create_gas = self._collect_create_receipts(create_hashes, from_block)
                         total_gas += create_gas
+                        reverted += current_batch - len(liabilities)
 
                         click_echo(
                             f"  ROUND {batch_num}: fin_gas={fin_gas} create_gas={create_gas} "
@@ -609,14 +1155,14 @@ class XRTMiner:
                         )
 
                         # Try to top up stake if needed
-                        self._ensure_stake(current_batch * 2)
+                        self._ensure_stake(current_batch * 2, snapshot)
 
                         prev_liabilities = liabilities
                         prev_result_datas = result_datas[:len(liabilities)]
 
                         # Auto-sell
                         if xrt_since_last_sell / 1e9 >= sell_every_xrt:
-                            xrt_bal = self.xrt.functions.balanceOf(self.address).call()
+                            xrt_bal = contracts.xrt_balanceOf(self.w3, self.xrt.address, self.address)
                             if xrt_bal > 0:
                                 click_echo(f"\n  >>> Selling {xrt_bal/1e9:.2f} XRT...")
                                 try:
@@ -627,11 +1173,17 @@ class XRTMiner:
                                 except Exception as e:
                                     click_echo(f"  >>> Sell failed: {e}")
 
+                    if adaptive:
+                        batch_target = self._adapt_batch(batch_target, batch_size, reverted)
+
                 except Exception as e:
+                    self._resync_nonce()
                     click_echo(f"  Round {batch_num} error: {e}")
                     click_echo("  Retrying in 15s...")
                     prev_liabilities = None
                     prev_result_datas = None
+                    if adaptive:
+                        batch_target = self._adapt_batch(batch_target, batch_size, 1)
                     time.sleep(15)
 
         except KeyboardInterrupt:
@@ -641,18 +1193,19 @@ class XRTMiner:
         if prev_liabilities:
             click_echo(f"\n--- Finalizing {len(prev_liabilities)} remaining liabilities ---")
             try:
-                eth_nonce = self.w3.eth.get_transaction_count(self.address)
+                eth_nonce = self._reserve_nonces(len(prev_liabilities))
+                from_block = self._receipt_start_block()
                 fin_hashes = self._build_finalize_txs(
                     prev_liabilities, prev_result_datas, eth_nonce,
                 )
-                fin_gas, xrt_minted = self._collect_finalize_receipts(fin_hashes)
+                fin_gas, xrt_minted, _ = self._collect_finalize_receipts(fin_hashes, from_block)
                 total_xrt_minted += xrt_minted
                 total_gas += fin_gas
             except Exception as e:
                 click_echo(f"  Final finalize error: {e}")
 
         # Final sell
-        xrt_bal = self.xrt.functions.balanceOf(self.address).call()
+        xrt_bal = contracts.xrt_balanceOf(self.w3, self.xrt.address, self.address)
         if xrt_bal > 0:
             click_echo(f"\n  >>> Final sell: {xrt_bal/1e9:.2f} XRT...")
             try:
@@ -671,18 +1224,56 @@ class XRTMiner:
         click_echo(f"  Gas used:          {total_gas}")
         click_echo(f"{'='*60}")
 
+    @staticmethod
+    def _adapt_batch(target: int, ceiling: int, reverted: int) -> int:
+        """AIMD step for the pipeline batch target: +1 up to ceiling after a clean
+        round, halved (at least 1) after any revert or failure."""
+        if reverted:
+            new_target = max(1, target // 2)
+        else:
+            new_target = min(target + 1, ceiling)
+        if new_target != target:
+            click_echo(f"  Adaptive batch: {target}→{new_target}")
+        return new_target
+
+    def _swap_inputs(self, quote: tuple, allowance: bool = False) -> tuple:
+        """(amounts, deadline[, allowance]) for a swap in one Multicall3 eth_call:
+        the router quote, a deadline 300s past the block timestamp and, with
+        allowance, the router's XRT allowance. quote: (quote calldata builder, *args).
+        Falls back to separate reads where the aggregate fails."""
+        build, *args = quote
+        calls = [
+            (self.uniswap.address, build(*args), ("uint256[]",)),
+            (contract_abi.MULTICALL3_ADDRESS, contracts.multicall_getCurrentBlockTimestamp_data(), ("uint256",)),
+        ]
+        if allowance:
+            calls.append((
+                self.xrt.address,
+                contracts.xrt_allowance_data(self.address, contract_abi.UNISWAP_V2_ROUTER),
+                ("uint256",),
+            ))
+        try:
+            results = self.read_multicall(calls)
+        except Exception:
+            results = [None] * len(calls)
+        if results[0] is None:
+            # Reverted quote (e.g. no liquidity): let the plain read raise its error
+            results[0] = self._read_view(*calls[0])
+        if results[1] is None:
+            results[1] = self.w3.eth.get_block("latest")["timestamp"]
+        results[1] += 300
+        return tuple(results)
+
     def swap_eth_to_xrt(self, xrt_amount: int, slippage: float = 0.05) -> int:
         """Buy exact xrt_amount (in wn) via Uniswap V2. Returns ETH spent (wei)."""
-        path = [
-            Web3.to_checksum_address(contract_abi.WETH_ADDRESS),
-            self.xrt.address,
-        ]
-        amounts_in = self.uniswap.functions.getAmountsIn(xrt_amount, path).call()
+        path = self.buy_path
+        amounts_in, deadline = self._swap_inputs(
+            (contracts.uniswap_getAmountsIn_data, xrt_amount, path),
+        )
         eth_needed = int(amounts_in[0] * (1 + slippage))
 
         click_echo(f"  Buying {xrt_amount/1e9:.2f} XRT for ~{amounts_in[0]/1e18:.6f} ETH (max: {eth_needed/1e18:.6f})")
 
-        deadline = self.w3.eth.get_block("latest")["timestamp"] + 300
         receipt = self._send_tx(
             self.uniswap.functions.swapExactETHForTokens(
                 xrt_amount, path, self.address, deadline,
@@ -696,91 +1287,97 @@ class XRTMiner:
 
     def swap_xrt_to_eth(self, xrt_amount: int, slippage: float = 0.05) -> int:
         """Swap XRT → ETH via Uniswap V2. Returns ETH received (wei)."""
-        path = [
-            self.xrt.address,
-            Web3.to_checksum_address(contract_abi.WETH_ADDRESS),
-        ]
-        amounts_out = self.uniswap.functions.getAmountsOut(xrt_amount, path).call()
+        path = self.sell_path
+        amounts_out, deadline, allowance = self._swap_inputs(
+            (contracts.uniswap_getAmountsOut_data, xrt_amount, path), allowance=True,
+        )
         min_eth = int(amounts_out[1] * (1 - slippage))
 
         click_echo(f"  Swapping {xrt_amount/1e9:.2f} XRT → ~{amounts_out[1]/1e18:.6f} ETH (min: {min_eth/1e18:.6f})")
 
-        self._ensure_allowance(contract_abi.UNISWAP_V2_ROUTER, xrt_amount)
-
-        deadline = self.w3.eth.get_block("latest")["timestamp"] + 300
-        receipt = self._send_tx(
+        receipt = self._send_spending_tx(
+            contract_abi.UNISWAP_V2_ROUTER, xrt_amount,
             self.uniswap.functions.swapExactTokensForETH(
                 xrt_amount, min_eth, path, self.address, deadline,
             ),
+            allowance=allowance,
             gas=200_000,
         )
 
         click_echo(f"  Swap done. Gas: {receipt['gasUsed']}")
         return amounts_out[1]
 
-    def mine_once(self, model: bytes | None = None, objective: bytes | None = None) -> tuple[str, int]:
-        """Single mining cycle. Returns (liability_address, xrt_minted)."""
+    def mine_once(self, model: bytes | None = None, objective: bytes | None = None,
+                  snapshot: dict | None = None) -> tuple[str, int]:
+        """Single mining cycle. Returns (liability_address, xrt_minted).
+        snapshot: a fresh preflight() result, reused for the block number and quota state."""
         if not self.lighthouse:
             raise RuntimeError("No lighthouse set")
 
+        random_model, random_objective, result_data = _random_fields(3)
         if model is None:
-            model = os.urandom(34)
+            model = random_model
         if objective is None:
-            objective = os.urandom(34)
+            objective = random_objective
 
         token = self.xrt.address
         cost = 0
         validator = signer.ZERO_ADDRESS
         validator_fee = 0
         lighthouse_fee = 0
-        result_data = os.urandom(34)
 
-        current_block = self.w3.eth.block_number
+        if _has_values(snapshot, "block_number"):
+            current_block = snapshot["block_number"]
+        elif self._factory_nonce is None:
+            current_block, self._factory_nonce = self._read_block_and_factory_nonce()
+        else:
+            current_block = self.w3.eth.block_number
         deadline = current_block + 100
-        nonce = self.factory.functions.nonceOf(self.address).call()
-
-        demand = signer.build_demand(
-            model, objective, token, cost,
-            self.lighthouse_address, validator, validator_fee,
-            deadline, nonce, self.address, self.private_key,
-        )
-        offer = signer.build_offer(
-            model, objective, token, cost,
-            validator, self.lighthouse_address, lighthouse_fee,
-            deadline, nonce + 1, self.address, self.private_key,
-        )
 
-        self._wait_for_timeout()
+        # Reserved nonces that end up unused (factory or account) leave the tracked
+        # values ahead of the chain: resync on any failure
+        try:
+            nonce = self._reserve_factory_nonces(1)
+            demand = signer.build_demand(
+                model, objective, token, cost,
+                self.lighthouse_address, validator, validator_fee,
+                deadline, nonce, self.address, self.private_key,
+            )
+            offer = signer.build_offer(
+                model, objective, token, cost,
+                validator, self.lighthouse_address, lighthouse_fee,
+                deadline, nonce + 1, self.address, self.private_key,
+            )
 
-        receipt = self._send_tx(
-            self.lighthouse.functions.createLiability(demand, offer),
-            gas=1_500_000,
-        )
+            self._wait_for_timeout(snapshot)
 
-        logs = self.factory.events.NewLiability().process_receipt(receipt)
-        if not logs:
-            raise RuntimeError(f"createLiability succeeded but no NewLiability event. Hash: {receipt['transactionHash'].hex()}")
+            # One nonce read for both txs
+            eth_nonce = self._reserve_nonces(2)
+            receipt = self._send_tx(
+                self.lighthouse.functions.createLiability(demand, offer),
+                eth_nonce, gas=1_500_000,
+            )
 
-        liability_address = logs[0]["args"]["liability"]
+            liability_address, _ = self._scan_logs(receipt)
+            if not liability_address:
+                raise RuntimeError(f"createLiability succeeded but no NewLiability event. Hash: {receipt['transactionHash'].hex()}")
 
-        result_sig = signer.build_result(
-            liability_address, result_data, True, self.private_key,
-        )
+            result_sig = signer.build_result(
+                liability_address, result_data, True, self.private_key,
+            )
 
-        receipt2 = self._send_tx(
-            self.lighthouse.functions.finalizeLiability(
-                liability_address, result_data, True, result_sig,
-            ),
-            gas=400_000,
-        )
+            receipt2 = self._send_tx(
+                self.lighthouse.functions.finalizeLiability(
+                    liability_address, result_data, True, result_sig,
+                ),
+                eth_nonce + 1, gas=400_000,
+            )
+        except Exception:
+            self._resync_nonce()
+            raise
 
-        xrt_minted = 0
-        for log in receipt2["logs"]:
-            if (log["address"].lower() == self.xrt.address.lower()
-                    and len(log["topics"]) >= 3
-                    and log["topics"][0].hex() == TRANSFER_TOPIC):
-                xrt_minted = int(log["data"].hex(), 16)
-                break
+        # finalizeLiability mints once, XRT.mint(tx.origin, wnFromGas(gas))
+        xrt_minted = self._scan_logs(receipt2)[1]
 
         gas_used = receipt["gasUsed"] + receipt2["gasUsed"]
         click_echo(
@@ -790,22 +1387,39 @@ class XRTMiner:
 
     def mine_loop(self, count: int | None = None, model: bytes | None = None,
                   objective: bytes | None = None, min_margin: float = 0.0,
-                  force: bool = False):
-        """Continuous single mining. count=None → infinite."""
+                  force: bool = False, batch_read: bool = False):
+        """Continuous single mining. count=None → infinite.
+        batch_read: take the profitability, block and quota inputs from one preflight() Multicall3 read."""
         i = 0
         total_minted = 0
+        wait = UNPROFITABLE_WAIT_SECONDS
+        last_margin = None
         try:
             while count is None or i < count:
+                snapshot = None
                 if not force:
-                    prof = self.check_profitability()
+                    if batch_read:
+                        snapshot = self.preflight()
+                        prof = self.check_profitability(
+                            gas_price=snapshot["gas_price"], xrt_minted=snapshot["xrt_minted"],
+                        )
+                    else:
+                        prof = self.check_profitability()
                     if not prof["profitable"] or prof["margin"] < min_margin:
+                        # Back off while the market drifts away, check again soon once it turns
+                        if last_margin is not None and prof["margin"] > last_margin:
+                            wait = UNPROFITABLE_WAIT_SECONDS
                         click_echo(
-                            f"Unprofitable: margin={prof['margin']:.1f}%. Waiting 60s..."
+                            f"Unprofitable: margin={prof['margin']:.1f}%. Waiting {wait}s..."
                         )
-                        time.sleep(60)
+                        time.sleep(wait)
+                        last_margin = prof["margin"]
+                        wait = min(wait * 2, UNPROFITABLE_WAIT_MAX_SECONDS)
                         continue
+                    wait = UNPROFITABLE_WAIT_SECONDS
+                    last_margin = None
                 try:
-                    _, minted = self.mine_once(model, objective)
+                    _, minted = self.mine_once(model, objective, snapshot)
                     total_minted += minted
                     i += 1
                     click_echo(f"[{i}] total: {total_minted/1e9:.2f} XRT")
@@ -816,34 +1430,77 @@ class XRTMiner:
             click_echo(f"\nStopped. {i} liabilities, {total_minted/1e9:.2f} XRT")
 
     def status(self) -> dict:
-        """Return status info."""
+        """Return status info. The contract views and the ETH balance (Multicall3
+        getEthBalance) go out as one aggregate eth_call, in parallel with eth_gasPrice;
+        as separate parallel eth_calls if the aggregate fails."""
+        lighthouse = self.lighthouse
+        factory = self.factory.address
+        calls = [
+            (contract_abi.MULTICALL3_ADDRESS, contracts.multicall_getEthBalance_data(self.address), ("uint256",)),
+            (self.xrt.address, contracts.xrt_balanceOf_data(self.address), ("uint256",)),
+            (factory, contracts.factory_gasPrice_data(), ("uint256",)),
+            (factory, contracts.factory_totalGasConsumed_data(), ("uint256",)),
+            (factory, contracts.factory_wnFromGas_data(ESTIMATED_GAS_PER_CYCLE), ("uint256",)),
+        ]
+        if lighthouse:
+            calls += [
+                (lighthouse.address, contracts.lighthouse_minimalStake_data(), ("uint256",)),
+                (lighthouse.address, contracts.lighthouse_timeoutInBlocks_data(), ("uint256",)),
+                (lighthouse.address, contracts.lighthouse_stakes_data(self.address), ("uint256",)),
+                (lighthouse.address, contracts.lighthouse_indexOf_data(self.address), ("uint256",)),
+                (lighthouse.address, contracts.lighthouse_marker_data(), ("uint256",)),
+                (lighthouse.address, contracts.lighthouse_quota_data(), ("uint256",)),
+                (lighthouse.address, contracts.lighthouse_keepAliveBlock_data(), ("uint256",)),
+                (factory, contracts.factory_isLighthouse_data(self.lighthouse_address), ("bool",)),
+            ]
+        try:
+            gas_price, results = self._read_concurrently([
+                lambda: self.w3.eth.gas_price, lambda: self.read_multicall(calls),
+            ])
+        except Exception:
+            gas_price, *results = self._read_concurrently([
+                lambda: self.w3.eth.gas_price,
+                lambda: self.w3.eth.get_balance(self.address),
+                *(partial(self._read_view, *call) for call in calls[1:]),
+            ])
+
+        (eth_balance, xrt_balance, factory_gas_price,
+         total_gas_consumed, xrt_per_cycle) = results[:5]
         info = {
             "address": self.address,
             "xrt_address": self.xrt.address,
-            "xrt_balance": self.xrt.functions.balanceOf(self.address).call(),
-            "eth_balance": self.w3.eth.get_balance(self.address),
+            "xrt_balance": xrt_balance,
+            "eth_balance": eth_balance,
             "factory": self.factory.address,
-            "factory_gas_price": self.factory.functions.gasPrice().call(),
-            "total_gas_consumed": self.factory.functions.totalGasConsumed().call(),
+            "factory_gas_price": factory_gas_price,
+            "total_gas_consumed": total_gas_consumed,
         }
 
-        info["estimated_xrt_per_cycle"] = self.factory.functions.wnFromGas(ESTIMATED_GAS_PER_CYCLE).call()
-        info["profitability"] = self.check_profitability()
+        info["estimated_xrt_per_cycle"] = xrt_per_cycle
+        info["profitability"] = self.check_profitability(
+            gas_price=gas_price, xrt_minted=xrt_per_cycle,
+        )
 
-        if self.lighthouse:
+        if lighthouse:
             info["lighthouse"] = self.lighthouse_address
-            info["minimal_stake"] = self.lighthouse.functions.minimalStake().call()
-            info["timeout_blocks"] = self.lighthouse.functions.timeoutInBlocks().call()
-            info["my_stake"] = self.lighthouse.functions.stakes(self.address).call()
-            info["my_index"] = self.lighthouse.functions.indexOf(self.address).call()
-            info["marker"] = self.lighthouse.functions.marker().call()
-            info["quota"] = self.lighthouse.functions.quota().call()
-            info["keep_alive_block"] = self.lighthouse.functions.keepAliveBlock().call()
-            info["is_lighthouse"] = self.factory.functions.isLighthouse(self.lighthouse_address).call()
+            (info["minimal_stake"], info["timeout_blocks"], info["my_stake"],
+             info["my_index"], info["marker"], info["quota"],
+             info["keep_alive_block"], info["is_lighthouse"]) = results[5:]
 
         return info
 
 
+def _random_fields(count: int) -> list[bytes]:
+    """count random RANDOM_FIELD_BYTES-long payloads from a single os.urandom call."""
+    buf = os.urandom(RANDOM_FIELD_BYTES * count)
+    return [buf[i:i + RANDOM_FIELD_BYTES] for i in range(0, len(buf), RANDOM_FIELD_BYTES)]
+
+
+def _has_values(snapshot: dict | None, *keys: str) -> bool:
+    """True if snapshot holds a (successfully read) value for every key."""
+    return snapshot is not None and all(snapshot.get(key) is not None for key in keys)
+
+
 def click_echo(msg: str):
     import click
     click.echo(msg)
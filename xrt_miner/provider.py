@@ -0,0 +1,47 @@
+"""HTTP JSON-RPC provider that uses orjson for request/response JSON when installed."""
+
+from web3 import HTTPProvider
+from web3._utils.encoding import Web3JsonEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson is optional (pip install xrt-classic-miner[fast])
+    orjson = None
+
+# bytes/HexBytes, AttributeDict and pydantic models, exactly as web3 encodes them
+_web3_default = Web3JsonEncoder().default
+
+
+class OrjsonHTTPProvider(HTTPProvider):
+    """HTTPProvider with orjson request encoding and response decoding.
+
+    Falls back to web3's stdlib json whenever orjson refuses a payload
+    (e.g. integers wider than 64 bits). Ethereum JSON-RPC sends quantities
+    as hex strings, so orjson's float decoding of huge bare integers does
+    not come into play.
+    """
+
+    def encode_rpc_request(self, method, params) -> bytes:
+        rpc_dict = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        }
+        try:
+            return orjson.dumps(rpc_dict, default=_web3_default)
+        except TypeError:  # orjson.JSONEncodeError
+            return super().encode_rpc_request(method, params)
+
+    @staticmethod
+    def decode_rpc_response(raw_response: bytes):
+        try:
+            return orjson.loads(raw_response)
+        except ValueError:  # orjson.JSONDecodeError
+            return HTTPProvider.decode_rpc_response(raw_response)
+
+
+def http_provider(endpoint_uri: str, **kwargs) -> HTTPProvider:
+    """OrjsonHTTPProvider when orjson is importable, plain HTTPProvider otherwise."""
+    cls = OrjsonHTTPProvider if orjson is not None else HTTPProvider
+    return cls(endpoint_uri, **kwargs)
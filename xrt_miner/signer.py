@@ -1,15 +1,80 @@
 """Demand/offer/result message encoding & signing for Robonomics v1.0 (v5)."""
 
-from eth_abi import encode
-from eth_account import Account
-from eth_account.messages import encode_defunct
+from functools import lru_cache
+
+from eth_keys import keys
 from web3 import Web3
 
+try:
+    import coincurve
+except ImportError:  # coincurve is optional (pip install xrt-classic-miner[fast])
+    coincurve = None
+
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
 
+@lru_cache(maxsize=64)
 def _addr_bytes(addr: str) -> bytes:
-    return bytes.fromhex(addr[2:].lower().zfill(40))
+    # fromhex takes either case; token/lighthouse/sender repeat on every message
+    raw = bytes.fromhex(addr[2:])
+    if len(raw) != 20:
+        raise ValueError(f"Not a 20-byte address: {addr}")
+    return raw
+
+
+@lru_cache(maxsize=64)
+def _uint256(value: int) -> bytes:
+    # cost, fees and deadline repeat across a batch; nonces are unique and skip this
+    return value.to_bytes(32, "big")
+
+
+@lru_cache(maxsize=64)
+def _abi_address(addr: str) -> bytes:
+    return bytes(12) + _addr_bytes(addr)
+
+
+def _abi_bytes(value: bytes) -> bytes:
+    """ABI tail of a dynamic bytes value: length word, data zero-padded to 32 bytes."""
+    return len(value).to_bytes(32, "big") + value + bytes(-len(value) % 32)
+
+
+# Head of the demand/offer tuple: 10 words, tails of the three bytes fields follow
+_MESSAGE_HEAD_SIZE = 10 * 32
+
+
+def _encode_message(
+    model: bytes,
+    objective: bytes,
+    token: str,
+    cost: int,
+    first: str,
+    second: str,
+    fee: int,
+    deadline: int,
+    sender: str,
+    signature: bytes,
+) -> bytes:
+    """abi.encode(bytes, bytes, address, uint256, address, address, uint256, uint256,
+    address, bytes), written out for this one layout: eth_abi's generic encoder
+    validates and dispatches per field and costs about as much as the signature."""
+    model_tail = _abi_bytes(model)
+    objective_tail = _abi_bytes(objective)
+    objective_offset = _MESSAGE_HEAD_SIZE + len(model_tail)
+    return b"".join((
+        _uint256(_MESSAGE_HEAD_SIZE),
+        _uint256(objective_offset),
+        _abi_address(token),
+        _uint256(cost),
+        _abi_address(first),
+        _abi_address(second),
+        _uint256(fee),
+        _uint256(deadline),
+        _abi_address(sender),
+        _uint256(objective_offset + len(objective_tail)),
+        model_tail,
+        objective_tail,
+        _abi_bytes(signature),
+    ))
 
 
 def _encode_packed_demand(
@@ -25,18 +90,18 @@ def _encode_packed_demand(
     sender: str,
 ) -> bytes:
     """encodePacked for demand hash (v1.0 format with nonce and sender)."""
-    return (
-        model
-        + objective
-        + _addr_bytes(token)
-        + cost.to_bytes(32, "big")
-        + _addr_bytes(lighthouse)
-        + _addr_bytes(validator)
-        + validator_fee.to_bytes(32, "big")
-        + deadline.to_bytes(32, "big")
-        + nonce.to_bytes(32, "big")
-        + _addr_bytes(sender)
-    )
+    return b"".join((
+        model,
+        objective,
+        _addr_bytes(token),
+        _uint256(cost),
+        _addr_bytes(lighthouse),
+        _addr_bytes(validator),
+        _uint256(validator_fee),
+        _uint256(deadline),
+        nonce.to_bytes(32, "big"),
+        _addr_bytes(sender),
+    ))
 
 
 def _encode_packed_offer(
@@ -52,18 +117,18 @@ def _encode_packed_offer(
     sender: str,
 ) -> bytes:
     """encodePacked for offer hash (validator before lighthouse). v1.0 format."""
-    return (
-        model
-        + objective
-        + _addr_bytes(token)
-        + cost.to_bytes(32, "big")
-        + _addr_bytes(validator)
-        + _addr_bytes(lighthouse)
-        + lighthouse_fee.to_bytes(32, "big")
-        + deadline.to_bytes(32, "big")
-        + nonce.to_bytes(32, "big")
-        + _addr_bytes(sender)
-    )
+    return b"".join((
+        model,
+        objective,
+        _addr_bytes(token),
+        _uint256(cost),
+        _addr_bytes(validator),
+        _addr_bytes(lighthouse),
+        _uint256(lighthouse_fee),
+        _uint256(deadline),
+        nonce.to_bytes(32, "big"),
+        _addr_bytes(sender),
+    ))
 
 
 def _encode_packed_result(
@@ -72,19 +137,39 @@ def _encode_packed_result(
     success: bool,
 ) -> bytes:
     """encodePacked for result hash."""
-    return (
-        _addr_bytes(liability)
-        + result
-        + (b"\x01" if success else b"\x00")
-    )
+    return b"".join((
+        _addr_bytes(liability),
+        result,
+        b"\x01" if success else b"\x00",
+    ))
+
+
+_EIP191_PREFIX = b"\x19Ethereum Signed Message:\n32"
+
+
+@lru_cache(maxsize=8)
+def _coincurve_key(private_key: str):
+    return coincurve.PrivateKey(bytes.fromhex(private_key.removeprefix("0x")))
+
+
+@lru_cache(maxsize=8)
+def _eth_key(private_key: str):
+    return keys.PrivateKey(bytes.fromhex(private_key.removeprefix("0x")))
 
 
 def _sign_hash(msg_bytes: bytes, private_key: str) -> bytes:
-    """keccak256 + EIP-191 sign."""
-    msg_hash = Web3.keccak(msg_bytes)
-    signable = encode_defunct(primitive=msg_hash)
-    signed = Account.sign_message(signable, private_key=private_key)
-    return signed.signature
+    """keccak256 + EIP-191 sign.
+
+    Hashes the fixed 32-byte-message prefix directly and signs with a key parsed
+    once: through libsecp256k1 with coincurve installed, eth_keys otherwise.
+    RFC 6979 makes either signature identical to eth_account's sign_message.
+    """
+    digest = Web3.keccak(_EIP191_PREFIX + Web3.keccak(msg_bytes))
+    if coincurve is not None:
+        signature = _coincurve_key(private_key).sign_recoverable(digest, hasher=None)
+        return signature[:64] + bytes((signature[64] + 27,))
+    signature = _eth_key(private_key).sign_msg_hash(digest)
+    return signature.to_bytes()[:64] + bytes((signature.v + 27,))
 
 
 def build_demand(
@@ -112,19 +197,9 @@ def build_demand(
         ),
         private_key,
     )
-    return encode(
-        [
-            "bytes", "bytes", "address", "uint256",
-            "address", "address", "uint256", "uint256",
-            "address", "bytes",
-        ],
-        [
-            model, objective, Web3.to_checksum_address(token), cost,
-            Web3.to_checksum_address(lighthouse),
-            Web3.to_checksum_address(validator),
-            validator_fee, deadline,
-            Web3.to_checksum_address(sender), signature,
-        ],
+    return _encode_message(
+        model, objective, token, cost, lighthouse, validator,
+        validator_fee, deadline, sender, signature,
     )
 
 
@@ -153,19 +228,9 @@ def build_offer(
         ),
         private_key,
     )
-    return encode(
-        [
-            "bytes", "bytes", "address", "uint256",
-            "address", "address", "uint256", "uint256",
-            "address", "bytes",
-        ],
-        [
-            model, objective, Web3.to_checksum_address(token), cost,
-            Web3.to_checksum_address(validator),
-            Web3.to_checksum_address(lighthouse),
-            lighthouse_fee, deadline,
-            Web3.to_checksum_address(sender), signature,
-        ],
+    return _encode_message(
+        model, objective, token, cost, validator, lighthouse,
+        lighthouse_fee, deadline, sender, signature,
     )
 
 